@@ -0,0 +1,76 @@
+import argparse
+import os
+import tracemalloc
+
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.InterpreterModule.Value import Value
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares memory allocated by execution engines on a Tutel script")
+    arg_parser.add_argument(
+        "-f",
+        "--filename",
+        default=os.path.join(EXAMPLES_DIR, "sierpinski.tut"),
+        help="Script to execute",
+    )
+    return arg_parser
+
+
+class ValueCounter:
+    """Counts Value objects created while active."""
+
+    def __init__(self):
+        self.count = 0
+        self._init = Value.__init__
+
+    def __enter__(self):
+        init = self._init
+
+        def counting_init(value_obj, value):
+            self.count += 1
+            init(value_obj, value)
+
+        Value.__init__ = counting_init
+        return self
+
+    def __exit__(self, *_):
+        Value.__init__ = self._init
+
+
+def benchmark(interpreter_class, code: str) -> tuple[int, int]:
+    """Returns peak traced memory in bytes and number of Value objects created during a single run."""
+    program = Parser().parse(Lexer(code))
+    interpreter = interpreter_class()
+    # Warm up, so compilation and caches are not measured
+    Turtle.id = Turtle.default_id
+    interpreter.execute(program, "main")
+    Turtle.id = Turtle.default_id
+    with ValueCounter() as counter:
+        tracemalloc.start()
+        interpreter.execute(program, "main")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak, counter.count
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    with open(args.filename, "r") as file:
+        code = file.read()
+
+    print(f"{'engine':<10} {'peak KiB':>10} {'Values':>10}")
+    # Scripts which are not debugged run on the release visitor by default
+    engines = [("release", release_interpreter_mapper["visitor"])] + list(interpreter_mapper.items())
+    for engine, interpreter_class in engines:
+        peak, values = benchmark(interpreter_class, code)
+        print(f"{engine:<10} {peak / 1024:>10.1f} {values:>10}")
+
+
+if __name__ == '__main__':
+    main()
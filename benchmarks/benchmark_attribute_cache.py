@@ -0,0 +1,92 @@
+import argparse
+import time
+
+from Tutel.core.InterpreterModule.AttributeCache import AttributeCache
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.InterpreterModule.Value import Value
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper
+
+# Attribute reads and method calls in a loop, turtle is drawn to the mock GUI
+ATTRIBUTES = """
+main(){{
+    t = Turtle();
+    l = [];
+    for(i in range({size})){{
+        t.forward(1);
+        t.turn_left();
+        o = t.orientation;
+        l.append(o);
+    }}
+}}
+"""
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares attribute reads through inline caches with getattr")
+    arg_parser.add_argument(
+        "-s",
+        "--size",
+        default=20000,
+        type=int,
+        help="Number of loop iterations",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=5,
+        type=int,
+        help="Number of timed runs, the best one is reported",
+    )
+    return arg_parser
+
+
+def best_time(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def reads(size: int, repeat: int) -> None:
+    turtle = Value(Turtle())
+    items = Value([])
+    orientation = AttributeCache("orientation")
+    append = AttributeCache("append")
+
+    def read_getattr():
+        for _ in range(size):
+            getattr(turtle, "orientation")
+            getattr(items, "append")(1)
+            items.value.clear()
+
+    def read_cached():
+        for _ in range(size):
+            orientation.get(turtle)
+            function, owner = append.get_method(items)
+            function(owner, 1)
+            items.value.clear()
+
+    getattr_time = best_time(read_getattr, repeat)
+    cached_time = best_time(read_cached, repeat)
+    print(f"{'reads':<10} {getattr_time * 1000:9.2f} ms {cached_time * 1000:9.2f} ms {getattr_time / cached_time:6.2f}x")
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    print(f"{'':<10} {'getattr':>12} {'cached':>12} {'gain':>7}")
+    reads(args.size, args.repeat)
+    code = ATTRIBUTES.format(size=args.size)
+    program = Parser().parse(Lexer(code))
+    engines = list(interpreter_mapper.items()) + [("release", release_interpreter_mapper["visitor"])]
+    print(f"\n{'engine':<10} {'time':>12}")
+    for engine, interpreter_class in engines:
+        interpreter = interpreter_class()
+        print(f"{engine:<10} {best_time(lambda: interpreter.execute(program, 'main'), args.repeat) * 1000:9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
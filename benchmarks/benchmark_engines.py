@@ -0,0 +1,96 @@
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import time
+
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+# Frames added below the script between rounds, ten rounds go through a whole 16 KiB chunk of CPython frame stack
+DEPTH_STEP = 11
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares execution engines on a Tutel script")
+    arg_parser.add_argument(
+        "-f",
+        "--filename",
+        default=os.path.join(EXAMPLES_DIR, "sierpinski.tut"),
+        help="Script to execute",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=10,
+        type=int,
+        help="Number of rounds running every engine once, the best run of an engine is reported",
+    )
+    arg_parser.add_argument(
+        "--engine",
+        default=None,
+        help=argparse.SUPPRESS,
+    )
+    arg_parser.add_argument(
+        "--depth",
+        default=0,
+        type=int,
+        help=argparse.SUPPRESS,
+    )
+    return arg_parser
+
+
+def benchmark(interpreter_class, program, repeat: int) -> float:
+    interpreter = interpreter_class()
+    best = float("inf")
+    for _ in range(repeat):
+        Turtle.id = Turtle.default_id
+        gc.collect()
+        start = time.perf_counter()
+        interpreter.execute(program, "main")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def at_depth(depth: int, function, *args):
+    if depth:
+        return at_depth(depth - 1, function, *args)
+    return function(*args)
+
+
+def run_in_process(filename: str, engine: str, depth: int) -> float:
+    output = subprocess.run([sys.executable, __file__, "-f", filename, "--engine", engine, "--depth", str(depth)],
+                            capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    engines = {engine: interpreter_class for engine, interpreter_class in interpreter_mapper.items()}
+    engines.update({f"{engine} (release)": interpreter_class
+                    for engine, interpreter_class in release_interpreter_mapper.items()})
+    if args.engine is not None:
+        with open(args.filename, "r") as file:
+            program = Parser().parse(Lexer(file.read()))
+        print(at_depth(args.depth, benchmark, engines[args.engine], program, 1))
+        return
+
+    results = {engine: float("inf") for engine in engines}
+    # Every run starts a fresh process and engines take turns, so neither the state left by an engine
+    # nor a slowdown of the machine favours the ones run later.
+    # CPython frees a chunk of its frame stack when the first frame in it returns, a recursive script may allocate
+    # it again on every call at one stack depth and not at another, so every round starts deeper
+    for round_ in range(args.repeat):
+        for engine in engines:
+            results[engine] = min(results[engine], run_in_process(args.filename, engine, round_ * DEPTH_STEP))
+    baseline = results["visitor"]
+    for engine, result in results.items():
+        print(f"{engine:<20} {result * 1000:10.2f} ms {baseline / result:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
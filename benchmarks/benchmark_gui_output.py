@@ -0,0 +1,78 @@
+import argparse
+import os
+import tempfile
+import time
+
+from Tutel.core import GuiModule
+from Tutel.core.GuiModule.CommandSink import CommandSink
+from Tutel.core.GuiModule.GuiVsCode import GuiVsCode
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import release_interpreter_mapper
+
+SIERPINSKI = os.path.join(os.path.dirname(__file__), "..", "examples", "sierpinski.tut")
+
+
+class ReopeningSink:
+    """Writes every command on its own, reopening the file each time."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def write(self, command: str) -> None:
+        with open(self.path, "a") as file:
+            file.write(command)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares ways of writing GUI commands of a drawing to a file")
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=3,
+        type=int,
+        help="Number of timed runs per sink, the best one is reported",
+    )
+    return arg_parser
+
+
+def benchmark(program, path: str, create_sink, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        open(path, "w").close()
+        GuiModule.GUI = GuiVsCode(create_sink())
+        start = time.perf_counter()
+        release_interpreter_mapper["visitor"]().execute(program, "main")
+        GuiModule.GUI.close()
+        best = min(best, time.perf_counter() - start)
+    with open(path) as file:
+        lines = sum(1 for _ in file)
+    return best, lines
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    with open(SIERPINSKI) as file:
+        program = Parser().parse(Lexer(file.read()))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gui.out")
+        sinks = {
+            "reopening": lambda: ReopeningSink(path),
+            "unbuffered": lambda: CommandSink(buffer_size=0, path=path),
+            "buffered": lambda: CommandSink(path=path),
+            "batched": lambda: CommandSink(batch=True, path=path),
+        }
+        print(f"{'sink':<12} {'time':>12} {'lines':>8}")
+        for name, create_sink in sinks.items():
+            best, lines = benchmark(program, path, create_sink, args.repeat)
+            print(f"{name:<12} {best * 1000:9.2f} ms {lines:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import time
+
+from Tutel.core.InterpreterModule.Memoizer import Memoizer
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper, memoizing_engines
+
+# Palette computed for every step of a drawing, only a few distinct colors are computed
+PALETTE = """
+main(){{
+    total = 0;
+    for(i in range({steps})){{
+        total += shade(i % 16, 16);
+    }}
+    x = fib({fib});
+}}
+shade(step, steps){{
+    level = 0;
+    for(k in range(step)){{
+        level += 255 // steps;
+    }}
+    return min(level, 255);
+}}
+fib(n){{
+    if(n < 2){{
+        return n + 0;
+    }}
+    a = fib(n - 1);
+    b = fib(n - 2);
+    return a + b;
+}}
+"""
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares runs with and without memoization of pure functions")
+    arg_parser.add_argument(
+        "-s",
+        "--steps",
+        default=20000,
+        type=int,
+        help="Number of palette lookups",
+    )
+    arg_parser.add_argument(
+        "-f",
+        "--fib",
+        default=18,
+        type=int,
+        help="Fibonacci number computed by naive recursion",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=5,
+        type=int,
+        help="Number of timed runs per engine, the best one is reported",
+    )
+    return arg_parser
+
+
+def benchmark(interpreter_class, code: str, repeat: int, memoize: bool) -> float:
+    program = Parser().parse(Lexer(code))
+    best = float("inf")
+    for _ in range(repeat):
+        interpreter = interpreter_class(memoizer=Memoizer() if memoize else None)
+        start = time.perf_counter()
+        interpreter.execute(program, "main")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    code = PALETTE.format(steps=args.steps, fib=args.fib)
+    engines = [(engine, interpreter_class) for engine, interpreter_class in interpreter_mapper.items()
+               if engine in memoizing_engines] + [("release", release_interpreter_mapper["visitor"])]
+    print(f"{'engine':<10} {'plain':>12} {'memoized':>12} {'gain':>7}")
+    for engine, interpreter_class in engines:
+        plain_time = benchmark(interpreter_class, code, args.repeat, memoize=False)
+        memoized_time = benchmark(interpreter_class, code, args.repeat, memoize=True)
+        print(f"{engine:<10} {plain_time * 1000:9.2f} ms {memoized_time * 1000:9.2f} ms {plain_time / memoized_time:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
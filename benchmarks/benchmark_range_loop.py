@@ -0,0 +1,74 @@
+import argparse
+import time
+
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper
+
+# Loops over a range, which are run as counted loops
+RANGE_LOOP = """
+main(){{
+    xs = range({size});
+    for(k in range({repeat})){{
+        for(i in xs){{
+            a = i;
+        }}
+    }}
+}}
+"""
+
+# The same loops over a list, which is iterated element by element, building it takes a small part of the time
+LIST_LOOP = RANGE_LOOP.replace("xs = range({size});", "xs = [];\n    for(i in range({size})){{xs.append(i);}}")
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares loops over a range with loops over a list")
+    arg_parser.add_argument(
+        "-s",
+        "--size",
+        default=1000,
+        type=int,
+        help="Number of iterations of the inner loop",
+    )
+    arg_parser.add_argument(
+        "-l",
+        "--loops",
+        default=100,
+        type=int,
+        help="Number of times the inner loop is run",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=5,
+        type=int,
+        help="Number of timed runs per engine, the best one is reported",
+    )
+    return arg_parser
+
+
+def benchmark(interpreter_class, code: str, repeat: int) -> float:
+    program = Parser().parse(Lexer(code))
+    interpreter = interpreter_class()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        interpreter.execute(program, "main")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    range_loop = RANGE_LOOP.format(size=args.size, repeat=args.loops)
+    list_loop = LIST_LOOP.format(size=args.size, repeat=args.loops)
+    engines = list(interpreter_mapper.items()) + [("release", release_interpreter_mapper["visitor"])]
+    print(f"{'engine':<10} {'list':>12} {'range':>12} {'gain':>7}")
+    for engine, interpreter_class in engines:
+        list_time = benchmark(interpreter_class, list_loop, args.repeat)
+        range_time = benchmark(interpreter_class, range_loop, args.repeat)
+        print(f"{engine:<10} {list_time * 1000:9.2f} ms {range_time * 1000:9.2f} ms {list_time / range_time:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
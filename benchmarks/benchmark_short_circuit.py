@@ -0,0 +1,74 @@
+import argparse
+import time
+
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelRunner import interpreter_mapper
+
+# Guard which is false for most elements, so its right operand doesn't have to be evaluated
+GUARDED = """
+main(){{
+    xs = range({size});
+    count = 0;
+    for(i in xs){{
+        if(i % 10 == 0 and expensive(i)){{
+            count += 1;
+        }}
+    }}
+}}
+expensive(x){{
+    s = 0;
+    for(j in range(20)){{
+        s += j;
+    }}
+    return s > x;
+}}
+"""
+
+# The same loop with the right operand evaluated every time
+EAGER = GUARDED.replace("if(i % 10 == 0 and expensive(i)){{", "e = expensive(i);\n        if(i % 10 == 0 and e){{")
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Measures gain of short-circuit evaluation on a guard-heavy loop")
+    arg_parser.add_argument(
+        "-s",
+        "--size",
+        default=2000,
+        type=int,
+        help="Number of loop iterations",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=3,
+        type=int,
+        help="Number of timed runs per engine, the best one is reported",
+    )
+    return arg_parser
+
+
+def benchmark(interpreter_class, code: str, repeat: int) -> float:
+    program = Parser().parse(Lexer(code))
+    interpreter = interpreter_class()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        interpreter.execute(program, "main")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    guarded = GUARDED.format(size=args.size)
+    eager = EAGER.format(size=args.size)
+    print(f"{'engine':<10} {'eager':>12} {'guarded':>12} {'gain':>7}")
+    for engine, interpreter_class in interpreter_mapper.items():
+        eager_time = benchmark(interpreter_class, eager, args.repeat)
+        guarded_time = benchmark(interpreter_class, guarded, args.repeat)
+        print(f"{engine:<10} {eager_time * 1000:9.2f} ms {guarded_time * 1000:9.2f} ms {eager_time / guarded_time:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import math
+import time
+
+from Tutel.core import GuiModule
+from Tutel.core.GuiModule.GuiInterface import GuiInterface
+from Tutel.core.InterpreterModule.Turtle.Position import Position
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+
+
+class ComputingTurtle(Turtle):
+    """Turtle computing sine and cosine of its orientation on every move."""
+
+    def forward(self, a: int):
+        new_position = Position(
+            x=self.position.x + math.sin((self.orientation / 360) * 2 * math.pi) * a,
+            y=self.position.y + math.cos((self.orientation / 360) * 2 * math.pi) * a
+        )
+        if GuiModule.GUI.go_forward(self.id, new_position) or type(GuiModule.GUI) == GuiInterface:
+            self.position = new_position
+
+
+def get_arg_parser():
+    arg_parser = argparse.ArgumentParser(description="Compares Turtle.forward with and without the direction table")
+    arg_parser.add_argument(
+        "-n",
+        "--moves",
+        default=1_000_000,
+        type=int,
+        help="Number of forward calls",
+    )
+    arg_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=3,
+        type=int,
+        help="Number of timed runs per turtle, the best one is reported",
+    )
+    return arg_parser
+
+
+def benchmark(turtle_class, moves: int, repeat: int) -> tuple[float, Position]:
+    best = float("inf")
+    turtle = None
+    for _ in range(repeat):
+        turtle = turtle_class()
+        forward = turtle.forward
+        start = time.perf_counter()
+        for move in range(moves):
+            if move % 1000 == 0:
+                turtle.set_orientation(move // 1000 * 7)
+            forward(3)
+        best = min(best, time.perf_counter() - start)
+    return best, turtle.position
+
+
+def main():
+    args = get_arg_parser().parse_args()
+    GuiModule.GUI = GuiInterface()
+    print(f"{'turtle':<10} {'time':>12}  final position")
+    computed_time, computed_position = benchmark(ComputingTurtle, args.moves, args.repeat)
+    print(f"{'computed':<10} {computed_time * 1000:9.2f} ms  {computed_position}")
+    table_time, table_position = benchmark(Turtle, args.moves, args.repeat)
+    print(f"{'table':<10} {table_time * 1000:9.2f} ms  {table_position}")
+    print(f"gain: {computed_time / table_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -432,6 +432,7 @@ class MismatchedArgsCountException(InterpreterException):
         self.fun_name = fun_name
         self.expected_min = expected_min
         self.expected_max = expected_max
+        self.expected_number = None
         if self.expected_min is not None and self.expected_max is not None:
             if self.expected_min == self.expected_max:
                 self.expected_number = self.expected_min
@@ -447,6 +448,9 @@ class MismatchedArgsCountException(InterpreterException):
         elif self.expected_number is not None and self.got_number is not None:
             msg = f"{self.base_msg}" \
                   f"{self.fun_name}() takes {self.expected_number} arguments but {self.got_number} were given"
+        elif self.expected_min is not None and self.got_number is not None:
+            msg = f"{self.base_msg}" \
+                  f"{self.fun_name}() takes at least {self.expected_min} arguments but {self.got_number} were given"
         else:
             msg = f"{self.base_msg}" \
                   f"{self.fun_name}() got wrong number of arguments"
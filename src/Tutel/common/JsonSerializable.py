@@ -1,3 +1,5 @@
 class JsonSerializable:
+    __slots__ = ()
+
     def to_json(self):
         return self.__dict__
@@ -1,34 +1,89 @@
-from typing import TextIO
+import codecs
+from mmap import mmap
+from typing import TextIO, BinaryIO
+
+ETX = '\x03'
+BLOCK_SIZE = 64 * 1024
+
+SourceType = TextIO | BinaryIO | str | bytes | bytearray | memoryview | mmap
 
 
 class Source:
-    def __init__(self, source: TextIO):
+    def __init__(self, source: SourceType, block_size: int = BLOCK_SIZE, encoding: str = "utf-8"):
         self.source = source
         self.line = 1
         self.column = 0
-        self.next = self.source.read(1)
         self.char = ""
+        self._block_size = max(block_size, 1)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._position = 0
+        self._offset = 0
+        self._exhausted = False
+        self._view = None
+        if isinstance(source, str):
+            # Walk the string in place, there is nothing to read
+            self._buffer = source
+            self._exhausted = True
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap)):
+            self._view = memoryview(source)
         self.get_next_char()
 
     def get_next_char(self):
         if self.char == '\n':
-            if self.next == '\r':
-                self._get_next()
-                self.char = '\n'
+            if self._peek() == '\r':
+                self._position += 1
             self.line += 1
             self.column = 1
         elif self.char == '\r':
-            if self.next == '\n':
-                self._get_next()
+            if self._peek() == '\n':
+                self._position += 1
             self.line += 1
             self.column = 1
         else:
             self.column += 1
-        self._get_next()
-
-    def _get_next(self):
-        if self.next == '':
-            self.char = '\x03'
+        if self._position < len(self._buffer) or self._fill():
+            self.char = self._buffer[self._position]
+            self._position += 1
         else:
-            self.char = self.next
-            self.next = self.source.read(1)
+            self.char = ETX
+
+    @property
+    def next(self) -> str:
+        return self._peek()
+
+    def _peek(self) -> str:
+        if self._position < len(self._buffer) or self._fill():
+            return self._buffer[self._position]
+        return ""
+
+    def _fill(self) -> bool:
+        while not self._exhausted:
+            if self._view is not None:
+                raw = self._view[self._offset:self._offset + self._block_size]
+                self._offset += len(raw)
+                self._exhausted = self._offset >= len(self._view)
+                chunk = self._decoder.decode(raw, final=self._exhausted)
+                if self._exhausted:
+                    self._view.release()
+            else:
+                chunk = self.source.read(self._block_size)
+                self._exhausted = not chunk
+                if not isinstance(chunk, str):
+                    chunk = self._decoder.decode(chunk, final=self._exhausted)
+            if chunk:
+                self._buffer = chunk
+                self._position = 0
+                return True
+        return False
+
+
+def read_text(source: SourceType, encoding: str = "utf-8") -> str:
+    if isinstance(source, str):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+        return str(source, encoding)
+    text = source.read()
+    if not isinstance(text, str):
+        text = str(text, encoding)
+    return text
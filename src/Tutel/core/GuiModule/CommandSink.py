@@ -0,0 +1,95 @@
+import atexit
+import sys
+import threading
+import time
+
+from Tutel.core import GuiModule
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.05
+BATCH_PREFIX = '{"method": "BATCH", "body": ['
+BATCH_SUFFIX = ']}\n'
+
+
+class CommandSink:
+    """
+    Buffered output of serialized GUI commands, one command per line.
+    Commands are written to a file opened once, GuiModule.GUI_OUT by default, or to standard output.
+    Buffer is flushed when it holds buffer_size characters, flush_interval seconds after the first command
+    buffered, by a background thread even if no command comes later, and when the sink is flushed or closed.
+    Batching sink writes commands flushed together as a single BATCH command with a list of them as its body.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 batch: bool = False, path: str = None) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.batch = batch
+        self.path = path
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._file = None
+        # Thread flushing commands buffered before a long computation or a loop which doesn't draw anymore,
+        # started by the first command buffered and stopped when the sink is closed
+        self._flusher = None
+        self._lock = threading.RLock()
+        self._buffered_first = threading.Condition(self._lock)
+
+    def write(self, command: str) -> None:
+        with self._lock:
+            self._buffer.append(command)
+            self._buffered += len(command)
+            if self._buffered >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+                self._flusher.start()
+            elif len(self._buffer) == 1:
+                self._buffered_first.notify()
+
+    def _flush_periodically(self) -> None:
+        with self._lock:
+            while self._flusher is threading.current_thread():
+                if not self._buffer:
+                    self._buffered_first.wait()
+                elif (remaining := self._last_flush + self.flush_interval - time.monotonic()) > 0:
+                    self._buffered_first.wait(remaining)
+                else:
+                    self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+            if self.batch and len(self._buffer) > 1:
+                data = BATCH_PREFIX + ", ".join(command[:-1] for command in self._buffer) + BATCH_SUFFIX
+            else:
+                data = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+            stream = self._stream()
+            stream.write(data)
+            stream.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._flusher = None
+            self._buffered_first.notify()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                atexit.unregister(self.close)
+
+    def _stream(self):
+        if self._file is not None:
+            return self._file
+        path = self.path if self.path is not None else GuiModule.GUI_OUT
+        if not path:
+            return sys.stdout
+        self._file = open(path, "a")
+        # Commands buffered when the interpreter is killed are written before exiting
+        atexit.register(self.close)
+        return self._file
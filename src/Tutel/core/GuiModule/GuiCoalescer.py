@@ -0,0 +1,89 @@
+from Tutel.core.GuiModule.GuiInterface import GuiInterface
+from Tutel.core.InterpreterModule.Turtle.Color import Color
+from Tutel.core.InterpreterModule.Turtle.Orientation import Orientation
+from Tutel.core.InterpreterModule.Turtle.Position import Position
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+
+
+class GuiCoalescer(GuiInterface):
+    """
+    GUI merging consecutive forward moves of a turtle in the same direction into a single move of the wrapped GUI.
+    Move is held back until anything else happens: a turn, a color change, a move of another turtle,
+    a read of the turtle's position, a flush, e.g. before printing, or the end of the program.
+    Only horizontal and vertical moves are merged, points of those are exactly on a single line,
+    so the drawing ends up the same. Steps of a slanted line drawn in pixels differ from the whole line.
+    """
+
+    def __init__(self, gui: GuiInterface) -> None:
+        self.gui = gui
+        self.positions: dict[int, Position] = {}
+        # Moves not sent to the wrapped GUI, since they were merged with the following ones
+        self.coalesced_moves = 0
+        # Turtle, start and end of the move held back
+        self._turtle_id = None
+        self._start = None
+        self._end = None
+
+    def _succeeded(self, result) -> bool:
+        return result or type(self.gui) == GuiInterface
+
+    def _send_move(self) -> None:
+        if self._turtle_id is not None:
+            turtle_id, self._turtle_id = self._turtle_id, None
+            if self._succeeded(self.gui.go_forward(turtle_id, self._end)):
+                self.positions[turtle_id] = self._end
+
+    def add_turtle(self, turtle: Turtle) -> bool:
+        self._send_move()
+        if added := self._succeeded(self.gui.add_turtle(turtle)):
+            self.positions[turtle.id] = turtle.position
+        return added
+
+    def set_color(self, turtle_id: int, color: Color) -> bool:
+        self._send_move()
+        return self._succeeded(self.gui.set_color(turtle_id, color))
+
+    def set_position(self, turtle_id: int, position: Position) -> bool:
+        self._send_move()
+        if moved := self._succeeded(self.gui.set_position(turtle_id, position)):
+            self.positions[turtle_id] = position
+        return moved
+
+    def set_orientation(self, turtle_id: int, orientation: Orientation) -> bool:
+        self._send_move()
+        return self._succeeded(self.gui.set_orientation(turtle_id, orientation))
+
+    def go_forward(self, turtle_id: int, position: Position) -> bool:
+        if turtle_id == self._turtle_id:
+            start, end = self._start, self._end
+            dx, dy, next_dx, next_dy = end.x - start.x, end.y - start.y, position.x - end.x, position.y - end.y
+            # Going backwards doesn't turn the turtle, but it draws over the line
+            if (dx == next_dx == 0 or dy == next_dy == 0) and dx * next_dx + dy * next_dy >= 0:
+                self._end = position
+                self.coalesced_moves += 1
+                return True
+        self._send_move()
+        if (start := self.positions.get(turtle_id)) is None:
+            return self._succeeded(self.gui.go_forward(turtle_id, position))
+        self._turtle_id, self._start, self._end = turtle_id, start, position
+        return True
+
+    def pen_up(self, turtle_id: int) -> bool:
+        self._send_move()
+        return self._succeeded(self.gui.pen_up(turtle_id))
+
+    def pen_down(self, turtle_id: int) -> bool:
+        self._send_move()
+        return self._succeeded(self.gui.pen_down(turtle_id))
+
+    def sync(self, turtle_id: int) -> None:
+        if turtle_id == self._turtle_id:
+            self._send_move()
+
+    def flush(self) -> None:
+        self._send_move()
+        self.gui.flush()
+
+    def close(self) -> None:
+        self._send_move()
+        self.gui.close()
@@ -11,3 +11,6 @@ class GuiInterface:
     def go_forward(self, turtle_id: int, position: Position) -> bool: ...
     def pen_up(self, turtle_id: int) -> bool: ...
     def pen_down(self, turtle_id: int) -> bool: ...
+    def sync(self, turtle_id: int) -> None: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
@@ -0,0 +1,130 @@
+import math
+import struct
+import zlib
+
+from Tutel.core.GuiModule.GuiInterface import GuiInterface
+from Tutel.core.InterpreterModule.Turtle.Color import Color
+from Tutel.core.InterpreterModule.Turtle.Orientation import Orientation
+from Tutel.core.InterpreterModule.Turtle.Position import Position
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_MARGIN = 10
+DEFAULT_MAX_SIZE = 4096
+BACKGROUND = (0, 0, 0)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Segments rasterized at once, bounds memory used by pixels of the segments
+CHUNK_SIZE = 4096
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(canvas: "np.ndarray") -> bytes:
+    height, width, _ = canvas.shape
+    # Every row starts with its filter type, 0 leaves the row as it is
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = canvas.reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return PNG_SIGNATURE + _png_chunk(b"IHDR", header) + _png_chunk(b"IDAT", zlib.compress(rows.tobytes())) \
+        + _png_chunk(b"IEND", b"")
+
+
+def encode_ppm(canvas: "np.ndarray") -> bytes:
+    height, width, _ = canvas.shape
+    return f"P6\n{width} {height}\n255\n".encode() + canvas.tobytes()
+
+
+def rasterize(segments: "np.ndarray", colors: "np.ndarray", width: int, height: int) -> "np.ndarray":
+    """
+    Draws segments given as rows of pixel coordinates (x0, y0, x1, y1) on a new canvas of RGB pixels.
+    Every segment is sampled once per pixel along its longer axis, all segments of a chunk at once.
+    Segments drawn later are drawn over the earlier ones.
+    """
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:, :] = BACKGROUND
+    for start in range(0, len(segments), CHUNK_SIZE):
+        chunk = segments[start:start + CHUNK_SIZE]
+        x0, y0, x1, y1 = chunk.T
+        dx, dy = x1 - x0, y1 - y0
+        lengths = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64) + 1
+        segment = np.repeat(np.arange(len(chunk)), lengths)
+        step = np.arange(len(segment)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        t = step / np.maximum(lengths - 1, 1)[segment]
+        xs = np.rint(x0[segment] + dx[segment] * t).astype(np.int64)
+        ys = np.rint(y0[segment] + dy[segment] * t).astype(np.int64)
+        canvas[ys, xs] = colors[start:start + CHUNK_SIZE][segment]
+    return canvas
+
+
+class GuiRaster(GuiInterface):
+    """
+    Headless GUI drawing lines walked by turtles into an image, written when the GUI is closed.
+    Image fits the bounding box of the drawing with a margin, scaled down if it's larger than max_size.
+    Image is a PPM if the path ends with .ppm, PNG otherwise. Requires numpy.
+    """
+
+    def __init__(self, path: str, margin: int = DEFAULT_MARGIN, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if np is None:
+            raise ImportError("Rendering requires numpy, install it with: pip install numpy")
+        self.path = path
+        self.margin = margin
+        self.max_size = max_size
+        self.turtles: dict[int, list] = {}
+        # Rows of x0, y0, x1, y1 in coordinates of the turtles and colors of lines
+        self.segments: list[tuple[float, float, float, float]] = []
+        self.colors: list[tuple[int, int, int]] = []
+
+    def add_turtle(self, turtle: Turtle) -> bool:
+        self.turtles[turtle.id] = [turtle.position, turtle.color]
+        return True
+
+    def set_color(self, turtle_id: int, color: Color) -> bool:
+        if (turtle := self.turtles.get(turtle_id)) is None:
+            return False
+        turtle[1] = color
+        return True
+
+    def set_orientation(self, turtle_id: int, orientation: Orientation) -> bool:
+        return turtle_id in self.turtles
+
+    def set_position(self, turtle_id: int, position: Position) -> bool:
+        return self._line_to(turtle_id, position)
+
+    def go_forward(self, turtle_id: int, position: Position) -> bool:
+        return self._line_to(turtle_id, position)
+
+    def _line_to(self, turtle_id: int, position: Position) -> bool:
+        if (turtle := self.turtles.get(turtle_id)) is None:
+            return False
+        start, color = turtle
+        self.segments.append((start.x, start.y, position.x, position.y))
+        self.colors.append((color.r, color.g, color.b))
+        turtle[0] = position
+        return True
+
+    def render(self) -> "np.ndarray":
+        if not self.segments:
+            return rasterize(np.empty((0, 4)), np.empty((0, 3), dtype=np.uint8), 2 * self.margin + 1,
+                             2 * self.margin + 1)
+        segments = np.array(self.segments, dtype=np.float64)
+        xs, ys = segments[:, 0::2], segments[:, 1::2]
+        min_x, max_x, min_y, max_y = xs.min(), xs.max(), ys.min(), ys.max()
+        scale = min(1.0, (self.max_size - 2 * self.margin - 1) / max(max_x - min_x, max_y - min_y, 1))
+        # Turtles' y axis points down like rows of the image, so turning left looks like turning left
+        segments[:, 0::2] = (xs - min_x) * scale + self.margin
+        segments[:, 1::2] = (ys - min_y) * scale + self.margin
+        width = math.ceil((max_x - min_x) * scale) + 2 * self.margin + 1
+        height = math.ceil((max_y - min_y) * scale) + 2 * self.margin + 1
+        return rasterize(segments, np.array(self.colors, dtype=np.uint8), width, height)
+
+    def close(self) -> None:
+        canvas = self.render()
+        encode = encode_ppm if self.path.lower().endswith(".ppm") else encode_png
+        with open(self.path, "wb") as file:
+            file.write(encode(canvas))
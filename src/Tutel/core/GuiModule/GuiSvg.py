@@ -0,0 +1,129 @@
+from Tutel.core.GuiModule.GuiInterface import GuiInterface
+from Tutel.core.InterpreterModule.Turtle.Color import Color
+from Tutel.core.InterpreterModule.Turtle.Orientation import Orientation
+from Tutel.core.InterpreterModule.Turtle.Position import Position
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+
+DEFAULT_MARGIN = 10
+# Points of a polyline written at once, longer lines are continued by the next polyline
+MAX_POINTS = 1024
+# Space left in the opening tag for the size of the drawing, known only when the GUI is closed
+HEADER_SIZE = 160
+SVG_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" style="background-color:#000000"'
+SVG_GROUP = '<g fill="none" stroke-width="1" stroke-linecap="round" stroke-linejoin="round">\n'
+SVG_CLOSE = '</g>\n</svg>\n'
+
+
+def format_number(value: float) -> str:
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+class GuiSvg(GuiInterface):
+    """
+    Headless GUI writing lines walked by turtles to an SVG image while the program runs.
+    Consecutive moves of the same turtle with the same color are merged into a single polyline.
+    Size of the image, fitting the drawing with a margin, is filled into the header when the GUI is closed.
+    """
+
+    def __init__(self, path: str, margin: int = DEFAULT_MARGIN) -> None:
+        self.path = path
+        self.margin = margin
+        self.turtles: dict[int, list] = {}
+        self.bounds = None
+        # Turtle, color and points of the polyline not written yet
+        self._line_turtle = None
+        self._line_color = None
+        self._points: list[str] = []
+        self._file = None
+        self._header_at = 0
+        self._closed = False
+
+    def add_turtle(self, turtle: Turtle) -> bool:
+        self.turtles[turtle.id] = [turtle.position, turtle.color]
+        return True
+
+    def set_color(self, turtle_id: int, color: Color) -> bool:
+        if (turtle := self.turtles.get(turtle_id)) is None:
+            return False
+        turtle[1] = color
+        return True
+
+    def set_orientation(self, turtle_id: int, orientation: Orientation) -> bool:
+        return turtle_id in self.turtles
+
+    def set_position(self, turtle_id: int, position: Position) -> bool:
+        return self._line_to(turtle_id, position)
+
+    def go_forward(self, turtle_id: int, position: Position) -> bool:
+        return self._line_to(turtle_id, position)
+
+    def _line_to(self, turtle_id: int, position: Position) -> bool:
+        if (turtle := self.turtles.get(turtle_id)) is None:
+            return False
+        start, color = turtle
+        if turtle_id != self._line_turtle or color != self._line_color or len(self._points) >= MAX_POINTS:
+            self._write_line()
+            self._line_turtle, self._line_color = turtle_id, color
+            self._add_point(start)
+        self._add_point(position)
+        turtle[0] = position
+        return True
+
+    def _add_point(self, position: Position) -> None:
+        x, y = position.x, position.y
+        if self.bounds is None:
+            self.bounds = [x, y, x, y]
+        else:
+            bounds = self.bounds
+            if x < bounds[0]:
+                bounds[0] = x
+            elif x > bounds[2]:
+                bounds[2] = x
+            if y < bounds[1]:
+                bounds[1] = y
+            elif y > bounds[3]:
+                bounds[3] = y
+        self._points.append(f"{format_number(x)},{format_number(y)}")
+
+    def _write_line(self) -> None:
+        if not self._points:
+            return
+        color = self._line_color
+        self._stream().write(f'<polyline stroke="#{color.r:02x}{color.g:02x}{color.b:02x}" '
+                             f'points="{" ".join(self._points)}"/>\n')
+        self._points = []
+
+    def _stream(self):
+        if self._file is None:
+            self._file = open(self.path, "w")
+            self._file.write(SVG_OPEN)
+            self._header_at = self._file.tell()
+            self._file.write(" " * HEADER_SIZE + ">\n" + SVG_GROUP)
+        return self._file
+
+    def _size(self) -> str:
+        min_x, min_y, max_x, max_y = self.bounds or (0, 0, 0, 0)
+        width, height = max_x - min_x + 2 * self.margin, max_y - min_y + 2 * self.margin
+        return f' width="{format_number(width)}" height="{format_number(height)}" ' \
+               f'viewBox="{format_number(min_x - self.margin)} {format_number(min_y - self.margin)} ' \
+               f'{format_number(width)} {format_number(height)}"'
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._write_line()
+        file = self._stream()
+        file.write(SVG_CLOSE)
+        size = self._size()
+        # Header is left without the size if it doesn't fit, the image is still valid
+        if len(size) <= HEADER_SIZE:
+            file.seek(self._header_at)
+            file.write(size)
+        file.close()
+        self._file = None
@@ -1,8 +1,7 @@
 import json
-import sys
 from enum import Enum
 
-from Tutel.core import GuiModule
+from Tutel.core.GuiModule.CommandSink import CommandSink
 from Tutel.core.GuiModule.GuiInterface import GuiInterface
 from Tutel.core.InterpreterModule.Turtle.Color import Color
 from Tutel.common.JsonSerializable import JsonSerializable
@@ -17,14 +16,7 @@ class Methods(Enum):
     POSITION = "POSITION"
     ORIENTATION = "ORIENTATION"
     GO = "GO"
-
-
-def _message(msg: str):
-    if GuiModule.GUI_OUT:
-        with open(GuiModule.GUI_OUT, "a") as f:
-            f.write(msg)
-    else:
-        sys.stdout.write(msg)
+    BATCH = "BATCH"
 
 
 def create_request(method: str, id: int = None, body=None):
@@ -37,29 +29,38 @@ def create_request(method: str, id: int = None, body=None):
 
 
 class GuiVsCode(GuiInterface):
+    def __init__(self, sink: CommandSink = None) -> None:
+        self.sink = sink or CommandSink()
+
+    def flush(self) -> None:
+        self.sink.flush()
+
+    def close(self) -> None:
+        self.sink.close()
+
     def add_turtle(self, turtle: Turtle) -> bool:
         request = create_request(
             method="ADD", id=turtle.id, body=turtle
         )
-        _message(request)
+        self.sink.write(request)
         return True
 
     def set_color(self, turtle_id: int, color: Color) -> bool:
         request = create_request(method="COLOR", id=turtle_id, body={"color": color})
-        _message(request)
+        self.sink.write(request)
         return True
 
     def set_position(self, turtle_id: int, position: Position) -> bool:
         request = create_request(method="POSITION", id=turtle_id, body={"position": position})
-        _message(request)
+        self.sink.write(request)
         return True
 
     def set_orientation(self, turtle_id: int, orientation: Orientation) -> bool:
         request = create_request(method="ORIENTATION", id=turtle_id, body={"orientation": orientation})
-        _message(request)
+        self.sink.write(request)
         return True
 
     def go_forward(self, turtle_id: int, position: Position) -> bool:
         request = create_request(method="GO", id=turtle_id, body={"position": position})
-        _message(request)
+        self.sink.write(request)
         return True
@@ -0,0 +1,81 @@
+from types import FunctionType, MethodDescriptorType, WrapperDescriptorType
+
+from Tutel.core.InterpreterModule.Value import Value
+
+# Attributes of these types are bound to the object they are read from, they can be called with it instead
+METHOD_TYPES = (FunctionType, MethodDescriptorType, WrapperDescriptorType)
+METHOD = "method"
+PROPERTY = "property"
+OTHER = "other"
+NOT_FOUND = object()
+# Second item returned by AttributeCache.get_method when the attribute is not called with its object
+UNBOUND = object()
+
+
+def find_class_attribute(type_: type, name: str):
+    for klass in type_.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return NOT_FOUND
+
+
+class AttributeCache:
+    """
+    Inline cache of a single attribute read, specialized on types of the last object read from.
+    Value without the attribute passes reading to its wrapped object, the cache reads from that object directly.
+    Properties are read by calling their getter and methods called right away are called with their object
+    instead of being bound first. Cache is resolved again when the object has different types.
+    """
+
+    __slots__ = ("name", "receiver_type", "owner_type", "unwrapped", "kind", "attribute", "instance_dict")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.receiver_type = None
+        self.owner_type = None
+        self.unwrapped = False
+        self.kind = OTHER
+        self.attribute = None
+        self.instance_dict = False
+
+    def __reduce__(self):
+        # Resolved types are not kept when the program is pickled
+        return AttributeCache, (self.name,)
+
+    def get(self, receiver):
+        owner = self._owner(receiver)
+        if self.kind is PROPERTY:
+            return self.attribute(owner)
+        return getattr(owner, self.name)
+
+    def get_method(self, receiver) -> tuple:
+        """Returns a function and an object it should be called with, or the attribute and UNBOUND."""
+        owner = self._owner(receiver)
+        if self.kind is METHOD and not (self.instance_dict and self.name in owner.__dict__):
+            return self.attribute, owner
+        if self.kind is PROPERTY:
+            return self.attribute(owner), UNBOUND
+        return getattr(owner, self.name), UNBOUND
+
+    def _owner(self, receiver):
+        if type(receiver) is not self.receiver_type \
+                or self.unwrapped and type(receiver.value) is not self.owner_type:
+            self._resolve(receiver)
+        return receiver.value if self.unwrapped else receiver
+
+    def _resolve(self, receiver) -> None:
+        self.receiver_type = type(receiver)
+        self.unwrapped = self.receiver_type is Value and find_class_attribute(Value, self.name) is NOT_FOUND
+        owner = receiver.value if self.unwrapped else receiver
+        self.owner_type = type(owner)
+        self.kind, self.attribute = OTHER, None
+        # Attributes of classes and of objects overriding attribute reading in Python are left to getattr
+        if isinstance(owner, type) \
+                or type(find_class_attribute(self.owner_type, "__getattribute__")) is not WrapperDescriptorType:
+            return
+        attribute = find_class_attribute(self.owner_type, self.name)
+        if type(attribute) in METHOD_TYPES:
+            self.kind, self.attribute = METHOD, attribute
+            self.instance_dict = hasattr(owner, "__dict__")
+        elif type(attribute) == property and attribute.fget is not None:
+            self.kind, self.attribute = PROPERTY, attribute.fget
@@ -0,0 +1,53 @@
+from typing import Callable, NamedTuple
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Value import unbox
+
+
+class Builtin(NamedTuple):
+    """
+    Descriptor of a builtin function: how many arguments it takes, how it's called and what it returns.
+    Descriptors are registered here rather than in TutelBuiltins, as every name defined there is a builtin.
+    """
+    name: str
+    function: Callable
+    min_args: int
+    # None when builtin takes any number of arguments
+    max_args: int | None
+    # Builtin is called with wrapped objects instead of Values
+    unboxed: bool = True
+    pure: bool = False
+
+    def accepts(self, args_count: int) -> bool:
+        return self.min_args <= args_count and (self.max_args is None or args_count <= self.max_args)
+
+    def call(self, arguments: list):
+        if self.unboxed:
+            return self.function(*[unbox(argument) for argument in arguments])
+        return self.function(*arguments)
+
+
+REGISTRY: dict[str, Builtin] = {builtin.name: builtin for builtin in [
+    Builtin("print", TutelBuiltins.print, 0, None),
+    Builtin("input", TutelBuiltins.input, 0, 1),
+    Builtin("sleep", TutelBuiltins.sleep, 1, 1),
+    Builtin("type", TutelBuiltins.type, 1, 1, pure=True),
+    Builtin("hex", TutelBuiltins.hex, 1, 1, pure=True),
+    Builtin("min", TutelBuiltins.min, 1, None, pure=True),
+    Builtin("max", TutelBuiltins.max, 1, None, pure=True),
+    Builtin("abs", TutelBuiltins.abs, 1, 1, pure=True),
+    Builtin("range", TutelBuiltins.range, 1, 3, pure=True),
+    Builtin("len", TutelBuiltins.len, 1, 1, pure=True),
+    Builtin("pow", TutelBuiltins.pow, 2, 2, pure=True),
+    Builtin("str", TutelBuiltins.str, 0, 3, pure=True),
+    Builtin("int", TutelBuiltins.int, 0, 2, pure=True),
+    Builtin("Turtle", TutelBuiltins.Turtle, 0, 0),
+    Builtin("Color", TutelBuiltins.Color, 3, 3, pure=True),
+    Builtin("Position", TutelBuiltins.Position, 2, 2, pure=True),
+]}
+
+
+def find_builtin(name: str, function: Callable) -> Builtin | None:
+    """Returns descriptor of a builtin, unless the function isn't the registered one."""
+    builtin = REGISTRY.get(name)
+    return builtin if builtin is not None and builtin.function is function else None
@@ -0,0 +1,519 @@
+from typing import Callable
+
+from Tutel.common.ErrorType import MismatchedArgsCountException, OutOfRangeException, TypeException, \
+    UnknownException, Stop
+from Tutel.common.ErrorType import NotIterableException, CannotAssignException, NotDefinedException, \
+    UnsupportedOperandException, BadOperandForUnaryException, AttributeException
+from Tutel.core.InterpreterModule.AttributeCache import UNBOUND
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Linker import Binding
+from Tutel.core.InterpreterModule.Operators import modifying_operators, one_sided_operators, two_sided_operators, \
+    short_circuit_operators
+from Tutel.core.InterpreterModule.Value import Value, box, unbox, type_name
+from Tutel.core.ParserModule import Classes
+
+Compiled = Callable[[list], any]
+
+
+class ClosureInterpreter(Interpreter):
+    """
+    Compiles every function of the program into a tree of closures once and runs them instead of visiting nodes.
+    Operators, constant atoms and identifier kinds (builtin, program function or local variable) are resolved
+    during compilation, each closure gets slot list of locals of the current frame as its only argument.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled_program = None
+        self._compiled_functions: dict[int, Callable[[list | None], None]] = {}
+        self._slots: dict[str, int] = {}
+        self._compilers = {
+            Classes.Block: self._compile_block,
+            Classes.IfStatement: self._compile_if_statement,
+            Classes.ForStatement: self._compile_for_statement,
+            Classes.WhileStatement: self._compile_while_statement,
+            Classes.ReturnStatement: self._compile_return_statement,
+            Classes.BasicAssignment: self._compile_basic_assignment,
+            Classes.ModifyingAssignment: self._compile_modifying_assignment,
+            Classes.OneSidedExpression: self._compile_one_sided_expression,
+            Classes.DotOperator: self._compile_dot_operator,
+            Classes.FunCall: self._compile_fun_call,
+            Classes.ListElement: self._compile_list_element,
+            Classes.TwoSidedExpression: self._compile_two_sided_expression,
+            Classes.Identifier: self._compile_identifier,
+            Classes.List: self._compile_list,
+            Classes.Atom: self._compile_atom,
+        }
+
+    def _run(self, function: Classes.Function):
+        if self._compiled_program is not self.program_to_execute:
+            self._compile_program(self.program_to_execute)
+        self._compiled_functions[id(function)](None)
+
+    def _compile_program(self, program: Classes.Program):
+        self._compiled_functions = {}
+        for function in program.functions.values():
+            self._compiled_functions[id(function)] = self._compile_function(function)
+        self._compiled_program = program
+
+    def _line_setter(self) -> Callable[[int], None]:
+        interpreter = self
+
+        # Same as Interpreter.lineno setter without going through the properties
+        def set_lineno(lineno: int):
+            if interpreter._stopped:
+                raise Stop
+            if interpreter.lineno_update_enabled and (lineno != interpreter._lineno or interpreter.in_loop):
+                interpreter.call_stack[-1].lineno = lineno
+                interpreter._lineno = lineno
+                interpreter.debug_callback()
+
+        return set_lineno
+
+    def _local_setter(self, name) -> Callable[[list, any], None]:
+        if isinstance(name, str) and (slot := self._slots.get(name)) is not None:
+            def set_local(loc: list, value):
+                loc[slot] = value
+
+            return set_local
+        return self._dynamic_setter(name)
+
+    def _dynamic_setter(self, name) -> Callable[[list, any], None]:
+        def set_local(_, value):
+            self._set_local_var(name, value)
+
+        return set_local
+
+    def _compile(self, node) -> Compiled:
+        """Compiles node evaluated with accept, identifiers evaluate to their names."""
+        for cls in type(node).__mro__:
+            if compiler := self._compilers.get(cls):
+                return compiler(node)
+        raise TypeError(f"Cannot compile {type(node).__name__}")
+
+    def _compile_value(self, node) -> Compiled:
+        """Compiles node evaluated with _get_variable_or_instant_value, identifiers are looked up."""
+        if type(node) != Classes.Identifier:
+            return self._compile(node)
+
+        if node.binding != Binding.LOCAL:
+            target = node.target
+            return lambda loc: target
+
+        name = node.value
+        error_handler = self.error_handler
+        if (slot := self._slots.get(name)) is None:
+            def get_unresolved(_):
+                if (value := self._get_local_var(name)) is None:
+                    error_handler.handle_error(NotDefinedException(name=name), self.call_stack)
+                return value
+
+            return get_unresolved
+
+        def get_local(loc: list):
+            if (value := loc[slot]) is None:
+                error_handler.handle_error(NotDefinedException(name=name), self.call_stack)
+            return value
+
+        return get_local
+
+    def _compile_function(self, function: Classes.Function) -> Callable[[list | None], None]:
+        name, name_lineno = function.name.value, function.name.lineno
+        lineno = function.lineno
+        params = [param.value for param in function.params]
+        slots = function.slots
+        param_slots = [slots[param] for param in params]
+        self._slots = slots
+        body = self._compile_block(function.statements)
+        set_lineno = self._line_setter()
+
+        def call(arguments: list | None):
+            self._add_stack_frame(name, name_lineno, slots)
+            set_lineno(lineno)
+            loc = self.call_stack[-1].values
+            if arguments is not None:
+                if len(arguments) != len(params):
+                    self.error_handler.handle_error(
+                        MismatchedArgsCountException(
+                            fun_name=function.name,
+                            expected_min=len(params),
+                            expected_max=len(params),
+                            got_number=len(arguments)
+                        ), self.call_stack
+                    )
+                for slot, argument in zip(param_slots, arguments):
+                    loc[slot] = box(argument)
+            body(loc)
+            self.return_flag = False
+            self.function_args = None
+            self._drop_stack_frame()
+
+        return call
+
+    def _compile_block(self, block: Classes.Block) -> Compiled:
+        lineno = block.lineno
+        statements = [self._compile(statement) for statement in block]
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            for statement in statements:
+                statement(loc)
+                if self.return_flag:
+                    break
+
+        return run
+
+    def _compile_if_statement(self, if_stmt: Classes.IfStatement) -> Compiled:
+        lineno = if_stmt.lineno
+        condition = self._compile(if_stmt.condition)
+        statements = self._compile_block(if_stmt.statements)
+        elif_stmts = [(elif_stmt.lineno, self._compile(elif_stmt.condition), self._compile_block(elif_stmt.statements))
+                      for elif_stmt in if_stmt.elif_stmts]
+        else_stmt = self._compile_block(if_stmt.else_stmt) if if_stmt.else_stmt else None
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            self.do_else = True
+            if condition(loc):
+                statements(loc)
+                self.do_else = False
+            if self.do_else:
+                for elif_lineno, elif_condition, elif_statements in elif_stmts:
+                    set_lineno(elif_lineno)
+                    if elif_condition(loc):
+                        elif_statements(loc)
+                        self.do_else = False
+                    if self.return_flag:
+                        break
+            if self.do_else and else_stmt:
+                else_stmt(loc)
+
+        return run
+
+    def _compile_for_statement(self, for_stmt: Classes.ForStatement) -> Compiled:
+        lineno = for_stmt.lineno
+        iterator = self._compile(for_stmt.iterator)
+        set_iterator = self._local_setter(for_stmt.iterator.value) \
+            if type(for_stmt.iterator) == Classes.Identifier else None
+        iterable = self._compile_value(for_stmt.iterable)
+        statements = self._compile_block(for_stmt.statements)
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            set_local = set_iterator or self._dynamic_setter(iterator(loc))
+            values = iterable(loc)
+            try:
+                self.in_loop = True
+                for i in values:
+                    set_local(loc, box(i))
+                    statements(loc)
+                    if self.return_flag:
+                        break
+            except TypeError:
+                self.error_handler.handle_error(NotIterableException(type_name=type_name(values)),
+                                                self.call_stack)
+            finally:
+                self.in_loop = False
+
+        return run
+
+    def _compile_while_statement(self, while_stmt: Classes.WhileStatement) -> Compiled:
+        lineno = while_stmt.lineno
+        condition = self._compile(while_stmt.condition)
+        statements = self._compile_block(while_stmt.statements)
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            while condition(loc):
+                self.in_loop = True
+                statements(loc)
+                if self.return_flag:
+                    break
+            self.in_loop = False
+
+        return run
+
+    def _compile_return_statement(self, return_stmt: Classes.ReturnStatement) -> Compiled:
+        lineno = return_stmt.lineno
+        values = [self._compile(value) for value in return_stmt.values]
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            self.return_flag = True
+            returned = [value(loc) for value in values]
+            if len(returned) == 0:
+                self.last_returned = Value(None)
+            elif len(returned) == 1:
+                self.last_returned = box(returned[0])
+            else:
+                self.last_returned = returned
+
+        return run
+
+    def _compile_basic_assignment(self, assignment: Classes.BasicAssignment) -> Compiled:
+        lineno = assignment.lineno
+        set_lineno = self._line_setter()
+        if not self._is_assignable(assignment.left_expr):
+            def cannot_assign(_):
+                set_lineno(lineno)
+                self.error_handler.handle_error(CannotAssignException(value=assignment.left_expr), self.call_stack)
+
+            return cannot_assign
+
+        identifier = self._compile(assignment.left_expr)
+        set_identifier = self._local_setter(assignment.left_expr.value) \
+            if type(assignment.left_expr) == Classes.Identifier else None
+        right_expr = self._compile_value(assignment.right_expr)
+
+        def run(loc: list):
+            set_lineno(lineno)
+            set_local = set_identifier or self._dynamic_setter(identifier(loc))
+            set_local(loc, box(right_expr(loc)))
+
+        return run
+
+    def _compile_modifying_assignment(self, assignment: Classes.ModifyingAssignment) -> Compiled:
+        lineno = assignment.lineno
+        identifier = self._compile(assignment.left_expr)
+        right_expr = self._compile_value(assignment.right_expr)
+        operator = assignment.operator
+        operation = modifying_operators[operator]
+        slot = self._slots.get(assignment.left_expr.value) \
+            if type(assignment.left_expr) == Classes.Identifier else None
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            name = identifier(loc)
+            if (variable := loc[slot] if slot is not None else self._get_local_var(name)) is None:
+                self.error_handler.handle_error(NotDefinedException(name=name), self.call_stack)
+            else:
+                value = right_expr(loc)
+                try:
+                    operation(variable, value)
+                except TypeError:
+                    self.error_handler.handle_error(
+                        UnsupportedOperandException(l_type=type_name(variable), r_type=type_name(value),
+                                                    operator=operator), self.call_stack
+                    )
+
+        return run
+
+    def _compile_one_sided_expression(self, expr: Classes.OneSidedExpression) -> Compiled:
+        lineno = expr.lineno
+        operand = self._compile_value(expr.value)
+        operation = one_sided_operators[expr.operator]
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            value = operand(loc)
+            try:
+                return operation(value)
+            except TypeError:
+                self.error_handler.handle_error(
+                    BadOperandForUnaryException(type_name=type_name(value)), self.call_stack)
+
+        return run
+
+    def _compile_two_sided_expression(self, expr: Classes.TwoSidedExpression) -> Compiled:
+        if expr.operator in short_circuit_operators:
+            return self._compile_short_circuit_expression(expr)
+        lineno = expr.lineno
+        left_expr = self._compile_value(expr.left_expr)
+        right_expr = self._compile_value(expr.right_expr)
+        operator = expr.operator
+        operation = two_sided_operators.get(operator)
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            left = left_expr(loc)
+            right = right_expr(loc)
+            try:
+                if operation is None:
+                    raise KeyError(operator)
+                return operation(left, right)
+            except (KeyError, TypeError):
+                self.error_handler.handle_error(
+                    UnsupportedOperandException(operator=operator, l_type=type_name(left),
+                                                r_type=type_name(right)), self.call_stack)
+
+        return run
+
+    def _compile_short_circuit_expression(self, expr: Classes.TwoSidedExpression) -> Compiled:
+        lineno = expr.lineno
+        left_expr = self._compile_value(expr.left_expr)
+        right_expr = self._compile_value(expr.right_expr)
+        set_lineno = self._line_setter()
+
+        if expr.operator == "and":
+            def run(loc: list):
+                set_lineno(lineno)
+                left = left_expr(loc)
+                return right_expr(loc) if left else left
+        else:
+            def run(loc: list):
+                set_lineno(lineno)
+                left = left_expr(loc)
+                return left if left else right_expr(loc)
+
+        return run
+
+    def _compile_dot_operator(self, obj: Classes.DotOperator) -> Compiled:
+        lineno = obj.lineno
+        left_expr = self._compile_value(obj.left_expr)
+        set_lineno = self._line_setter()
+        cache = obj.cache
+
+        def run(loc: list):
+            set_lineno(lineno)
+            left = left_expr(loc)
+            try:
+                return cache.get(left)
+            except AttributeError:
+                self.error_handler.handle_error(AttributeException(type_name=type_name(left),
+                                                                   value=cache.name), self.call_stack)
+
+        return run
+
+    def _compile_method(self, obj: Classes.DotOperator) -> Compiled:
+        lineno = obj.lineno
+        left_expr = self._compile_value(obj.left_expr)
+        set_lineno = self._line_setter()
+        cache = obj.cache
+
+        def run(loc: list):
+            set_lineno(lineno)
+            left = left_expr(loc)
+            try:
+                return cache.get_method(left)
+            except AttributeError:
+                self.error_handler.handle_error(AttributeException(type_name=type_name(left),
+                                                                   value=cache.name), self.call_stack)
+                return None, UNBOUND
+
+        return run
+
+    def _compile_fun_call(self, fun_call: Classes.FunCall) -> Compiled:
+        if type(fun_call.left_expr) == Classes.DotOperator:
+            return self._compile_method_call(fun_call)
+        if fun_call.builtin is not None:
+            return self._compile_builtin_call(fun_call)
+        lineno = fun_call.lineno
+        left_expr = self._compile_value(fun_call.left_expr)
+        arguments = [self._compile_value(arg) for arg in fun_call.right_expr]
+        call_value = self._call_value
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            function = left_expr(loc)
+            return call_value(function, [argument(loc) for argument in arguments])
+
+        return run
+
+    def _compile_builtin_call(self, fun_call: Classes.FunCall) -> Compiled:
+        lineno = fun_call.lineno
+        builtin = fun_call.builtin
+        arguments = [self._compile_value(arg) for arg in fun_call.right_expr]
+        set_lineno = self._line_setter()
+        if not builtin.accepts(len(arguments)) or not builtin.unboxed:
+            call_builtin = self._call_builtin
+
+            def run_checked(loc: list):
+                set_lineno(lineno)
+                return call_builtin(builtin, [argument(loc) for argument in arguments])
+
+            return run_checked
+        # Number of arguments is known already, builtin is called right away
+        function = builtin.function
+
+        def run(loc: list):
+            set_lineno(lineno)
+            values = [argument(loc) for argument in arguments]
+            try:
+                return function(*[unbox(value) for value in values])
+            except TypeError as e:
+                self.error_handler.handle_error(TypeException(e), self.call_stack)
+            except Exception as e:
+                self.error_handler.handle_error(UnknownException(e), self.call_stack)
+
+        return run
+
+    def _compile_method_call(self, fun_call: Classes.FunCall) -> Compiled:
+        lineno = fun_call.lineno
+        method = self._compile_method(fun_call.left_expr)
+        arguments = [self._compile_value(arg) for arg in fun_call.right_expr]
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            function, owner = method(loc)
+            values = [argument(loc) for argument in arguments]
+            if owner is UNBOUND:
+                return self._call_value(function, values)
+            try:
+                return function(owner, *[unbox(value) for value in values])
+            except TypeError as e:
+                self.error_handler.handle_error(TypeException(e), self.call_stack)
+            except Exception as e:
+                self.error_handler.handle_error(UnknownException(e), self.call_stack)
+
+        return run
+
+    def _call_value(self, function, values: list):
+        """Calls a Tutel function, memoized if possible, or any other value, e.g. an attribute which is not a method."""
+        if type(function) == Classes.Function:
+            if self.memoizer is not None and (cache := self.memoizer.caches.get(function.name.value)) is not None:
+                return self.memoizer.call(self, cache, function, values, self._call_compiled_function)
+            return self._call_compiled_function(function, values)
+        try:
+            return function(*[unbox(value) for value in values])
+        except TypeError as e:
+            self.error_handler.handle_error(TypeException(e), self.call_stack)
+        except Exception as e:
+            self.error_handler.handle_error(UnknownException(e), self.call_stack)
+
+    def _call_compiled_function(self, function: Classes.Function, values: list):
+        try:
+            self._compiled_functions[id(function)](values)
+            return self.last_returned
+        except TypeError as err:
+            self.error_handler.handle_error(TypeException(err), self.call_stack)
+
+    def _compile_list_element(self, list_el: Classes.ListElement) -> Compiled:
+        lineno = list_el.lineno
+        left_expr = self._compile_value(list_el.left_expr)
+        right_expr = self._compile_value(list_el.right_expr)
+        set_lineno = self._line_setter()
+
+        def run(loc: list):
+            set_lineno(lineno)
+            list_ = left_expr(loc)
+            index = right_expr(loc)
+            try:
+                return list_[unbox(index)]
+            except IndexError:
+                self.error_handler.handle_error(OutOfRangeException(), self.call_stack)
+
+        return run
+
+    @staticmethod
+    def _compile_identifier(identifier: Classes.Identifier) -> Compiled:
+        name = identifier.value
+        return lambda loc: name
+
+    def _compile_list(self, list_: Classes.List) -> Compiled:
+        elements = [self._compile_value(el) for el in list_.value]
+        return lambda loc: [box(element(loc)) for element in elements]
+
+    @staticmethod
+    def _compile_atom(atom: Classes.Atom) -> Compiled:
+        value = atom.value
+        return lambda loc: value
@@ -1,25 +1,33 @@
 import atexit
-import operator
+import functools
 from typing import Callable
 
 from Tutel.common.ErrorHandler import ErrorHandler
 from Tutel.common.ErrorType import MismatchedArgsCountException, OutOfRangeException, NothingToRunException, \
     RecursionException, \
-    BuiltinFunctionShadowException, TypeException, UnknownException, Stop
+    BuiltinFunctionShadowException, TypeException, UnknownException, Stop, TutelException
 from Tutel.common.ErrorType import NotIterableException, CannotAssignException, NotDefinedException, \
     UnsupportedOperandException, BadOperandForUnaryException, AttributeException
 from Tutel.common.Utils import mock_debug_callback
 from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Builtin import Builtin
+from Tutel.core.InterpreterModule.AttributeCache import UNBOUND
+from Tutel.core.InterpreterModule.Operators import modifying_operators, one_sided_operators, two_sided_operators, \
+    short_circuit_operators
 from Tutel.core.InterpreterModule.Stack import Stack
-from Tutel.core.InterpreterModule.StackFrame import StackFrame
+from Tutel.core.InterpreterModule.StackFrame import StackFrame, NO_SLOTS
 from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
-from Tutel.core.InterpreterModule.Value import Value
+from Tutel.core.InterpreterModule.Value import Value, box, unbox, type_name
 from Tutel.core.ParserModule import Classes
+from Tutel.core.InterpreterModule.Linker import Linker, Binding
+from Tutel.core.InterpreterModule.Memoizer import Memoizer
+from Tutel.core.ParserModule.Resolver import Resolver
 
 
 def frame(func):
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        self._add_stack_frame(args[0].name.accept(self), args[0].name.lineno)
+        self._add_stack_frame(args[0].name.accept(self), args[0].name.lineno, args[0].slots)
         result = func(self, *args, **kwargs)
         self._drop_stack_frame()
         return result
@@ -28,6 +36,7 @@ def frame(func):
 
 
 def update_lineno(func):
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         self.lineno = args[0].lineno
         result = func(self, *args, **kwargs)
@@ -38,7 +47,7 @@ def update_lineno(func):
 
 class Interpreter:
     def __init__(self, error_handler_: ErrorHandler = None,
-                 debug_callback: Callable = mock_debug_callback) -> None:
+                 debug_callback: Callable = mock_debug_callback, memoizer: Memoizer = None) -> None:
         self.call_stack: list[StackFrame] = Stack()
         self.dropped_frame = None
         self.program_to_execute = None
@@ -51,13 +60,14 @@ class Interpreter:
         self.function_args = None
         self.in_loop = False
         self.lineno_update_enabled = True
-        self.__lineno = -1
+        self._lineno = -1
 
         self.error_handler = error_handler_
         if self.error_handler is None:
             self.error_handler = ErrorHandler(module="interpreter")
 
         self.debug_callback = debug_callback
+        self.memoizer = memoizer
 
         self._stopped = False
         atexit.register(self.stop)
@@ -77,7 +87,7 @@ class Interpreter:
         self.do_else = True
         self.function_args = None
         self.in_loop = False
-        self.__lineno = -1
+        self._lineno = -1
         self._stopped = False
         Turtle.id = Turtle.default_id
 
@@ -87,7 +97,7 @@ class Interpreter:
 
     @property
     def lineno(self) -> int:
-        return self.__lineno
+        return self._lineno
 
     @lineno.setter
     def lineno(self, lineno: int):
@@ -96,11 +106,11 @@ class Interpreter:
         if self.lineno_update_enabled:
             if lineno != self.lineno or self.in_loop:
                 self.curr_frame.lineno = lineno
-                self.__lineno = lineno
+                self._lineno = lineno
                 self.debug_callback()
 
-    def _add_stack_frame(self, fname: str = None, lineno: int = None):
-        self.call_stack.append(StackFrame(fname, lineno))
+    def _add_stack_frame(self, fname: str = None, lineno: int = None, slots: dict[str, int] = NO_SLOTS):
+        self.call_stack.append(StackFrame(fname, lineno, slots, len(self.call_stack)))
 
     def _drop_stack_frame(self):
         self.dropped_frame = self.call_stack.pop()
@@ -122,10 +132,10 @@ class Interpreter:
                 BuiltinFunctionShadowException(fun_name=name), self.call_stack
             )
         else:
-            self.curr_frame.locals[name] = value
+            self.call_stack[-1].set(name, value)
 
     def _get_local_var(self, var_name: str) -> Value | None:
-        return self.curr_frame.locals.get(var_name)
+        return self.call_stack[-1].get(var_name)
 
     def _get_builtin_global_or_local_var(self, name: str) -> Callable | Classes.Function | Value | None:
         try:
@@ -136,9 +146,14 @@ class Interpreter:
 
     def _get_variable_or_instant_value(self, obj) -> Value | Callable | Classes.Function | None:
         if type(obj) == Classes.Identifier:
-            identifier = obj.accept(self)
-            if (value := self._get_builtin_global_or_local_var(identifier)) is None:
-                self.error_handler.handle_error(NotDefinedException(name=identifier), self.call_stack)
+            if obj.binding == Binding.LOCAL:
+                value = self.call_stack[-1].get(obj.value)
+            elif obj.binding is None:
+                value = self._get_builtin_global_or_local_var(obj.value)
+            else:
+                value = obj.target
+            if value is None:
+                self.error_handler.handle_error(NotDefinedException(name=obj.value), self.call_stack)
         else:
             value = obj.accept(self)
         return value
@@ -152,7 +167,11 @@ class Interpreter:
         self.program_to_execute = program_to_execute
         if self.program_to_execute is None or len(self.program_to_execute.functions) == 0:
             self.error_handler.handle_error(NothingToRunException(), self.call_stack)
-        self.__lineno = program_to_execute.lineno
+        self._lineno = program_to_execute.lineno
+        Resolver().resolve(self.program_to_execute)
+        Linker(self.error_handler, self.builtins).link(self.program_to_execute)
+        if self.memoizer is not None:
+            self.memoizer.prepare(self.program_to_execute)
         self._add_functions_to_globals(self.program_to_execute)
         if start_with_fun_name in self.program_to_execute.functions.keys():
             self.start_with_fun = start_with_fun_name
@@ -161,10 +180,13 @@ class Interpreter:
         else:
             self.error_handler.handle_error(NotDefinedException(name=start_with_fun_name), self.call_stack)
         try:
-            self.program_globals[self.start_with_fun].accept(self)
+            self._run(self.program_globals[self.start_with_fun])
         except RecursionError:
             self.error_handler.handle_error(RecursionException(), self.call_stack)
 
+    def _run(self, function: Classes.Function):
+        function.accept(self)
+
     def visit_program(self, _):
         self.start_with_fun.accept(self)
 
@@ -182,7 +204,7 @@ class Interpreter:
                     ), self.call_stack
                 )
             for arg, param in zip(self.function_args, function.params):
-                self._set_local_var(param.accept(self), arg)
+                self._set_local_var(param.accept(self), box(arg))
 
         function.statements.accept(self)
         self.return_flag = False
@@ -198,14 +220,14 @@ class Interpreter:
 
     @staticmethod
     def visit_atom(atom: Classes.Atom):
-        return Value(atom.value)
+        return atom.value
 
     @staticmethod
     def visit_identifier(identifier: Classes.Identifier):
         return identifier.value
 
     def visit_list(self, list_: Classes.List):
-        return Value([self._get_variable_or_instant_value(el) for el in list_.value])
+        return [box(self._get_variable_or_instant_value(el)) for el in list_.value]
 
     @update_lineno
     def visit_if_statement(self, if_stmt: Classes.IfStatement):
@@ -240,17 +262,31 @@ class Interpreter:
         iterable = self._get_variable_or_instant_value(for_stmt.iterable)
         try:
             self.in_loop = True
+            if type(indices := unbox(iterable)) == range \
+                    and (slot := self.call_stack[-1].slots.get(iterator)) is not None:
+                self._run_counted_loop(for_stmt.statements, indices, slot)
+                return
             for i in iterable:
-                self._set_local_var(iterator, i)
+                self._set_local_var(iterator, box(i))
                 for_stmt.statements.accept(self)
                 if self.return_flag:
                     break
         except TypeError:
-            self.error_handler.handle_error(NotIterableException(type_name=type(iterable.value).__name__),
+            self.error_handler.handle_error(NotIterableException(type_name=type_name(iterable)),
                                             self.call_stack)
         finally:
             self.in_loop = False
 
+    def _run_counted_loop(self, statements: Classes.Block, indices: range, slot: int):
+        # Iterator shadowing a function is reported by Linker, so it's written straight to its slot.
+        # Its box is created for every index, as the previous one may be shared by a list or a variable
+        values = self.call_stack[-1].values
+        for index in indices:
+            values[slot] = Value(index)
+            statements.accept(self)
+            if self.return_flag:
+                break
+
     @update_lineno
     def visit_while_statement(self, while_stmt: Classes.WhileStatement):
         while while_stmt.condition.accept(self):
@@ -267,106 +303,104 @@ class Interpreter:
         if len(self.last_returned) == 0:
             self.last_returned = Value(None)
         elif len(self.last_returned) == 1:
-            self.last_returned = self.last_returned[0]
+            self.last_returned = box(self.last_returned[0])
 
     @update_lineno
     def visit_basic_assignment(self, assignment: Classes.BasicAssignment):
         if not self._is_assignable(assignment.left_expr):
             self.error_handler.handle_error(CannotAssignException(value=assignment.left_expr), self.call_stack)
         identifier = assignment.left_expr.accept(self)
-        value = self._get_variable_or_instant_value(assignment.right_expr)
-        if type(value) != Value:
-            value = Value(value)
-        self._set_local_var(identifier, value)
+        self._set_local_var(identifier, box(self._get_variable_or_instant_value(assignment.right_expr)))
 
     @update_lineno
     def visit_modifying_assignment(self, assignment: Classes.ModifyingAssignment):
-        operators = {
-            "+=": lambda a, b: a.__iadd__(b),
-            "-=": lambda a, b: a.__isub__(b),
-            "*=": lambda a, b: a.__imul__(b),
-            "/=": lambda a, b: a.__idiv__(b),
-            "%=": lambda a, b: a.__imod__(b),
-        }
         identifier = assignment.left_expr.accept(self)
         if (variable := self._get_local_var(identifier)) is None:
             self.error_handler.handle_error(NotDefinedException(name=identifier), self.call_stack)
         else:
             value = self._get_variable_or_instant_value(assignment.right_expr)
-            if type(value) != Value:
-                value = Value(value)
             try:
-                operators[assignment.operator](variable, value)
+                modifying_operators[assignment.operator](variable, value)
             except TypeError as e:
                 self.error_handler.handle_error(
-                    UnsupportedOperandException(l_type=type(variable).__name__, r_type=type(value).__name__,
+                    UnsupportedOperandException(l_type=type_name(variable), r_type=type_name(value),
                                                 operator=assignment.operator), self.call_stack
                 )
 
     @update_lineno
     def visit_one_sided_expression(self, expr: Classes.OneSidedExpression):
-        operators = {
-            "-": operator.neg,
-            "not": operator.not_,
-        }
         value = self._get_variable_or_instant_value(expr.value)
         result = None
         try:
-            result = operators[expr.operator](value)
+            result = one_sided_operators[expr.operator](value)
         except TypeError:
-            self.error_handler.handle_error(
-                BadOperandForUnaryException(type_name=type(value).__name__), self.call_stack)
+            self._handle_expression_error(BadOperandForUnaryException(type_name=type_name(value)), expr)
         return result
 
     @update_lineno
     def visit_two_sided_expression(self, expr: Classes.TwoSidedExpression):
-        operators = {
-            "==": operator.eq,
-            "!=": operator.ne,
-            "<": operator.lt,
-            "<=": operator.le,
-            ">": operator.gt,
-            ">=": operator.ge,
-            "and": lambda a, b: a and b,
-            "or": lambda a, b: a or b,
-            "in": lambda a, b: a in b,
-            "+": operator.add,
-            "-": operator.sub,
-            "*": operator.mul,
-            "/": operator.truediv,
-            "//": operator.floordiv,
-            "%": operator.mod,
-        }
+        if expr.operator in short_circuit_operators:
+            return self._visit_short_circuit_expression(expr)
         left = self._get_variable_or_instant_value(expr.left_expr)
         right = self._get_variable_or_instant_value(expr.right_expr)
         result = None
         try:
-            result = operators[expr.operator](left, right)
+            result = two_sided_operators[expr.operator](left, right)
         except (KeyError, TypeError) as e:
-            self.error_handler.handle_error(
-                UnsupportedOperandException(operator=expr.operator, l_type=type(left).__name__,
-                                            r_type=type(right).__name__), self.call_stack)
+            self._handle_expression_error(
+                UnsupportedOperandException(operator=expr.operator, l_type=type_name(left),
+                                            r_type=type_name(right)), expr)
         return result
 
+    def _handle_expression_error(self, error: TutelException, expr: Classes.Expression) -> None:
+        self.error_handler.handle_error(error, self.call_stack)
+
+    def _visit_short_circuit_expression(self, expr: Classes.TwoSidedExpression):
+        left = self._get_variable_or_instant_value(expr.left_expr)
+        if bool(left) == short_circuit_operators[expr.operator]:
+            return left
+        return self._get_variable_or_instant_value(expr.right_expr)
+
     @update_lineno
     def visit_dot_operator(self, obj: Classes.DotOperator):
         left = self._get_variable_or_instant_value(obj.left_expr)
-        right = obj.right_expr.accept(self)
         result = None
         try:
-            result = getattr(left, right)
+            result = obj.cache.get(left)
         except AttributeError:
-            self.error_handler.handle_error(AttributeException(type_name=type(left.value).__name__, value=right),
-                                            self.call_stack)
+            self._handle_expression_error(AttributeException(type_name=type_name(left),
+                                                             value=obj.right_expr.value), obj)
+        return result
+
+    @update_lineno
+    def visit_method(self, obj: Classes.DotOperator) -> tuple:
+        """Evaluates called DotOperator, methods are returned with their object instead of being bound."""
+        left = self._get_variable_or_instant_value(obj.left_expr)
+        result = None, UNBOUND
+        try:
+            result = obj.cache.get_method(left)
+        except AttributeError:
+            self._handle_expression_error(AttributeException(type_name=type_name(left),
+                                                             value=obj.right_expr.value), obj)
         return result
 
     @update_lineno
     def visit_fun_call(self, fun_call: Classes.FunCall):
-        function = self._get_variable_or_instant_value(fun_call.left_expr)
+        if fun_call.builtin is not None:
+            return self._call_builtin(
+                fun_call.builtin, [self._get_variable_or_instant_value(arg) for arg in fun_call.right_expr]
+            )
+        owner = UNBOUND
+        if type(fun_call.left_expr) == Classes.DotOperator:
+            function, owner = self.visit_method(fun_call.left_expr)
+        else:
+            function = self._get_variable_or_instant_value(fun_call.left_expr)
         arguments = []
         for arg in fun_call.right_expr:
             arguments.append(self._get_variable_or_instant_value(arg))
         if type(function) == Classes.Function:
+            if self.memoizer is not None and (cache := self.memoizer.caches.get(function.name.value)) is not None:
+                return self.memoizer.call(self, cache, function, arguments, self._call_function)
             try:
                 self.function_args = arguments
                 function.accept(self)
@@ -376,18 +410,38 @@ class Interpreter:
                 self.error_handler.handle_error(TypeException(err), self.call_stack)
         else:
             try:
-                result = function(*[arg.value for arg in arguments])
-                if type(result) != Value:
-                    result = Value(result)
-                return result
+                if owner is UNBOUND:
+                    return function(*[unbox(arg) for arg in arguments])
+                return function(owner, *[unbox(arg) for arg in arguments])
             except TypeError as e:
-                self.error_handler.handle_error(
-                    TypeException(e), self.call_stack
-                )
+                self._handle_expression_error(TypeException(e), fun_call)
             except Exception as e:
-                self.error_handler.handle_error(
-                    UnknownException(e), self.call_stack
-                )
+                self._handle_expression_error(UnknownException(e), fun_call)
+
+    def _call_builtin(self, builtin: Builtin, arguments: list):
+        if not builtin.accepts(len(arguments)):
+            self.error_handler.handle_error(
+                MismatchedArgsCountException(
+                    fun_name=builtin.name,
+                    expected_min=builtin.min_args,
+                    expected_max=builtin.max_args,
+                    got_number=len(arguments)
+                ), self.call_stack
+            )
+        try:
+            return builtin.call(arguments)
+        except TypeError as e:
+            self.error_handler.handle_error(TypeException(e), self.call_stack)
+        except Exception as e:
+            self.error_handler.handle_error(UnknownException(e), self.call_stack)
+
+    def _call_function(self, function: Classes.Function, arguments: list):
+        try:
+            self.function_args = arguments
+            function.accept(self)
+            return self.last_returned
+        except TypeError as err:
+            self.error_handler.handle_error(TypeException(err), self.call_stack)
 
     @update_lineno
     def visit_list_element(self, list_el: Classes.ListElement):
@@ -395,7 +449,7 @@ class Interpreter:
         index = self._get_variable_or_instant_value(list_el.right_expr)
         result = None
         try:
-            result = list_[index.value]
+            result = list_[unbox(index)]
         except IndexError:
-            self.error_handler.handle_error(OutOfRangeException(), self.call_stack)
+            self._handle_expression_error(OutOfRangeException(), list_el)
         return result
@@ -0,0 +1,112 @@
+from enum import IntEnum, auto
+from types import ModuleType
+
+from Tutel.common.ErrorHandler import ErrorHandler
+from Tutel.common.ErrorType import BuiltinFunctionShadowException
+from Tutel.core.InterpreterModule.AttributeCache import AttributeCache
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Builtin import find_builtin
+from Tutel.core.ParserModule import Classes
+
+
+# noinspection PyArgumentList
+class Binding(IntEnum):
+    LOCAL = auto()
+    BUILTIN = auto()
+    FUNCTION = auto()
+
+
+class Linker:
+    """
+    Binds every identifier of a program to a builtin, a function of the program or a local variable, in the same
+    order Interpreter looks names up: builtins, functions, locals. Binding and the bound object are stored on
+    the identifier, so names don't have to be looked up while the program runs. Calls of builtins get their
+    descriptors, attributes get their inline caches.
+    Parameters, loop iterators and assigned variables named like a function of the program are reported here.
+    """
+
+    def __init__(self, error_handler: ErrorHandler = None, builtins: ModuleType = TutelBuiltins) -> None:
+        self.error_handler = error_handler or ErrorHandler(module="linker")
+        self.builtins = builtins
+        self.functions: dict[str, Classes.Function] = {}
+
+    def link(self, program: Classes.Program) -> Classes.Program:
+        self.functions = program.functions
+        for function in program.functions.values():
+            for param in function.params:
+                self._bind_local(param)
+            self._link_block(function.statements)
+        return program
+
+    def _bind(self, identifier: Classes.Identifier) -> None:
+        name = identifier.value
+        if (builtin := getattr(self.builtins, name, None)) is not None:
+            identifier.binding, identifier.target = Binding.BUILTIN, builtin
+        elif (function := self.functions.get(name)) is not None:
+            identifier.binding, identifier.target = Binding.FUNCTION, function
+        else:
+            identifier.binding, identifier.target = Binding.LOCAL, None
+
+    def _bind_local(self, identifier) -> None:
+        if type(identifier) != Classes.Identifier:
+            self._link(identifier)
+            return
+        if identifier.value in self.functions:
+            self.error_handler.handle_error(BuiltinFunctionShadowException(fun_name=identifier.value))
+        self._bind(identifier)
+
+    def _link_block(self, block: Classes.Block) -> None:
+        for statement in block:
+            self._link(statement)
+
+    def _link(self, node) -> None:
+        if type(node) == Classes.Identifier:
+            self._bind(node)
+        elif isinstance(node, Classes.List):
+            for element in node.value:
+                self._link(element)
+        elif isinstance(node, Classes.Atom):
+            return
+        elif isinstance(node, Classes.BasicAssignment):
+            self._link(node.right_expr)
+            self._bind_local(node.left_expr)
+        elif isinstance(node, Classes.Assignment):
+            self._link(node.left_expr)
+            self._link(node.right_expr)
+        elif isinstance(node, Classes.FunCall):
+            self._link(node.left_expr)
+            callee = node.left_expr
+            if type(callee) == Classes.Identifier and callee.binding == Binding.BUILTIN:
+                node.builtin = find_builtin(callee.value, callee.target)
+            else:
+                node.builtin = None
+            for argument in node.right_expr:
+                self._link(argument)
+        elif isinstance(node, Classes.DotOperator):
+            # Right side is a name of an attribute
+            if node.cache is None:
+                node.cache = AttributeCache(node.right_expr.value)
+            self._link(node.left_expr)
+        elif isinstance(node, Classes.TwoSidedExpression):
+            self._link(node.left_expr)
+            self._link(node.right_expr)
+        elif isinstance(node, Classes.OneSidedExpression):
+            self._link(node.value)
+        elif isinstance(node, Classes.ReturnStatement):
+            for value in node.values:
+                self._link(value)
+        elif isinstance(node, Classes.IfStatement):
+            self._link(node.condition)
+            self._link_block(node.statements)
+            for elif_stmt in node.elif_stmts or []:
+                self._link(elif_stmt.condition)
+                self._link_block(elif_stmt.statements)
+            if node.else_stmt:
+                self._link_block(node.else_stmt)
+        elif isinstance(node, Classes.ForStatement):
+            self._bind_local(node.iterator)
+            self._link(node.iterable)
+            self._link_block(node.statements)
+        elif isinstance(node, Classes.WhileStatement):
+            self._link(node.condition)
+            self._link_block(node.statements)
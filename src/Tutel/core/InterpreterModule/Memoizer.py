@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from types import ModuleType, NoneType
+from typing import NamedTuple, Callable
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Value import Value, unbox
+from Tutel.core.ParserModule import Classes
+from Tutel.core.ParserModule.PurityAnalyzer import PurityAnalyzer
+
+DEFAULT_MEMOIZE_SIZE = 128
+# Types of arguments and results which can't be changed after they are cached
+MEMOIZED_TYPES = (int, float, str, bool, NoneType)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FunctionCache:
+    """Least recently used results of a single function."""
+
+    __slots__ = ("entries", "maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        self.entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> tuple | None:
+        if (entry := self.entries.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: tuple) -> None:
+        self.entries[key] = entry
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+
+class Memoizer:
+    """
+    Caches results of pure functions called with arguments of immutable types.
+    Interpreter state left by a call (else flag and loop flag) is cached with the result and restored on a hit.
+    Calls made while the return flag is set are not cached, the called function runs only its first statement then.
+    Call isn't cached either if the function or a function it called ended without return, then the result
+    is whatever was returned before, not something depending only on the arguments.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMOIZE_SIZE, builtins: ModuleType = TutelBuiltins) -> None:
+        self.maxsize = maxsize
+        self.builtins = builtins
+        self.caches: dict[str, FunctionCache] = {}
+        self._stale_returns = 0
+
+    def prepare(self, program: Classes.Program) -> None:
+        pure = PurityAnalyzer(self.builtins).analyse(program)
+        self.caches = {name: FunctionCache(self.maxsize) for name in program.functions if name in pure}
+        self._stale_returns = 0
+
+    def call(self, interpreter, cache: FunctionCache, function: Classes.Function, arguments: list,
+             call_function: Callable):
+        if interpreter.return_flag or (key := self._key(arguments)) is None:
+            return self._call(interpreter, function, arguments, call_function)
+        if (entry := cache.get(key)) is not None:
+            value, boxed, interpreter.do_else, interpreter.in_loop = entry
+            interpreter.last_returned = result = Value(value) if boxed else value
+            return result
+        stale_returns = self._stale_returns
+        result = self._call(interpreter, function, arguments, call_function)
+        boxed = type(result) == Value
+        value = result.value if boxed else result
+        # Returned Value of an argument would stop being shared with it when got from the cache
+        if self._stale_returns == stale_returns and type(value) in MEMOIZED_TYPES \
+                and all(result is not argument for argument in arguments):
+            cache.put(key, (value, boxed, interpreter.do_else, interpreter.in_loop))
+        return result
+
+    def _call(self, interpreter, function: Classes.Function, arguments: list, call_function: Callable):
+        last_returned = interpreter.last_returned
+        result = call_function(function, arguments)
+        if result is last_returned:
+            self._stale_returns += 1
+        return result
+
+    @staticmethod
+    def _key(arguments: list) -> tuple | None:
+        key = []
+        for argument in arguments:
+            if type(value := unbox(argument)) not in MEMOIZED_TYPES:
+                return None
+            # Equal values of different types, like 1 and true, give different results
+            key.append((type(value), value))
+        return tuple(key)
+
+    def stats(self) -> dict[str, CacheInfo]:
+        return {name: cache.info() for name, cache in self.caches.items()}
+
+    def __str__(self):
+        if not self.caches:
+            return "No pure functions to memoize"
+        lines = [f"{'function':<20} {'hits':>8} {'misses':>8} {'size':>12}"]
+        for name, info in self.stats().items():
+            lines.append(f"{name:<20} {info.hits:>8} {info.misses:>8} {f'{info.currsize}/{info.maxsize}':>12}")
+        return "\n".join(lines)
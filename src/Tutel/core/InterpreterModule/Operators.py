@@ -0,0 +1,39 @@
+import operator
+
+from Tutel.core.InterpreterModule.Value import unbox
+
+modifying_operators = {
+    "+=": lambda a, b: a.__iadd__(b),
+    "-=": lambda a, b: a.__isub__(b),
+    "*=": lambda a, b: a.__imul__(b),
+    "/=": lambda a, b: a.__idiv__(b),
+    "%=": lambda a, b: a.__imod__(b),
+}
+
+one_sided_operators = {
+    "-": operator.neg,
+    "not": operator.not_,
+}
+
+two_sided_operators = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda a, b: unbox(a) in b,
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+}
+
+# Right operand of these operators is evaluated only when truth of the left one doesn't decide the result,
+# the value is the truth of left operand which makes it the result
+short_circuit_operators = {
+    "and": False,
+    "or": True,
+}
@@ -0,0 +1,101 @@
+from Tutel.common.ErrorType import NotIterableException, Stop, TutelException
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Value import Value, box, unbox, type_name
+from Tutel.core.ParserModule import Classes
+
+
+class ReleaseInterpreter(Interpreter):
+    """
+    Interpreter without line tracking: visit methods don't go through lineno setter and never call debug callback.
+    Frames get the line of every statement run and of conditions of elif blocks and while loops, and the line
+    of an expression when it fails, so stack traces match the visitor. Stop requests are checked at function entry
+    and loop back-edges.
+    """
+
+    def _handle_expression_error(self, error: TutelException, expr: Classes.Expression) -> None:
+        # Statement may span many lines, the failing expression knows its own
+        self.call_stack[-1].lineno = expr.lineno
+        self.error_handler.handle_error(error, self.call_stack)
+
+    def _drop_stack_frame(self):
+        self.call_stack.pop()
+
+    def visit_function(self, function: Classes.Function):
+        if self._stopped:
+            raise Stop
+        self._add_stack_frame(function.name.value, function.name.lineno, function.slots)
+        self._visit_function(function)
+        self._drop_stack_frame()
+
+    _visit_function = Interpreter.visit_function.__wrapped__.__wrapped__
+    visit_if_statement = Interpreter.visit_if_statement.__wrapped__
+    visit_return_statement = Interpreter.visit_return_statement.__wrapped__
+    visit_basic_assignment = Interpreter.visit_basic_assignment.__wrapped__
+    visit_modifying_assignment = Interpreter.visit_modifying_assignment.__wrapped__
+    visit_one_sided_expression = Interpreter.visit_one_sided_expression.__wrapped__
+    visit_two_sided_expression = Interpreter.visit_two_sided_expression.__wrapped__
+    visit_dot_operator = Interpreter.visit_dot_operator.__wrapped__
+    visit_method = Interpreter.visit_method.__wrapped__
+    visit_fun_call = Interpreter.visit_fun_call.__wrapped__
+    visit_list_element = Interpreter.visit_list_element.__wrapped__
+
+    def visit_block(self, block: Classes.Block):
+        frame = self.call_stack[-1]
+        for statement in block:
+            frame.lineno = statement.lineno
+            statement.accept(self)
+            if self.return_flag:
+                break
+
+    def visit_elif_block(self, elif_block: Classes.ElifBlock):
+        self.call_stack[-1].lineno = elif_block.lineno
+        if elif_block.condition.accept(self):
+            elif_block.statements.accept(self)
+            self.do_else = False
+
+    def visit_else_block(self, else_block: Classes.ElseBlock):
+        self.visit_block(else_block)
+
+    def visit_for_statement(self, for_stmt: Classes.ForStatement):
+        iterator = for_stmt.iterator.accept(self)
+        iterable = self._get_variable_or_instant_value(for_stmt.iterable)
+        try:
+            self.in_loop = True
+            if type(indices := unbox(iterable)) == range \
+                    and (slot := self.call_stack[-1].slots.get(iterator)) is not None:
+                self._run_counted_loop(for_stmt.statements, indices, slot)
+                return
+            for i in iterable:
+                if self._stopped:
+                    raise Stop
+                self._set_local_var(iterator, box(i))
+                for_stmt.statements.accept(self)
+                if self.return_flag:
+                    break
+        except TypeError:
+            self.error_handler.handle_error(NotIterableException(type_name=type_name(iterable)),
+                                            self.call_stack)
+        finally:
+            self.in_loop = False
+
+    def _run_counted_loop(self, statements: Classes.Block, indices: range, slot: int):
+        values = self.call_stack[-1].values
+        for index in indices:
+            if self._stopped:
+                raise Stop
+            values[slot] = Value(index)
+            statements.accept(self)
+            if self.return_flag:
+                break
+
+    def visit_while_statement(self, while_stmt: Classes.WhileStatement):
+        frame, lineno = self.call_stack[-1], while_stmt.lineno
+        while while_stmt.condition.accept(self):
+            if self._stopped:
+                raise Stop
+            self.in_loop = True
+            while_stmt.statements.accept(self)
+            if self.return_flag:
+                break
+            frame.lineno = lineno
+        self.in_loop = False
@@ -6,14 +6,16 @@ class Stack(list):
 
 
 if __name__ == '__main__':
+    from Tutel.common.JsonSerializable import JsonSerializable
     from Tutel.core.InterpreterModule.StackFrame import StackFrame
     from Tutel.core.InterpreterModule.Value import Value
     import json
 
-    test = [StackFrame("main", 23)]
+    test = [StackFrame("main", 23, {"var": 0})]
     test[-1].locals["var"] = Value(25)
-    test.append(StackFrame("boo", 1))
-    print(json.dumps({"type": "stack_trace", "body": {"stack": test}}))
+    test.append(StackFrame("boo", 1, index=1))
+    print(json.dumps({"type": "stack_trace", "body": {"stack": test}},
+                     default=lambda o: o.to_json() if isinstance(o, JsonSerializable) else o))
 
     e = NotIterableException(str)
     print(json.dumps({"type": "post_mortem", "body": {"error": str(e)}}))
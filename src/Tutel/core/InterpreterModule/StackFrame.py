@@ -1,62 +1,99 @@
+from collections.abc import MutableMapping
+
 import Tutel.core as tutel
+from Tutel.common.JsonSerializable import JsonSerializable
 from Tutel.core.InterpreterModule.Value import Value
 
+NO_SLOTS: dict[str, int] = {}
 
-class StackFrame(dict):
-    index = 0
 
-    def __init__(self, name, lineno):
-        super().__init__()
-        self.index = StackFrame.index
-        StackFrame.index += 1
-        self.file = None
-        self.name = name
-        self.lineno = lineno
-        self.locals = {}
-        if tutel.VERBOSE:
-            print(f"Created frame {self.index}")
+class FrameLocals(MutableMapping, JsonSerializable):
+    """Dict view of local variables of a frame, bound slots are listed in slot order."""
 
-    @property
-    def file(self) -> str:
-        return self["file"]
+    __slots__ = ("_frame",)
 
-    @file.setter
-    def file(self, f):
-        self["file"] = f
+    def __init__(self, frame: "StackFrame"):
+        self._frame = frame
 
-    @property
-    def name(self) -> str:
-        return self["name"]
+    def __getitem__(self, name):
+        if (value := self._frame.get(name)) is None:
+            raise KeyError(name)
+        return value
 
-    @name.setter
-    def name(self, n):
-        self["name"] = n
+    def __setitem__(self, name, value):
+        self._frame.set(name, value)
 
-    @property
-    def lineno(self) -> int:
-        return self["lineno"]
+    def __delitem__(self, name):
+        if self._frame.get(name) is None:
+            raise KeyError(name)
+        self._frame.set(name, None)
+
+    def __iter__(self):
+        frame = self._frame
+        for name, slot in frame.slots.items():
+            if frame.values[slot] is not None:
+                yield name
+        if frame.unresolved:
+            yield from [name for name, value in frame.unresolved.items() if value is not None]
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def to_json(self):
+        return dict(self)
 
-    @lineno.setter
-    def lineno(self, lno):
-        self["lineno"] = lno
+
+class StackFrame(JsonSerializable):
+    """
+    Frame of a Tutel function call. Locals are kept in a list indexed by slots resolved by Resolver,
+    values of names without a slot are kept in unresolved dict. locals is a dict view of both.
+    """
+
+    __slots__ = ("index", "file", "name", "lineno", "slots", "values", "unresolved", "_locals")
+
+    def __init__(self, name, lineno, slots: dict[str, int] = NO_SLOTS, index: int = 0):
+        self.index = index
+        self.file = None
+        self.name = name
+        self.lineno = lineno
+        self.slots = slots
+        self.values: list[Value | None] = [None] * len(slots)
+        self.unresolved: dict | None = None
+        self._locals: FrameLocals | None = None
+        if tutel.VERBOSE:
+            print(f"Created frame {self.index}")
 
     @property
-    def locals(self) -> dict[str, Value]:
-        return self["locals"]
+    def locals(self) -> FrameLocals:
+        if self._locals is None:
+            self._locals = FrameLocals(self)
+        return self._locals
+
+    def get(self, name) -> Value | None:
+        if (slot := self.slots.get(name)) is not None:
+            return self.values[slot]
+        if self.unresolved is not None:
+            return self.unresolved.get(name)
+        return None
 
-    @locals.setter
-    def locals(self, loc):
-        self["locals"] = loc
+    def set(self, name, value) -> None:
+        if (slot := self.slots.get(name)) is not None:
+            self.values[slot] = value
+        else:
+            if self.unresolved is None:
+                self.unresolved = {}
+            self.unresolved[name] = value
 
     def increment_lineno(self):
         if tutel.VERBOSE:
             print(f"Frame {self.index}: {self.lineno} -> {self.lineno + 1}")
         self.lineno += 1
 
+    def to_json(self):
+        return {"file": self.file, "name": self.name, "lineno": self.lineno, "locals": self.locals}
+
     def __str__(self):
         return f"Function name: {self.name}\nLine number: {self.lineno}\nLocal variables: {self.locals}"
-
-    def __del__(self):
-        if tutel.VERBOSE:
-            print(f"Deleted frame {self.index}")
-        StackFrame.index -= 1
@@ -33,6 +33,14 @@ class Color(JsonSerializable):
             "b": self.b,
         }
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+        return self.__r == other.__r and self.__g == other.__g and self.__b == other.__b
+
+    def __hash__(self) -> int:
+        return hash((self.__r, self.__g, self.__b))
+
     def __repr__(self) -> str:
         return "{" + f'"r": {self.r}, ' \
                      f'"g": {self.g}, ' \
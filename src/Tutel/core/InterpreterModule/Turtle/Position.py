@@ -27,6 +27,14 @@ class Position(JsonSerializable):
             "y": self.y,
         }
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.__x == other.__x and self.__y == other.__y
+
+    def __hash__(self) -> int:
+        return hash((self.__x, self.__y))
+
     def __repr__(self) -> str:
         return "{" + f'"x": {self.x}, ' \
                      f'"y": {self.y}' + "}"
@@ -7,10 +7,30 @@ from Tutel.common.JsonSerializable import JsonSerializable
 from Tutel.core.InterpreterModule.Turtle.Orientation import Orientation
 from Tutel.core.InterpreterModule.Turtle.Position import Position
 
+# Sine and cosine of orientations in degrees, as used by Turtle.forward
+CARDINAL_DIRECTIONS = {0: (0.0, 1.0), 90: (1.0, 0.0), 180: (0.0, -1.0), 270: (-1.0, 0.0)}
+
+
+def compute_direction(orientation) -> tuple[float, float]:
+    radians = (orientation / 360) * 2 * math.pi
+    return math.sin(radians), math.cos(radians)
+
+
+# Every integer orientation, cardinal directions are exact so moving along them doesn't accumulate errors
+DIRECTIONS = [CARDINAL_DIRECTIONS.get(orientation) or compute_direction(orientation) for orientation in range(360)]
+
+
+def direction(orientation) -> tuple[float, float]:
+    if isinstance(orientation, int):
+        return DIRECTIONS[orientation % 360]
+    return compute_direction(orientation)
+
 
 class Turtle(JsonSerializable):
     default_id = 0
     id = 0
+    # State changes of all turtles not sent to GUI, since they wouldn't change anything
+    suppressed_commands = 0
 
     def __init__(self):
         self.__color = Color(255, 0, 0)
@@ -35,7 +55,9 @@ class Turtle(JsonSerializable):
     @color.setter
     def color(self, color: Color):
         if color is not None:
-            if GuiModule.GUI.set_color(self.id, color) or type(GuiModule.GUI) == GuiInterface:
+            if color == self.__color:
+                Turtle.suppressed_commands += 1
+            elif GuiModule.GUI.set_color(self.id, color) or type(GuiModule.GUI) == GuiInterface:
                 self.__color = color
 
     def set_color(self, color: Color):
@@ -43,6 +65,7 @@ class Turtle(JsonSerializable):
 
     @property
     def position(self) -> Position:
+        GuiModule.GUI.sync(self.id)
         return self.__position
 
     @position.setter
@@ -51,7 +74,9 @@ class Turtle(JsonSerializable):
 
     def set_position(self, position: Position):
         if position is not None:
-            if GuiModule.GUI.set_position(self.id, position) or type(GuiModule.GUI) == GuiInterface:
+            if position == self.__position:
+                Turtle.suppressed_commands += 1
+            elif GuiModule.GUI.set_position(self.id, position) or type(GuiModule.GUI) == GuiInterface:
                 self.position = position
 
     @property
@@ -62,7 +87,9 @@ class Turtle(JsonSerializable):
     def orientation(self, orientation: Orientation):
         if orientation is not None:
             orientation = Orientation(int(orientation % 360))
-            if GuiModule.GUI.set_orientation(self.id, orientation) or type(GuiModule.GUI) == GuiInterface:
+            if orientation == self.__orientation:
+                Turtle.suppressed_commands += 1
+            elif GuiModule.GUI.set_orientation(self.id, orientation) or type(GuiModule.GUI) == GuiInterface:
                 self.__orientation = orientation
 
     def set_orientation(self, orientation: int):
@@ -78,10 +105,12 @@ class Turtle(JsonSerializable):
         if self.__init_state:
             self.__init_state = False
         if a is not None:
-            new_position = Position(
-                x=self.position.x + math.sin((self.orientation / 360) * 2 * math.pi) * a,
-                y=self.position.y + math.cos((self.orientation / 360) * 2 * math.pi) * a
-            )
+            orientation = self.__orientation
+            if type(orientation) is Orientation:
+                sin, cos = DIRECTIONS[orientation]
+            else:
+                sin, cos = direction(orientation)
+            new_position = Position(x=self.__position.x + sin * a, y=self.__position.y + cos * a)
             if GuiModule.GUI.go_forward(self.id, new_position) or type(GuiModule.GUI) == GuiInterface:
                 self.position = new_position
 
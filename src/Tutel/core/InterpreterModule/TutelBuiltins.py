@@ -1,62 +1,66 @@
 import time
 import builtins
 
+from Tutel.core import GuiModule
 from Tutel.core.InterpreterModule.Turtle.Color import Color
 from Tutel.core.InterpreterModule.Turtle.Position import Position
 from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
-from Tutel.core.InterpreterModule.Value import Value
 
 
+# Buffered GUI commands are flushed first, so they're shown before the output, the prompt or the pause
 def print(*args) -> None:
+    GuiModule.GUI.flush()
     builtins.print(*args)
 
 
 def input(*args) -> str:
+    GuiModule.GUI.flush()
     return builtins.input(*args)
 
 
 def sleep(sec: int) -> None:
+    GuiModule.GUI.flush()
     time.sleep(sec)
 
 
-def type(*args) -> Value[str]:
-    return Value(builtins.type(*args).__name__)
+def type(*args) -> str:
+    return builtins.type(*args).__name__
 
 
-def hex(number) -> Value[str]:
-    return Value(builtins.hex(number))
+def hex(number) -> str:
+    return builtins.hex(number)
 
 
-def min(*args) -> Value:
-    return Value(builtins.min(args))
+def min(*args):
+    return builtins.min(args)
 
 
-def max(*args) -> Value:
-    return Value(builtins.max(args))
+def max(*args):
+    return builtins.max(args)
 
 
-def abs(number: Value) -> Value:
-    return Value(builtins.abs(number))
+def abs(number):
+    return builtins.abs(number)
 
 
-def range(*args) -> Value[range]:
-    return Value(builtins.range(*args))
+def range(*args) -> range:
+    return builtins.range(*args)
 
 
-def len(obj) -> Value[int]:
-    return Value(builtins.len(obj))
+def len(obj) -> int:
+    return builtins.len(obj)
 
 
-def pow(exp: int, mod: int) -> Value[int]:
-    return Value(builtins.pow(exp, mod))
+def pow(exp: int, mod: int) -> int:
+    return builtins.pow(exp, mod)
 
 
 def str(*args):
     return builtins.str(*args)
 
 
-def int(*args) -> Value[int]:
-    return Value(builtins.int(*args))
+def int(*args) -> int:
+    return builtins.int(*args)
 
 
 Turtle = Turtle.turtle_init
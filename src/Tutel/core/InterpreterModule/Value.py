@@ -5,22 +5,15 @@ from Tutel.common.JsonSerializable import JsonSerializable
 T = TypeVar("T")
 
 
-class ValueIterator:
-    def __init__(self, obj: "Value"):
-        self._value_obj = obj
-        self._index = 0
-
-    def __next__(self):
-        if self._index < len(self._value_obj):
-            result = self._value_obj[self._index]
-            if type(result) != Value:
-                result = Value(result)
-            self._index += 1
-            return result
-        raise StopIteration
+class Value(Generic[T], JsonSerializable):
+    """
+    Box of a value which can be shared. Values flow through expressions unboxed, they are boxed only when stored
+    in a variable, a list or a parameter, or returned from a function, so aliases of a variable see its changes.
+    Operators take boxed and unboxed operands and give unboxed results, in-place operators change the box.
+    """
 
+    __slots__ = ("value",)
 
-class Value(Generic[T], JsonSerializable):
     def __init__(self, value: T) -> None:
         self.value: T = value
 
@@ -34,7 +27,7 @@ class Value(Generic[T], JsonSerializable):
         return self.value(*args, **kwargs)
 
     def __getitem__(self, item):
-        return self.value[item] if type(self.value[item]) == Value else Value(self.value[item])
+        return self.value[item]
 
     def __getattr__(self, item):
         return getattr(self.value, item)
@@ -43,67 +36,85 @@ class Value(Generic[T], JsonSerializable):
         return len(self.value)
 
     def __iter__(self):
-        return ValueIterator(self)
+        return iter(self.value)
 
     def __neg__(self):
-        return Value(-self.value)
+        return -self.value
 
     def __add__(self, other):
-        return Value(self.value + other.value)
+        return self.value + unbox(other)
+
+    def __radd__(self, other):
+        return other + self.value
 
     def __iadd__(self, other) -> None:
-        self.value += other.value
+        self.value += unbox(other)
 
     def __sub__(self, other):
-        return Value(self.value - other.value)
+        return self.value - unbox(other)
+
+    def __rsub__(self, other):
+        return other - self.value
 
     def __isub__(self, other) -> None:
-        self.value -= other.value
+        self.value -= unbox(other)
 
     def __mul__(self, other):
-        return Value(self.value * other.value)
+        return self.value * unbox(other)
+
+    def __rmul__(self, other):
+        return other * self.value
 
     def __imul__(self, other) -> None:
-        self.value *= other.value
+        self.value *= unbox(other)
 
     def __truediv__(self, other):
-        return Value(self.value / other.value)
+        return self.value / unbox(other)
+
+    def __rtruediv__(self, other):
+        return other / self.value
 
     def __idiv__(self, other) -> None:
-        self.value /= other.value
+        self.value /= unbox(other)
 
     def __floordiv__(self, other):
-        return Value(self.value // other.value)
+        return self.value // unbox(other)
+
+    def __rfloordiv__(self, other):
+        return other // self.value
 
     def __mod__(self, other):
-        return Value(self.value % other.value)
+        return self.value % unbox(other)
+
+    def __rmod__(self, other):
+        return other % self.value
 
     def __imod__(self, other) -> None:
-        self.value %= other.value
+        self.value %= unbox(other)
 
     def __contains__(self, item) -> bool:
-        return item in self.value
+        return unbox(item) in self.value
 
     def __bool__(self) -> bool:
         return bool(self.value)
 
     def __eq__(self, other) -> bool:
-        return self.value == other.value
+        return self.value == unbox(other)
 
     def __ne__(self, other) -> bool:
-        return self.value != other.value
+        return self.value != unbox(other)
 
     def __gt__(self, other) -> bool:
-        return self.value > other.value
+        return self.value > unbox(other)
 
     def __ge__(self, other) -> bool:
-        return self.value >= other.value
+        return self.value >= unbox(other)
 
     def __lt__(self, other) -> bool:
-        return self.value < other.value
+        return self.value < unbox(other)
 
     def __le__(self, other) -> bool:
-        return self.value <= other.value
+        return self.value <= unbox(other)
 
     def __hash__(self) -> int:
         return hash(self.value)
@@ -119,3 +130,16 @@ class Value(Generic[T], JsonSerializable):
 
     def __abs__(self) -> int:
         return abs(self.value)
+
+
+def box(value) -> Value:
+    return value if type(value) is Value else Value(value)
+
+
+def unbox(value):
+    return value.value if type(value) is Value else value
+
+
+def type_name(value) -> str:
+    """Name of the type of a value reported in errors, the same for boxed and unboxed value."""
+    return type(unbox(value)).__name__
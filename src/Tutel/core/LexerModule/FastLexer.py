@@ -0,0 +1,231 @@
+import functools
+import re
+
+from Tutel.common.ErrorHandler import ErrorHandler
+from Tutel.common.ErrorType import (
+    UnknownTokenLexerException,
+    CommentTooLongLexerException,
+    IdentifierTooLongLexerException,
+    UnterminatedStringLexerException,
+    TextConstTooLongLexerException,
+    UnknownEscapingLexerException,
+    LeadingZerosInIntegerLexerException,
+    IntegerTooLargeLexerException,
+)
+from Tutel.common.Source import SourceType, read_text, ETX
+from Tutel.core.LexerModule.Constants import MAX_IDENTIFIER_LENGTH, MAX_TEXT_CONST_LENGTH, MAX_COMMENT_LENGTH, MAX_INTEGER
+from Tutel.core.LexerModule.Tokens import Token, TokenType, operator_parts, operators, escaped_chars, keywords
+
+# Source treats "\r\n" and "\n\r" as a single line break, only the first character is ever seen by the lexer
+_LINE_BREAK_PAIRS = re.compile(r"\r\n|\n\r")
+_LINE_BREAKS = re.compile(r"[\n\r]")
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<identifier>[A-Za-z_]\w*)"
+    r"|(?P<number>[1-9][0-9]{0,8}(?!\d)|0(?!\d))"
+    r"|(?P<text_const>\"[^\"\\\n\x03]*\"|'[^'\\\n\x03]*')"
+    r"|(?P<comment>#[^\n\x03]*)"
+    r"|(?P<operator>" + "|".join(re.escape(op) for op in sorted(operators, key=len, reverse=True)) + ")"
+    r")?"
+)
+# Skips the Python level Token.__new__ and enum lookups on the hot path
+_new_token = functools.partial(tuple.__new__, Token)
+_T_IDENTIFIER = TokenType.T_IDENTIFIER
+_T_NUMBER = TokenType.T_NUMBER
+_T_TEXT_CONST = TokenType.T_TEXT_CONST
+_T_COMMENT = TokenType.T_COMMENT
+
+
+class FastLexer:
+    def __init__(self, source: SourceType, error_handler: ErrorHandler = ErrorHandler(module="lexer")):
+        self.starting_at_line = None
+        self.starting_at_column = None
+        self._error_handler = error_handler
+        self.token = None
+        text = read_text(source)
+        if "\r" in text:
+            text = _LINE_BREAK_PAIRS.sub(lambda match: match.group()[0], text)
+        self.text = text
+        self._length = len(text)
+        self._position = 0
+        self._line = 1
+        self._line_start = 0
+        self._line_breaks = [match.start() for match in _LINE_BREAKS.finditer(text)]
+        self._line_breaks.append(self._length)
+        self._next_break = self._line_breaks[0]
+        self._tokens = self._scan()
+
+    def get_next_token(self) -> Token:
+        self.token = next(self._tokens)
+        return self.token
+
+    def _scan(self):
+        text = self.text
+        length = self._length
+        match_token = _TOKEN.match
+        while True:
+            match = match_token(text, self._position)
+            kind = match.lastgroup
+            start = match.start(kind) if kind else match.end()
+            if start > self._next_break:
+                self._pass_line_breaks(start)
+            self._position = start
+            self.starting_at_line = line = self._line
+            self.starting_at_column = column = start - self._line_start + 1
+
+            if kind is None:
+                if start >= length or text[start] == ETX:
+                    yield Token(TokenType.T_ETX, ETX, line, column)
+                else:
+                    yield self._build_slow()
+                continue
+
+            value = match.group(kind)
+            if kind == "identifier":
+                if len(value) > MAX_IDENTIFIER_LENGTH:
+                    yield self._build_long_identifier()
+                    continue
+                token_type = keywords.get(value, _T_IDENTIFIER)
+            elif kind == "operator":
+                token_type = operators[value]
+            elif kind == "number":
+                token_type = _T_NUMBER
+                value = int(value)
+            elif kind == "text_const":
+                if len(value) - 2 > MAX_TEXT_CONST_LENGTH:
+                    yield self._build_escaped_text_const(value[0])
+                    continue
+                token_type = _T_TEXT_CONST
+                value = value[1:-1]
+            else:
+                if len(value) - 1 > MAX_COMMENT_LENGTH:
+                    yield self._build_long_comment()
+                    continue
+                token_type = _T_COMMENT
+                value = value[1:]
+            self._position = end = match.end()
+            if end > self._next_break:
+                self._pass_line_breaks(end)
+                line = self._line
+            yield _new_token((token_type, value, line, column))
+
+    def _pass_line_breaks(self, end: int) -> None:
+        line_breaks = self._line_breaks
+        index = self._line - 1
+        while line_breaks[index] < end:
+            self._line_start = line_breaks[index] + 1
+            index += 1
+        self._line = index + 1
+        self._next_break = line_breaks[index]
+
+    def _advance_to(self, end: int) -> None:
+        if end > self._next_break:
+            self._pass_line_breaks(end)
+        self._position = end
+
+    def _line_column(self, index: int) -> tuple[int, int]:
+        line, line_start = self._line, self._line_start
+        while self._line_breaks[line - 1] < min(index, self._length):
+            line_start = self._line_breaks[line - 1] + 1
+            line += 1
+        return line, index - line_start + 1
+
+    def _char_at(self, index: int) -> str:
+        return self.text[index] if index < self._length else ETX
+
+    def _error(self, token: Token, exception_type: type) -> None:
+        self.token = token
+        self._error_handler.handle_error(exception_type(token))
+
+    def _build_slow(self) -> Token:
+        """Handles everything the master pattern leaves out, character by character like Lexer does."""
+        char = self.text[self._position]
+        if char == "#":
+            return self._build_long_comment()
+        if char.isalpha() or char == "_":
+            return self._build_long_identifier()
+        if char in ['"', '\'']:
+            return self._build_escaped_text_const(char)
+        if char.isdecimal():
+            return self._build_checked_number()
+        if char in operator_parts:
+            operator = char
+            if operator + self._char_at(self._position + 1) in operators:
+                operator += self._char_at(self._position + 1)
+            token_type = operators[operator]
+            self._advance_to(self._position + len(operator))
+            return Token(token_type, operator, self._line, self.starting_at_column)
+
+        line, column = self._line_column(self._position)
+        self._error(Token(TokenType.T_UNKNOWN, char, line, column), UnknownTokenLexerException)
+
+    def _build_long_comment(self) -> Token:
+        end = self._position + 1
+        while self._char_at(end) not in ['\n', ETX] and end - self._position - 1 <= MAX_COMMENT_LENGTH:
+            end += 1
+        comment = self.text[self._position + 1:end]
+        if len(comment) > MAX_COMMENT_LENGTH:
+            line, _ = self._line_column(end)
+            self._error(Token(TokenType.T_ILLEGAL, comment[:-1], line, self.starting_at_column),
+                        CommentTooLongLexerException)
+        self._advance_to(end)
+        return Token(TokenType.T_COMMENT, comment, self._line, self.starting_at_column)
+
+    def _build_long_identifier(self) -> Token:
+        end = self._position + 1
+        while True:
+            char = self._char_at(end)
+            if not (char.isalnum() or char == "_" and end - self._position <= MAX_IDENTIFIER_LENGTH):
+                break
+            end += 1
+        identifier = self.text[self._position:end]
+        if len(identifier) > MAX_IDENTIFIER_LENGTH:
+            line, _ = self._line_column(end)
+            self._error(Token(TokenType.T_ILLEGAL, identifier[:-1], line, self.starting_at_column),
+                        IdentifierTooLongLexerException)
+        self._advance_to(end)
+        return Token(keywords.get(identifier, TokenType.T_IDENTIFIER), identifier, self._line, self.starting_at_column)
+
+    def _build_escaped_text_const(self, surrounded_by: str) -> Token:
+        index = self._position + 1
+        text_const = []
+        while (char := self._char_at(index)) != surrounded_by and len(text_const) <= MAX_TEXT_CONST_LENGTH:
+            if char in ['\n', ETX]:
+                line, column = self._line_column(index)
+                self._error(Token(TokenType.T_ILLEGAL, "".join(text_const + [char]), line, column),
+                            UnterminatedStringLexerException)
+            if char == "\\":
+                index += 1
+                char = self._char_at(index)
+                if escaped := escaped_chars.get(char):
+                    text_const.append(escaped)
+                else:
+                    line, column = self._line_column(index)
+                    self._error(Token(TokenType.T_ILLEGAL, "\\" + char, line, column - 1),
+                                UnknownEscapingLexerException)
+            else:
+                text_const.append(char)
+            index += 1
+        text_const = "".join(text_const)
+        if len(text_const) > MAX_TEXT_CONST_LENGTH:
+            line, _ = self._line_column(index)
+            self._error(Token(TokenType.T_ILLEGAL, text_const[:-1], line, self.starting_at_column),
+                        TextConstTooLongLexerException)
+        self._advance_to(index + 1)
+        return Token(TokenType.T_TEXT_CONST, text_const, self._line, self.starting_at_column)
+
+    def _build_checked_number(self) -> Token:
+        index = self._position + 1
+        number = int(self.text[self._position])
+        while (char := self._char_at(index)).isdecimal() and number <= MAX_INTEGER:
+            if number == 0 and int(char) != 0:
+                line, column = self._line_column(index)
+                self._error(Token(TokenType.T_ILLEGAL, char, line, column), LeadingZerosInIntegerLexerException)
+            number = number * 10 + int(char)
+            index += 1
+        if number > MAX_INTEGER:
+            line, _ = self._line_column(index)
+            self._error(Token(TokenType.T_ILLEGAL, number, line, self.starting_at_column),
+                        IntegerTooLargeLexerException)
+        self._advance_to(index)
+        return Token(TokenType.T_NUMBER, number, self._line, self.starting_at_column)
@@ -1,6 +1,3 @@
-from io import StringIO
-from typing import TextIO
-
 from Tutel.common.ErrorHandler import ErrorHandler
 from \
     Tutel.common.ErrorType import (
@@ -15,35 +12,13 @@ from \
 )
 from Tutel.core.LexerModule.Constants import MAX_IDENTIFIER_LENGTH, MAX_TEXT_CONST_LENGTH, MAX_COMMENT_LENGTH, MAX_INTEGER
 from \
-    Tutel.common.Source import Source
+    Tutel.common.Source import Source, SourceType
 from \
     Tutel.core.LexerModule.Tokens import Token, TokenType, operator_parts, operators, escaped_chars, keywords
 
 
-def get_bp_possible_lines(code: str) -> set[int]:
-    result = set()
-    lines = {}
-
-    lexer = Lexer(StringIO(code))
-    while (token := lexer.get_next_token()) and token.type != TokenType.T_ETX:
-        if token.line not in lines:
-            lines[token.line] = [token]
-        else:
-            lines[token.line].append(token)
-
-    for line in lines:
-        bp_possible = False
-        for token in lines[line]:
-            if token.type not in [TokenType.T_COMMENT, TokenType.T_LEFT_CURLY_BRACKET, TokenType.T_RIGHT_CURLY_BRACKET]:
-                bp_possible = True
-        if bp_possible:
-            result.add(line)
-
-    return result
-
-
 class Lexer:
-    def __init__(self, source: TextIO, error_handler: ErrorHandler = ErrorHandler(module="lexer")):
+    def __init__(self, source: SourceType, error_handler: ErrorHandler = ErrorHandler(module="lexer")):
         self.starting_at_line = None
         self.starting_at_column = None
         self._error_handler = error_handler
@@ -0,0 +1,79 @@
+from array import array
+from typing import Iterator
+
+from Tutel.common.ErrorType import LexerException
+from Tutel.common.Source import SourceType
+from Tutel.core.LexerModule.FastLexer import FastLexer
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.LexerModule.Tokens import Token, TokenType, TOKEN_VALUE_TYPES
+
+_TOKEN_TYPES = {token_type.value: token_type for token_type in TokenType}
+_NO_BREAKPOINT_TYPES = {token_type.value for token_type in
+                        [TokenType.T_COMMENT, TokenType.T_LEFT_CURLY_BRACKET, TokenType.T_RIGHT_CURLY_BRACKET]}
+
+
+def get_bp_possible_lines(tokens: "TokenBuffer | SourceType") -> set[int]:
+    if not isinstance(tokens, TokenBuffer):
+        tokens = TokenBuffer(Lexer(tokens))
+    tokens.fill()
+
+    # The last token is always ETX
+    return {line for token_type, line in zip(tokens.types[:-1], tokens.lines) if token_type not in _NO_BREAKPOINT_TYPES}
+
+
+class TokenBuffer:
+    """
+    Tokens of a single source text stored in parallel arrays.
+    Tokens are pulled from the lexer only when asked for, so lexer errors surface at the same point as before,
+    and every next consumer reads the stored tokens (or gets the stored error) instead of lexing again.
+    """
+
+    def __init__(self, lexer: Lexer | FastLexer):
+        self.types = array("B")
+        self.values: list[TOKEN_VALUE_TYPES] = []
+        self.lines = array("I")
+        self.columns = array("I")
+        self._lexer = lexer
+        self._error: LexerException | None = None
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        if index >= len(self.types) and not self.fill(index):
+            index = len(self.types) - 1
+        return Token(_TOKEN_TYPES[self.types[index]], self.values[index], self.lines[index], self.columns[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        index = 0
+        while self.fill(index):
+            yield self[index]
+            index += 1
+
+    @property
+    def complete(self) -> bool:
+        return self._lexer is None
+
+    def fill(self, index: int = None) -> bool:
+        """Lexes up to the token at given index (or the whole source), returns False if there is no such token."""
+        while index is None or len(self.types) <= index:
+            if self._lexer is None:
+                if self._error is not None:
+                    raise self._error
+                return index is None
+            self._read_token()
+        return True
+
+    def _read_token(self) -> None:
+        try:
+            token = self._lexer.get_next_token()
+        except LexerException as e:
+            self._lexer = None
+            self._error = e
+            raise e
+        self.types.append(token.type.value)
+        self.values.append(token.value)
+        self.lines.append(token.line)
+        self.columns.append(token.column)
+        if token.type == TokenType.T_ETX:
+            self._lexer = None
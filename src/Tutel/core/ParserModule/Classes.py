@@ -31,6 +31,8 @@ class Function(Visited):
         self.name = name
         self.params = params
         self.statements = statements
+        # Slot index of every local variable, set by Resolver
+        self.slots: dict[str, int] | None = None
 
     def accept(self, visitor):
         return visitor.visit_function(self)
@@ -399,12 +401,19 @@ class DotOperator(TwoSidedExpression, Assignable):
     def __init__(self, left_expr: "Expression", right_expr: "Expression", lineno: int) -> None:
         super().__init__(left_expr, right_expr, lineno)
         self.operator = "."
+        # Inline cache of the attribute, set by Linker
+        self.cache = None
 
     def accept(self, visitor):
         return visitor.visit_dot_operator(self)
 
 
 class FunCall(TwoSidedExpression, Assignable):
+    def __init__(self, left_expr: "Expression", right_expr: "Expression", lineno: int) -> None:
+        super().__init__(left_expr, right_expr, lineno)
+        # Descriptor of the builtin called, set by Linker
+        self.builtin = None
+
     def __repr__(self):
         return f"{type(self).__name__}({self.left_expr}, {self.right_expr}, lineno={self.lineno})"
 
@@ -472,6 +481,9 @@ class Null(Atom):
 class Identifier(Atom, Assignable):
     def __init__(self, value: str, lineno: int) -> None:
         super().__init__(value, lineno)
+        # What the name refers to and the builtin or function it's bound to, set by Linker
+        self.binding = None
+        self.target = None
 
     def __repr__(self):
         return f"{type(self).__name__}(\"{self.value}\", lineno={self.lineno})"
@@ -0,0 +1,278 @@
+from types import ModuleType
+from typing import NamedTuple
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.ParserModule import Classes
+from Tutel.core.ParserModule.Optimizer import CONSTANTS
+
+
+class DeadCode(NamedTuple):
+    function: str
+    first_line: int
+    last_line: int
+    description: str
+
+    def __str__(self):
+        lines = f"line {self.first_line}" if self.first_line == self.last_line \
+            else f"lines {self.first_line}-{self.last_line}"
+        return f"{self.function}, {lines}: {self.description}"
+
+
+class DeadCodeReport:
+    def __init__(self) -> None:
+        self.removed: list[DeadCode] = []
+        # Lines on which only removed code was written
+        self.dead_lines: set[int] = set()
+
+    def __str__(self):
+        if not self.removed:
+            return "No dead code found"
+        removed = sorted(self.removed, key=lambda dead_code: (dead_code.first_line, dead_code.last_line))
+        return "\n".join(["Dead code removed:"] + [f"  {dead_code}" for dead_code in removed])
+
+
+class DeadCodeEliminator:
+    """
+    Removes statements following a return, branches of if statements which can't be taken, loops which never run
+    and functions which can't be called from main.
+    Interpreter keeps else flag and return flag between statements, so a function called while evaluating a condition
+    or a returned value sees state left by its statements. Statements which would run in such a function are kept.
+    Code binding a name of a function is never removed, so it's still reported by Linker.
+    """
+
+    def __init__(self, builtins: ModuleType = TutelBuiltins) -> None:
+        self.builtins = builtins
+        self.functions: dict[str, Classes.Function] = {}
+        self.report = DeadCodeReport()
+        self._function_name = ""
+        self._state_observed = False
+        self._removed_lines: set[int] = set()
+
+    def eliminate(self, program: Classes.Program) -> DeadCodeReport:
+        self.functions = program.functions
+        self.report = DeadCodeReport()
+        self._removed_lines = set()
+        observing = self._observing_functions()
+        for name, function in program.functions.items():
+            self._function_name = name
+            self._state_observed = name in observing
+            self._block(function.statements)
+        self._remove_unreachable_functions(program)
+        self.report.dead_lines = self._removed_lines - self._lines(program)
+        return self.report
+
+    def _block(self, block: Classes.Block) -> None:
+        statements = []
+        unreachable = False
+        for statement in block:
+            if unreachable and self._remove(statement, "statement after return"):
+                continue
+            kept = self._statement(statement)
+            unreachable = unreachable or any(self._always_returns(kept_statement) for kept_statement in kept)
+            statements.extend(kept)
+        block[:] = statements
+
+    def _statement(self, statement) -> list:
+        if isinstance(statement, Classes.IfStatement):
+            return self._if_statement(statement)
+        if isinstance(statement, Classes.WhileStatement):
+            if not self._state_observed and self._is_false(statement.condition) \
+                    and self._remove(statement, "while loop with false condition"):
+                return []
+            self._block(statement.statements)
+        elif isinstance(statement, Classes.ForStatement):
+            if not self._state_observed and type(statement.iterable) == Classes.List and not statement.iterable.value \
+                    and self._remove(statement, "for loop over empty list"):
+                return []
+            self._block(statement.statements)
+        return [statement]
+
+    def _if_statement(self, if_stmt: Classes.IfStatement) -> list:
+        if self._is_true(if_stmt.condition):
+            if_stmt.elif_stmts = [
+                elif_stmt for elif_stmt in if_stmt.elif_stmts
+                if not self._remove(elif_stmt, "elif branch after true condition")
+            ]
+            if if_stmt.else_stmt and self._remove(if_stmt.else_stmt, "else branch after true condition"):
+                if_stmt.else_stmt = None
+        elif not self._state_observed:
+            # Every elif is checked, removing one which is never taken would skip return flag check after it
+            if_stmt.elif_stmts = [
+                elif_stmt for elif_stmt in if_stmt.elif_stmts
+                if not (self._is_false(elif_stmt.condition)
+                        and self._remove(elif_stmt, "elif branch with false condition"))
+            ]
+        if if_stmt.else_stmt and not self._state_observed and self._else_skipped(if_stmt) \
+                and self._remove(if_stmt.else_stmt, "else branch after true elif condition"):
+            if_stmt.else_stmt = None
+
+        if not self._is_false(if_stmt.condition):
+            self._block(if_stmt.statements)
+        for elif_stmt in if_stmt.elif_stmts:
+            self._block(elif_stmt.statements)
+        if if_stmt.else_stmt:
+            self._block(if_stmt.else_stmt)
+
+        if not self._is_false(if_stmt.condition):
+            return [if_stmt]
+        if not self._state_observed and not if_stmt.elif_stmts and not if_stmt.else_stmt \
+                and self._remove(if_stmt, "if statement with false condition"):
+            return []
+        if not self._state_observed and not if_stmt.elif_stmts and if_stmt.else_stmt \
+                and self._remove(if_stmt.statements, "if branch with false condition",
+                                 {if_stmt.lineno, if_stmt.else_stmt.lineno}):
+            return list(if_stmt.else_stmt)
+        if len(if_stmt.elif_stmts) == 1 \
+                and self._remove(if_stmt.statements, "if branch with false condition", {if_stmt.lineno}):
+            elif_stmt = if_stmt.elif_stmts[0]
+            if_stmt.condition, if_stmt.statements, if_stmt.lineno = \
+                elif_stmt.condition, elif_stmt.statements, elif_stmt.lineno
+            if_stmt.elif_stmts = []
+        elif if_stmt.statements and self._remove(if_stmt.statements, "if branch with false condition"):
+            if_stmt.statements = Classes.Block([], if_stmt.statements.lineno)
+        return [if_stmt]
+
+    def _else_skipped(self, if_stmt: Classes.IfStatement) -> bool:
+        # Elif taken clears else flag, but a function called in a later condition could set it again
+        for index, elif_stmt in enumerate(if_stmt.elif_stmts):
+            if self._is_true(elif_stmt.condition):
+                return not any(self._calls_function(later.condition) for later in if_stmt.elif_stmts[index + 1:])
+        return False
+
+    def _always_returns(self, statement) -> bool:
+        # Function called while returned values are evaluated clears return flag when it ends
+        if isinstance(statement, Classes.ReturnStatement):
+            return not any(self._calls_function(value) for value in statement.values)
+        if not isinstance(statement, Classes.IfStatement) or self._calls_function(statement.condition):
+            return False
+        if self._is_true(statement.condition):
+            return self._block_always_returns(statement.statements)
+        if not statement.else_stmt or any(self._calls_function(elif_stmt.condition) for elif_stmt in statement.elif_stmts):
+            return False
+        blocks = [] if self._is_false(statement.condition) else [statement.statements]
+        blocks += [*[elif_stmt.statements for elif_stmt in statement.elif_stmts], statement.else_stmt]
+        return all(self._block_always_returns(block) for block in blocks)
+
+    def _block_always_returns(self, block: Classes.Block) -> bool:
+        return any(self._always_returns(statement) for statement in block)
+
+    @staticmethod
+    def _is_true(condition) -> bool:
+        return type(condition) in CONSTANTS and bool(condition.value)
+
+    @staticmethod
+    def _is_false(condition) -> bool:
+        return type(condition) in CONSTANTS and not condition.value
+
+    def _remove(self, node, description: str, lines: set[int] = None) -> bool:
+        if self._binds_function(node):
+            return False
+        lines = self._lines(node) | (lines or set())
+        self._removed_lines |= lines
+        self.report.removed.append(DeadCode(self._function_name, min(lines), max(lines), description))
+        return True
+
+    def _remove_unreachable_functions(self, program: Classes.Program) -> None:
+        if program.main not in program.functions:
+            return
+        # Function binding a name of a function is kept to be reported by Linker, so are functions named by it
+        reachable = {program.main} | {name for name, function in program.functions.items() if self._binds_function(function)}
+        to_visit = list(reachable)
+        while to_visit:
+            for node in self._walk(program.functions[to_visit.pop()]):
+                if type(node) == Classes.Identifier and node.value in program.functions \
+                        and not hasattr(self.builtins, node.value) and node.value not in reachable:
+                    reachable.add(node.value)
+                    to_visit.append(node.value)
+        for name in [name for name in program.functions if name not in reachable]:
+            self._function_name = name
+            if self._remove(program.functions[name], "unreachable function"):
+                del program.functions[name]
+
+    def _observing_functions(self) -> set[str]:
+        """Returns names of functions which can be called while a condition or a returned value is evaluated."""
+        called = set()
+        for function in self.functions.values():
+            for node in self._walk(function):
+                if isinstance(node, (Classes.IfStatement, Classes.ElifBlock)):
+                    called |= self._called_functions(node.condition)
+                elif isinstance(node, Classes.ReturnStatement):
+                    for value in node.values:
+                        called |= self._called_functions(value)
+        to_visit = list(called)
+        while to_visit:
+            for name in self._called_functions(self.functions[to_visit.pop()]) - called:
+                called.add(name)
+                to_visit.append(name)
+        return called
+
+    def _called_functions(self, node) -> set[str]:
+        called = set()
+        for sub_node in self._walk(node):
+            if not isinstance(sub_node, Classes.FunCall) or isinstance(sub_node.left_expr, Classes.DotOperator):
+                continue
+            callee = sub_node.left_expr
+            if type(callee) != Classes.Identifier or not hasattr(self.builtins, callee.value) \
+                    and callee.value not in self.functions:
+                # Called value is not known before the program runs
+                return set(self.functions)
+            if not hasattr(self.builtins, callee.value):
+                called.add(callee.value)
+        return called
+
+    def _calls_function(self, node) -> bool:
+        for sub_node in self._walk(node):
+            if isinstance(sub_node, Classes.FunCall) and not isinstance(sub_node.left_expr, Classes.DotOperator) \
+                    and not (type(sub_node.left_expr) == Classes.Identifier
+                             and hasattr(self.builtins, sub_node.left_expr.value)):
+                return True
+        return False
+
+    def _binds_function(self, node) -> bool:
+        for sub_node in self._walk(node):
+            if isinstance(sub_node, Classes.BasicAssignment):
+                names = [sub_node.left_expr]
+            elif isinstance(sub_node, Classes.ForStatement):
+                names = [sub_node.iterator]
+            elif isinstance(sub_node, Classes.Function):
+                names = sub_node.params
+            else:
+                continue
+            if any(type(name) == Classes.Identifier and name.value in self.functions for name in names):
+                return True
+        return False
+
+    def _lines(self, node) -> set[int]:
+        return {sub_node.lineno for sub_node in self._walk(node)}
+
+    def _walk(self, node):
+        yield node
+        if isinstance(node, list):
+            children = node
+        elif isinstance(node, Classes.Program):
+            children = node.functions.values()
+        elif isinstance(node, Classes.Function):
+            children = [*node.params, node.statements]
+        elif isinstance(node, Classes.IfStatement):
+            children = [node.condition, node.statements, *node.elif_stmts] + ([node.else_stmt] if node.else_stmt else [])
+        elif isinstance(node, (Classes.ElifBlock, Classes.WhileStatement)):
+            children = [node.condition, node.statements]
+        elif isinstance(node, Classes.ForStatement):
+            children = [node.iterator, node.iterable, node.statements]
+        elif isinstance(node, Classes.ReturnStatement):
+            children = node.values
+        elif isinstance(node, Classes.FunCall):
+            children = [node.left_expr, *node.right_expr]
+        elif isinstance(node, Classes.DotOperator):
+            # Right side is a name of an attribute
+            children = [node.left_expr]
+        elif isinstance(node, (Classes.Assignment, Classes.TwoSidedExpression)):
+            children = [node.left_expr, node.right_expr]
+        elif isinstance(node, Classes.OneSidedExpression):
+            children = [node.value]
+        elif isinstance(node, Classes.List):
+            children = node.value
+        else:
+            children = []
+        for child in children:
+            yield from self._walk(child)
@@ -0,0 +1,231 @@
+from types import ModuleType
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Operators import one_sided_operators, two_sided_operators, short_circuit_operators
+from Tutel.core.ParserModule import Classes
+
+CONSTANTS = (Classes.Integer, Classes.String, Classes.Boolean, Classes.Null)
+# Operators whose results can be replaced by an atom, the result is unboxed just like the value of an atom
+FOLDED_OPERATORS = {"+", "-", "*", "/", "//", "%", "==", "!=", "<", "<=", ">", ">="}
+MAX_FOLDED_STRING_LENGTH = 10_000
+
+
+class Optimizer:
+    """
+    Folds expressions on constants and propagates constants assigned once in a function.
+    Nodes are replaced by atoms with line number of the replaced node, so statements keep their lines.
+    Expressions which fail are left to fail when the program runs. A variable is propagated only if it's assigned
+    in the function body before it's read and its Value can't be shared with another variable, which could modify it.
+    """
+
+    def __init__(self, builtins: ModuleType = TutelBuiltins) -> None:
+        self.builtins = builtins
+        self.functions: dict[str, Classes.Function] = {}
+        self._constants: dict[str, Classes.Atom] = {}
+        self._assignments: dict[str, int] = {}
+        self._top_assignments: dict[str, int] = {}
+        self._first_reads: dict[str, int] = {}
+        self._excluded: set[str] = set()
+
+    def optimize(self, program: Classes.Program) -> Classes.Program:
+        self.functions = program.functions
+        for function in program.functions.values():
+            self._optimize_function(function)
+        return program
+
+    def _optimize_function(self, function: Classes.Function) -> None:
+        propagated = self._propagated_names(function)
+        self._constants = {}
+        for index, statement in enumerate(function.statements):
+            function.statements[index] = self._statement(statement)
+            if isinstance(statement, Classes.BasicAssignment) and type(statement.left_expr) == Classes.Identifier \
+                    and statement.left_expr.value in propagated and type(statement.right_expr) in CONSTANTS:
+                self._constants[statement.left_expr.value] = statement.right_expr
+
+    def _block(self, block: Classes.Block) -> None:
+        for index, statement in enumerate(block):
+            block[index] = self._statement(statement)
+
+    def _statement(self, statement):
+        if isinstance(statement, Classes.BasicAssignment):
+            statement.right_expr = self._value(statement.right_expr)
+        elif isinstance(statement, Classes.ModifyingAssignment):
+            statement.right_expr = self._value(statement.right_expr)
+        elif isinstance(statement, Classes.ReturnStatement):
+            statement.values = [self._expression(value) for value in statement.values]
+        elif isinstance(statement, Classes.IfStatement):
+            statement.condition = self._expression(statement.condition)
+            self._block(statement.statements)
+            for elif_stmt in statement.elif_stmts or []:
+                elif_stmt.condition = self._expression(elif_stmt.condition)
+                self._block(elif_stmt.statements)
+            if statement.else_stmt:
+                self._block(statement.else_stmt)
+        elif isinstance(statement, Classes.WhileStatement):
+            statement.condition = self._expression(statement.condition)
+            self._block(statement.statements)
+        elif isinstance(statement, Classes.ForStatement):
+            statement.iterable = self._value(statement.iterable)
+            self._block(statement.statements)
+        else:
+            # Result of an expression statement is dropped, the statement itself stays to keep its line
+            self._expression(statement)
+        return statement
+
+    def _value(self, node):
+        """Optimizes node evaluated as a value, identifiers are looked up."""
+        if type(node) == Classes.Identifier:
+            if (constant := self._constants.get(node.value)) is not None:
+                return self._atom(constant.value, node.lineno)
+            return node
+        return self._expression(node)
+
+    def _expression(self, node):
+        """Optimizes node evaluated with accept, identifiers evaluate to their names."""
+        if isinstance(node, Classes.List):
+            node.value = [self._value(element) for element in node.value]
+        elif isinstance(node, Classes.Atom):
+            return node
+        elif isinstance(node, Classes.FunCall):
+            node.left_expr = self._value(node.left_expr)
+            node.right_expr = [self._value(argument) for argument in node.right_expr]
+        elif isinstance(node, Classes.DotOperator):
+            node.left_expr = self._value(node.left_expr)
+        elif isinstance(node, Classes.ListElement):
+            node.left_expr = self._value(node.left_expr)
+            node.right_expr = self._value(node.right_expr)
+        elif isinstance(node, Classes.TwoSidedExpression):
+            if node.operator in short_circuit_operators:
+                return self._short_circuit_expression(node)
+            node.left_expr = self._value(node.left_expr)
+            node.right_expr = self._value(node.right_expr)
+            if node.operator in FOLDED_OPERATORS:
+                return self._fold(node, two_sided_operators[node.operator], node.left_expr, node.right_expr)
+        elif isinstance(node, Classes.OneSidedExpression):
+            node.value = self._value(node.value)
+            if node.operator in one_sided_operators:
+                return self._fold(node, one_sided_operators[node.operator], node.value)
+        return node
+
+    def _short_circuit_expression(self, expr: Classes.TwoSidedExpression):
+        # Result is one of the operands, so they are used just like the result
+        expr.left_expr = self._value(expr.left_expr)
+        expr.right_expr = self._value(expr.right_expr)
+        if type(expr.left_expr) not in CONSTANTS:
+            return expr
+        if bool(expr.left_expr.value) == short_circuit_operators[expr.operator]:
+            return expr.left_expr
+        # Identifier evaluated with accept would give its name instead of its value
+        if type(expr.right_expr) != Classes.Identifier:
+            return expr.right_expr
+        return expr
+
+    def _fold(self, expr, operation, *operands):
+        if any(type(operand) not in CONSTANTS for operand in operands):
+            return expr
+        values = [operand.value for operand in operands]
+        if expr.operator == "*" and sorted(type(value).__name__ for value in values) == ["int", "str"]:
+            text, count = sorted(values, key=lambda value: type(value) == int)
+            if len(text) * count > MAX_FOLDED_STRING_LENGTH:
+                return expr
+        try:
+            result = operation(*values)
+        except Exception:
+            return expr
+        return self._atom(result, expr.lineno)
+
+    @staticmethod
+    def _atom(value, lineno: int) -> Classes.Atom:
+        if type(value) == bool:
+            return Classes.Boolean(value, lineno)
+        if type(value) == str:
+            return Classes.String(value, lineno)
+        if value is None:
+            return Classes.Null(lineno)
+        return Classes.Integer(value, lineno)
+
+    def _propagated_names(self, function: Classes.Function) -> set[str]:
+        self._assignments = {}
+        self._top_assignments = {}
+        self._first_reads = {}
+        self._excluded = {param.value for param in function.params}
+        for index, statement in enumerate(function.statements):
+            self._analyse(statement, index, top=True)
+        return {
+            name for name, index in self._top_assignments.items()
+            if self._assignments[name] == 1 and name not in self._excluded and self._first_reads.get(name, index + 1) > index
+            and not hasattr(self.builtins, name) and name not in self.functions
+        }
+
+    def _analyse(self, statement, index: int, top: bool) -> None:
+        if isinstance(statement, Classes.BasicAssignment) and type(statement.left_expr) == Classes.Identifier:
+            name = statement.left_expr.value
+            self._assignments[name] = self._assignments.get(name, 0) + 1
+            if top:
+                self._top_assignments[name] = index
+            # Assigned identifier shares its Value with the assigned variable
+            self._reads(statement.right_expr, index, shared=True)
+        elif isinstance(statement, Classes.BasicAssignment):
+            self._reads(statement.left_expr, index, shared=True)
+            self._reads(statement.right_expr, index, shared=True)
+        elif isinstance(statement, Classes.ModifyingAssignment):
+            if type(statement.left_expr) == Classes.Identifier:
+                self._excluded.add(statement.left_expr.value)
+            else:
+                self._reads(statement.left_expr, index, shared=True)
+            self._reads(statement.right_expr, index, shared=False)
+        elif isinstance(statement, Classes.ReturnStatement):
+            for value in statement.values:
+                self._accepted_reads(value, index)
+        elif isinstance(statement, Classes.IfStatement):
+            self._accepted_reads(statement.condition, index)
+            self._analyse_block(statement.statements, index)
+            for elif_stmt in statement.elif_stmts or []:
+                self._accepted_reads(elif_stmt.condition, index)
+                self._analyse_block(elif_stmt.statements, index)
+            if statement.else_stmt:
+                self._analyse_block(statement.else_stmt, index)
+        elif isinstance(statement, Classes.WhileStatement):
+            self._accepted_reads(statement.condition, index)
+            self._analyse_block(statement.statements, index)
+        elif isinstance(statement, Classes.ForStatement):
+            self._excluded.add(statement.iterator.value)
+            self._reads(statement.iterable, index, shared=False)
+            self._analyse_block(statement.statements, index)
+        else:
+            self._reads(statement, index, shared=False)
+
+    def _analyse_block(self, block: Classes.Block, index: int) -> None:
+        for statement in block:
+            self._analyse(statement, index, top=False)
+
+    def _accepted_reads(self, node, index: int) -> None:
+        # Identifier evaluated with accept is not read
+        if type(node) != Classes.Identifier:
+            self._reads(node, index, shared=False)
+
+    def _reads(self, node, index: int, shared: bool) -> None:
+        if type(node) == Classes.Identifier:
+            name = node.value
+            self._first_reads[name] = min(self._first_reads.get(name, index), index)
+            if shared:
+                self._excluded.add(name)
+        elif isinstance(node, Classes.List):
+            for element in node.value:
+                self._reads(element, index, shared=True)
+        elif isinstance(node, Classes.Atom):
+            return
+        elif isinstance(node, Classes.FunCall):
+            self._reads(node.left_expr, index, shared=False)
+            # Builtins get unwrapped arguments, Tutel functions get the Values
+            builtin_call = type(node.left_expr) == Classes.Identifier and hasattr(self.builtins, node.left_expr.value)
+            for argument in node.right_expr:
+                self._reads(argument, index, shared=not builtin_call)
+        elif isinstance(node, Classes.DotOperator):
+            self._reads(node.left_expr, index, shared=False)
+        elif isinstance(node, Classes.TwoSidedExpression):
+            operands_shared = shared and node.operator in short_circuit_operators
+            self._reads(node.left_expr, index, shared=operands_shared)
+            self._reads(node.right_expr, index, shared=operands_shared)
+        elif isinstance(node, Classes.OneSidedExpression):
+            self._reads(node.value, index, shared=False)
@@ -18,7 +18,9 @@ from Tutel.common.ErrorType import (
     MissingFunctionBlockException,
     FunctionRedefinitionException, MissingEtx,
 )
+from Tutel.core.LexerModule.FastLexer import FastLexer
 from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.LexerModule.TokenBuffer import TokenBuffer
 from Tutel.core.LexerModule.Tokens import TokenType, Token, TOKEN_VALUE_TYPES
 from Tutel.core.ParserModule.Classes import (
     Program, Function, Block,
@@ -35,26 +37,26 @@ from Tutel.core.ParserModule.Classes import (
 )
 from Tutel.core.ParserModule.Remapper import assignment_mapper, comp_mapper, sum_mapper, mul_mapper
 
+_T_COMMENT = TokenType.T_COMMENT.value
+
 
 class LexerInterface:
-    def __init__(self, lexer: Lexer) -> None:
-        self.lexer = lexer
-        self.lexer.get_next_token()
-        while self.token.type == TokenType.T_COMMENT:
-            self.lexer.get_next_token()
+    def __init__(self, lexer: Lexer | FastLexer | TokenBuffer) -> None:
+        self.tokens = lexer if isinstance(lexer, TokenBuffer) else TokenBuffer(lexer)
+        self.index = -1
+        self.token = None
+        self.get_next_token()
 
     def get_next_token(self) -> Token:
-        self.lexer.get_next_token()
-        while self.token.type == TokenType.T_COMMENT:
-            self.lexer.get_next_token()
+        tokens = self.tokens
+        self.index += 1
+        while tokens.fill(self.index) and tokens.types[self.index] == _T_COMMENT:
+            self.index += 1
+        self.token = tokens[self.index]
         return self.token
 
     def get_lineno(self) -> int:
-        return self.lexer.token.line
-
-    @property
-    def token(self) -> Token:
-        return self.lexer.token
+        return self.token.line
 
 
 class Parser:
@@ -68,7 +70,7 @@ class Parser:
         return self.__lexer
 
     @lexer.setter
-    def lexer(self, lexer: Lexer) -> None:
+    def lexer(self, lexer: Lexer | FastLexer | TokenBuffer) -> None:
         self.__lexer = LexerInterface(lexer)
 
     def _check_and_consume(self, token_type: TokenType) -> bool:
@@ -87,7 +89,7 @@ class Parser:
     def _token_is(self, token_type: TokenType) -> bool:
         return self.lexer.token.type == token_type
 
-    def parse(self, lexer: Lexer) -> Program:
+    def parse(self, lexer: Lexer | FastLexer | TokenBuffer) -> Program:
         self.lexer = lexer
         self.functions = {}
         lineno = self.lexer.get_lineno()
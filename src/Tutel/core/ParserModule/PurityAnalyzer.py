@@ -0,0 +1,110 @@
+from types import ModuleType
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Builtin import REGISTRY
+from Tutel.core.InterpreterModule.Operators import short_circuit_operators
+from Tutel.core.ParserModule import Classes
+
+# Builtins without effects whose results depend only on their arguments
+PURE_BUILTINS = {name for name, builtin in REGISTRY.items() if builtin.pure}
+
+
+class PurityAnalyzer:
+    """
+    Finds functions whose result depends only on their arguments and which have no effects visible outside of them.
+    Pure function calls only pure builtins and pure functions, calls no methods, assigns to no list elements
+    or attributes and modifies only variables holding Values created in it, so Values of arguments stay unchanged.
+    """
+
+    def __init__(self, builtins: ModuleType = TutelBuiltins) -> None:
+        self.builtins = builtins
+        self.functions: dict[str, Classes.Function] = {}
+        self._called: set[str] = set()
+        self._shared: set[str] = set()
+        self._modified: set[str] = set()
+
+    def analyse(self, program: Classes.Program) -> set[str]:
+        self.functions = program.functions
+        called = {}
+        for name, function in program.functions.items():
+            if self._is_pure_alone(function):
+                called[name] = self._called
+        pure = set(called)
+        changed = True
+        while changed:
+            impure = {name for name in pure if not called[name] <= pure}
+            pure -= impure
+            changed = bool(impure)
+        return pure
+
+    def _is_pure_alone(self, function: Classes.Function) -> bool:
+        """Checks function assuming every function it calls is pure, names of called functions are collected."""
+        self._called = set()
+        # Variables which can hold a Value not created in the function
+        self._shared = {param.value for param in function.params}
+        self._modified = set()
+        return self._block(function.statements) and not self._shared & self._modified
+
+    def _block(self, block: Classes.Block) -> bool:
+        return all([self._statement(statement) for statement in block])
+
+    def _statement(self, statement) -> bool:
+        if isinstance(statement, Classes.Assignment):
+            if type(statement.left_expr) != Classes.Identifier:
+                return False
+            if isinstance(statement, Classes.ModifyingAssignment):
+                self._modified.add(statement.left_expr.value)
+            elif not self._creates_value(statement.right_expr):
+                self._shared.add(statement.left_expr.value)
+            return self._expression(statement.right_expr)
+        if isinstance(statement, Classes.ReturnStatement):
+            return all([self._expression(value) for value in statement.values])
+        if isinstance(statement, Classes.IfStatement):
+            return self._expression(statement.condition) and self._block(statement.statements) \
+                and all([self._expression(elif_stmt.condition) and self._block(elif_stmt.statements)
+                         for elif_stmt in statement.elif_stmts]) \
+                and (not statement.else_stmt or self._block(statement.else_stmt))
+        if isinstance(statement, Classes.WhileStatement):
+            return self._expression(statement.condition) and self._block(statement.statements)
+        if isinstance(statement, Classes.ForStatement):
+            # Iterator gets elements of the iterable, which may be Values of an argument
+            self._shared.add(statement.iterator.value)
+            return self._expression(statement.iterable) and self._block(statement.statements)
+        return self._expression(statement)
+
+    def _expression(self, node) -> bool:
+        if isinstance(node, Classes.List):
+            return all([self._expression(element) for element in node.value])
+        if isinstance(node, Classes.Atom):
+            return True
+        if isinstance(node, Classes.FunCall):
+            callee = node.left_expr
+            if type(callee) != Classes.Identifier:
+                return False
+            if hasattr(self.builtins, callee.value):
+                if callee.value not in PURE_BUILTINS:
+                    return False
+            elif callee.value in self.functions:
+                self._called.add(callee.value)
+            else:
+                # Function held by a variable isn't known before the program runs
+                return False
+            return all([self._expression(argument) for argument in node.right_expr])
+        if isinstance(node, Classes.DotOperator):
+            return self._expression(node.left_expr)
+        if isinstance(node, Classes.TwoSidedExpression):
+            return self._expression(node.left_expr) and self._expression(node.right_expr)
+        if isinstance(node, Classes.OneSidedExpression):
+            return self._expression(node.value)
+        return False
+
+    def _creates_value(self, node) -> bool:
+        """Checks if Value assigned from node is always created by it, so it's not shared with other variables."""
+        if isinstance(node, (Classes.DotOperator, Classes.ListElement)) or type(node) == Classes.Identifier:
+            return False
+        if isinstance(node, Classes.FunCall):
+            # Tutel function can return Value of its argument
+            return type(node.left_expr) == Classes.Identifier and hasattr(self.builtins, node.left_expr.value)
+        if isinstance(node, Classes.TwoSidedExpression):
+            return node.operator not in short_circuit_operators
+        return True
@@ -0,0 +1,42 @@
+from Tutel.core.ParserModule import Classes
+
+
+class Resolver:
+    """
+    Assigns a slot index to every local variable of a function, so stack frames can keep locals in a list.
+    Parameters get the first slots, then names of assigned variables and loop iterators in order of appearance.
+    """
+
+    def resolve(self, program: Classes.Program) -> Classes.Program:
+        for function in program.functions.values():
+            if function.slots is None:
+                function.slots = self.resolve_function(function)
+        return program
+
+    def resolve_function(self, function: Classes.Function) -> dict[str, int]:
+        slots: dict[str, int] = {}
+        for param in function.params:
+            self._add(slots, param)
+        self._resolve_block(function.statements, slots)
+        return slots
+
+    @staticmethod
+    def _add(slots: dict[str, int], identifier) -> None:
+        if type(identifier) == Classes.Identifier and identifier.value not in slots:
+            slots[identifier.value] = len(slots)
+
+    def _resolve_block(self, block: Classes.Block, slots: dict[str, int]) -> None:
+        for statement in block:
+            if isinstance(statement, Classes.Assignment):
+                self._add(slots, statement.left_expr)
+            elif isinstance(statement, Classes.ForStatement):
+                self._add(slots, statement.iterator)
+                self._resolve_block(statement.statements, slots)
+            elif isinstance(statement, Classes.WhileStatement):
+                self._resolve_block(statement.statements, slots)
+            elif isinstance(statement, Classes.IfStatement):
+                self._resolve_block(statement.statements, slots)
+                for elif_stmt in statement.elif_stmts or []:
+                    self._resolve_block(elif_stmt.statements, slots)
+                if statement.else_stmt:
+                    self._resolve_block(statement.else_stmt, slots)
@@ -0,0 +1,148 @@
+import hashlib
+import hmac
+import os
+import pickle
+import secrets
+import stat
+
+import Tutel
+from Tutel.core.ParserModule.Classes import Program
+
+CACHE_FORMAT_VERSION = 5
+CACHE_MAGIC = b"TUTELC"
+CACHE_SUFFIX = ".tutc"
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+# Key of the current user signing cache entries, so entries written by anyone else are never unpickled
+KEY_PATH = os.path.join(os.path.expanduser("~"), ".tutel", "cache.key")
+KEY_SIZE = 32
+
+
+class ProgramCache:
+    """
+    Directory of parsed programs keyed by hash of the source code and Tutel version.
+    Least recently used entries (by modification time, refreshed on every hit) are evicted
+    when the directory grows over max_size bytes.
+    Entries are signed with HMAC keyed by a secret of the current user and checked before unpickling.
+    Directory not owned by the current user or writable by others isn't used at all.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_CACHE_SIZE, key_path: str = None):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.key_path = key_path or KEY_PATH
+        self._header = CACHE_MAGIC + f"{CACHE_FORMAT_VERSION}:{Tutel.__version__}\n".encode()
+        self._key = None
+
+    def trusted(self) -> bool:
+        try:
+            dir_stat = os.stat(self.cache_dir)
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        if dir_stat.st_mode & stat.S_IWOTH:
+            return False
+        return not hasattr(os, "getuid") or dir_stat.st_uid == os.getuid()
+
+    def _secret(self) -> bytes | None:
+        if self._key is None:
+            try:
+                with open(self.key_path, "rb") as file:
+                    self._key = file.read()
+            except FileNotFoundError:
+                self._key = self._create_secret()
+            except OSError:
+                return None
+        return self._key if self._key and len(self._key) >= KEY_SIZE else None
+
+    def _create_secret(self) -> bytes | None:
+        key = secrets.token_bytes(KEY_SIZE)
+        try:
+            os.makedirs(os.path.dirname(self.key_path), mode=0o700, exist_ok=True)
+            with os.fdopen(os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as file:
+                file.write(key)
+        except FileExistsError:
+            with open(self.key_path, "rb") as file:
+                return file.read()
+        except OSError:
+            return None
+        return key
+
+    def _sign(self, key: bytes, data: bytes) -> bytes:
+        return hmac.new(key, self._header + data, hashlib.sha256).digest()
+
+    def key(self, code: str) -> str:
+        digest = hashlib.sha256(self._header)
+        digest.update(code.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, code: str) -> str:
+        return os.path.join(self.cache_dir, self.key(code) + CACHE_SUFFIX)
+
+    def load(self, code: str) -> Program | None:
+        if not self.trusted() or (key := self._secret()) is None:
+            return None
+        path = self.path(code)
+        try:
+            with open(path, "rb") as file:
+                if file.read(len(self._header)) != self._header:
+                    raise ValueError("Incompatible cache entry")
+                signature = file.read(hashlib.sha256().digest_size)
+                data = file.read()
+            if not hmac.compare_digest(signature, self._sign(key, data)):
+                raise ValueError("Cache entry not signed by the current user")
+            program = pickle.loads(data)
+            if not isinstance(program, Program):
+                raise ValueError("Cache entry is not a program")
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return program
+
+    def store(self, code: str, program: Program) -> None:
+        if not self.trusted() or (key := self._secret()) is None:
+            return
+        path = self.path(code)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            data = pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL)
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                file.write(self._header + self._sign(key, data) + data)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, RecursionError):
+            self._remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total_size = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(CACHE_SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total_size += stat.st_size
+        except OSError:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,7 +1,28 @@
 from typing import NamedTuple, Literal
 
+from Tutel.core.GuiModule.CommandSink import DEFAULT_BUFFER_SIZE
+from Tutel.core.InterpreterModule.Memoizer import DEFAULT_MEMOIZE_SIZE
+from Tutel.core.Runner.ProgramCache import DEFAULT_CACHE_SIZE
+from Tutel.core.VM.VirtualMachine import DEFAULT_MAX_CALL_DEPTH
+
 
 class TutelOptions(NamedTuple):
     gui: Literal["vscode", "nock"] = "mock"
     gui_out_path: str = ""
+    gui_buffer_size: int = DEFAULT_BUFFER_SIZE
+    gui_batch: bool = False
+    gui_stats: bool = False
+    gui_coalesce: bool = False
+    render_path: str = ""
     verbose: bool = False
+    lexer: Literal["default", "fast"] = "default"
+    engine: Literal["visitor", "closure", "vm", "python"] = "visitor"
+    release: bool = False
+    optimize: bool = False
+    report_dce: bool = False
+    memoize: bool = False
+    memoize_size: int = DEFAULT_MEMOIZE_SIZE
+    memoize_stats: bool = False
+    cache_dir: str = ""
+    cache_size: int = DEFAULT_CACHE_SIZE
+    max_call_depth: int = DEFAULT_MAX_CALL_DEPTH
@@ -1,12 +1,46 @@
-from io import StringIO
+import sys
 
 import Tutel
 from Tutel.core import GuiModule
+from Tutel.core.GuiModule.GuiCoalescer import GuiCoalescer
 from Tutel.common.ErrorType import LexerException, ParserException, InterpreterException
+from Tutel.core.InterpreterModule.ClosureInterpreter import ClosureInterpreter
 from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Memoizer import Memoizer
+from Tutel.core.InterpreterModule.ReleaseInterpreter import ReleaseInterpreter
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.LexerModule.FastLexer import FastLexer
 from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.LexerModule.TokenBuffer import TokenBuffer
+from Tutel.core.ParserModule.Classes import Program
+from Tutel.core.ParserModule.DeadCodeEliminator import DeadCodeEliminator, DeadCodeReport
+from Tutel.core.ParserModule.Optimizer import Optimizer
 from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.ProgramCache import ProgramCache
 from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.TranspilerModule.TranspiledInterpreter import TranspiledInterpreter
+from Tutel.core.TranspilerModule.Transpiler import Transpiler
+from Tutel.core.VM.VirtualMachine import VirtualMachine
+
+lexer_mapper: dict[str, type[Lexer | FastLexer]] = {
+    "default": Lexer,
+    "fast": FastLexer,
+}
+
+interpreter_mapper: dict[str, type[Interpreter]] = {
+    "visitor": Interpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": TranspiledInterpreter,
+}
+
+# Engines without line tracking, used when the script is not debugged
+release_interpreter_mapper: dict[str, type[Interpreter]] = {
+    "visitor": ReleaseInterpreter,
+}
+
+# Engines calling Tutel functions through Interpreter.visit_fun_call or its closure equivalent
+memoizing_engines = {"visitor", "closure"}
 
 
 class TutelRunner:
@@ -15,22 +49,77 @@ class TutelRunner:
         self.options = options or TutelOptions()
         self.parser = Parser()
         self.program = None
-        self.interpreter = Interpreter()
+        self.dead_code: DeadCodeReport | None = None
+        self.interpreter = self._create_interpreter(release=self.options.release)
+        self._tokens: TokenBuffer | None = None
+        self._tokenized_code: str | None = None
+
+    def _create_interpreter(self, release: bool = False, **kwargs) -> Interpreter:
+        if release and self.options.engine in release_interpreter_mapper:
+            interpreter_class = release_interpreter_mapper[self.options.engine]
+        else:
+            interpreter_class = interpreter_mapper[self.options.engine]
+        if issubclass(interpreter_class, VirtualMachine):
+            kwargs["max_call_depth"] = self.options.max_call_depth
+        if self.options.memoize and self.options.engine in memoizing_engines:
+            kwargs["memoizer"] = Memoizer(self.options.memoize_size)
+        elif self.options.memoize:
+            print(f"Memoization is not supported by the {self.options.engine} engine, functions aren't memoized",
+                  file=sys.stderr)
+        return interpreter_class(**kwargs)
+
+    @property
+    def tokens(self) -> TokenBuffer:
+        if self._tokens is None or self._tokenized_code is not self.code:
+            self._tokens = TokenBuffer(lexer_mapper[self.options.lexer](self.code))
+            self._tokenized_code = self.code
+        return self._tokens
 
     def run(self):
         self._prepare_to_run()
         if self.options.gui_out_path:
             with open(self.options.gui_out_path, "w"):
                 pass
+        suppressed_commands = Turtle.suppressed_commands
         try:
             self.interpreter.execute(self.program, "main")
         except InterpreterException:
             exit(-4)
+        finally:
+            GuiModule.GUI.close()
+            self._report_memoization()
+            self._report_gui_stats(Turtle.suppressed_commands - suppressed_commands)
 
-    def _prepare_to_run(self, debug=False):
+    def _report_memoization(self):
+        if self.options.memoize_stats and self.interpreter.memoizer is not None:
+            print(self.interpreter.memoizer, file=sys.stderr)
+
+    def _report_gui_stats(self, suppressed_commands: int):
+        if self.options.gui_stats:
+            print(f"Redundant GUI commands suppressed: {suppressed_commands}", file=sys.stderr)
+            if isinstance(GuiModule.GUI, GuiCoalescer):
+                print(f"Forward moves coalesced: {GuiModule.GUI.coalesced_moves}", file=sys.stderr)
+
+    def _load_program(self) -> Program:
+        if not self.options.cache_dir:
+            return self.parser.parse(self.tokens)
+        cache = ProgramCache(self.options.cache_dir, self.options.cache_size)
+        if not cache.trusted():
+            print(f"Cache directory {self.options.cache_dir} is not owned by you or is writable by others, "
+                  f"it isn't used", file=sys.stderr)
+        if (program := cache.load(self.code)) is None:
+            program = self.parser.parse(self.tokens)
+            cache.store(self.code, program)
+        return program
+
+    def transpile(self) -> str:
+        self._parse()
+        self._report_dead_code()
+        return Transpiler().transpile(self.program).module_source()
+
+    def _parse(self, debug=False):
         try:
-            lexer = Lexer(StringIO(self.code))
-            self.program = self.parser.parse(lexer)
+            self.program = self._load_program()
         except LexerException as e:
             if debug:
                 raise e
@@ -39,9 +128,29 @@ class TutelRunner:
             if debug:
                 raise e
             exit(-3)
-        if self.options.gui == "vscode":
+        if self.options.optimize:
+            Optimizer().optimize(self.program)
+            self.dead_code = DeadCodeEliminator().eliminate(self.program)
+
+    def _report_dead_code(self):
+        if self.options.report_dce and self.dead_code is not None:
+            print(self.dead_code, file=sys.stderr)
+
+    def _prepare_to_run(self, debug=False):
+        self._parse(debug)
+        self._report_dead_code()
+        if self.options.render_path.lower().endswith(".svg"):
+            from Tutel.core.GuiModule.GuiSvg import GuiSvg
+            GuiModule.GUI = GuiSvg(self.options.render_path)
+        elif self.options.render_path:
+            from Tutel.core.GuiModule.GuiRaster import GuiRaster
+            GuiModule.GUI = GuiRaster(self.options.render_path)
+        elif self.options.gui == "vscode":
+            from Tutel.core.GuiModule.CommandSink import CommandSink
             from Tutel.core.GuiModule.GuiVsCode import GuiVsCode
-            GuiModule.GUI = GuiVsCode()
+            GuiModule.GUI = GuiVsCode(CommandSink(self.options.gui_buffer_size, batch=self.options.gui_batch))
+        if self.options.gui_coalesce and not isinstance(GuiModule.GUI, GuiCoalescer):
+            GuiModule.GUI = GuiCoalescer(GuiModule.GUI)
         if self.options.verbose is True:
             Tutel.VERBOSE = True
         if self.options.gui_out_path:
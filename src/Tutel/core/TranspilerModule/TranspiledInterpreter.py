@@ -0,0 +1,152 @@
+import ast
+import sys
+
+from Tutel.common import ErrorType
+from Tutel.common.ErrorType import MismatchedArgsCountException, OutOfRangeException, TypeException, \
+    UnknownException, Stop, TutelException, BuiltinFunctionShadowException
+from Tutel.common.ErrorType import NotIterableException, NotDefinedException, UnsupportedOperandException, \
+    BadOperandForUnaryException, AttributeException
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Operators import two_sided_operators
+from Tutel.core.InterpreterModule.Stack import Stack
+from Tutel.core.InterpreterModule.StackFrame import StackFrame
+from Tutel.core.InterpreterModule.Value import Value, box, unbox, type_name
+from Tutel.core.ParserModule import Classes
+from Tutel.core.TranspilerModule.Transpiler import Transpiler, TranspiledProgram, LineInfo, TRANSPILED_FILENAME, \
+    RUNTIME_PREFIXES, BINARY, UNARY, ATTRIBUTE, ITEM, INPLACE, CALL_BUILTIN, CALL_FUNCTION, CALL_DYNAMIC
+
+_UNBOUND = object()
+
+
+class TranspiledInterpreter(Interpreter):
+    """
+    Runs the program transpiled to Python by Transpiler.
+    Call stack is not kept during execution, it is recreated from Python frames and the line map
+    only when an error is reported. Line callbacks are not called, so the program can't be debugged.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.transpiled_program: TranspiledProgram | None = None
+        self._transpiled_from = None
+        self._namespace: dict[str, any] = {}
+
+    def _run(self, function: Classes.Function):
+        if self._transpiled_from is not self.program_to_execute:
+            self.transpiled_program = Transpiler(self.builtins).transpile(self.program_to_execute)
+            self._namespace = self._load(self.transpiled_program)
+            self._transpiled_from = self.program_to_execute
+        self._namespace[f"f_{function.name.value}"](False)
+
+    def _load(self, program: TranspiledProgram) -> dict[str, any]:
+        namespace = {
+            "_rt": self,
+            "_Value": Value,
+            "_Function": Classes.Function,
+            "_Stop": Stop,
+            "_E": ErrorType,
+            "_UNBOUND": _UNBOUND,
+            "_k": program.constants,
+            "_operators": two_sided_operators,
+            "_fail": self._fail,
+            "_convert": self._convert,
+            "_call": self._call,
+            "_store_dynamic": self._store_dynamic,
+        }
+        namespace.update({f"b_{name}": getattr(self.builtins, name) for name in program.builtins})
+        namespace.update({f"g_{name}": function for name, function in self.program_to_execute.functions.items()})
+        exec(compile(program.source, TRANSPILED_FILENAME, "exec"), namespace)
+        return namespace
+
+    def _stack(self, frames) -> Stack:
+        stack = Stack()
+        for frame, line in frames:
+            stack.append(StackFrame(frame.f_code.co_name[2:], self.transpiled_program.line_map[line].lineno))
+        return stack
+
+    def _transpiled_frames(self, frame) -> list:
+        frames = []
+        while frame is not None:
+            if frame.f_globals is self._namespace:
+                frames.append((frame, frame.f_lineno))
+            frame = frame.f_back
+        frames.reverse()
+        return frames
+
+    def _fail(self, exception: TutelException, name: str = None, lineno: int = None):
+        stack = self._stack(self._transpiled_frames(sys._getframe(1)))
+        if name is not None:
+            stack.append(StackFrame(name, lineno))
+        self.error_handler.handle_error(exception, stack)
+
+    def _call(self, return_flag: bool, callee, arguments: tuple):
+        if type(callee) == Classes.Function:
+            if len(arguments) != len(callee.params):
+                self._fail(
+                    MismatchedArgsCountException(
+                        fun_name=callee.name,
+                        expected_min=len(callee.params),
+                        expected_max=len(callee.params),
+                        got_number=len(arguments)
+                    ), callee.name.value, callee.lineno
+                )
+            return self._namespace[f"f_{callee.name.value}"](return_flag, *[box(argument) for argument in arguments])
+        return callee(*[unbox(argument) for argument in arguments])
+
+    def _store_dynamic(self, name):
+        # Interpreter stores such value under a key which no identifier can ever read
+        if name in self.program_globals:
+            self._fail(BuiltinFunctionShadowException(fun_name=name))
+
+    def _convert(self, error: Exception):
+        if isinstance(error, TutelException):
+            return
+        traceback = error.__traceback__
+        frame = traceback.tb_frame
+        exception = self._converted(error, self.transpiled_program.line_map[traceback.tb_lineno], frame)
+        if exception is None:
+            return
+        frames = self._transpiled_frames(frame.f_back)
+        seen = set()
+        while traceback is not None:
+            if traceback.tb_frame.f_globals is self._namespace and id(traceback.tb_frame) not in seen:
+                seen.add(id(traceback.tb_frame))
+                frames.append((traceback.tb_frame, traceback.tb_lineno))
+            traceback = traceback.tb_next
+        self.error_handler.handle_error(exception, self._stack(frames))
+
+    @staticmethod
+    def _operand(frame, code: str):
+        if not code.startswith(RUNTIME_PREFIXES):
+            return ast.literal_eval(code)
+        if code in frame.f_locals:
+            return frame.f_locals[code]
+        return frame.f_globals[code]
+
+    def _converted(self, error: Exception, info: LineInfo, frame) -> TutelException | None:
+        if isinstance(error, NameError):
+            for operand in info.operands:
+                if operand.startswith("v_") and operand not in frame.f_locals:
+                    return NotDefinedException(name=operand[2:])
+        kind = info.kind
+        if kind == BINARY and isinstance(error, (KeyError, TypeError)):
+            left, right = (self._operand(frame, operand) for operand in info.operands)
+            return UnsupportedOperandException(operator=info.extra, l_type=type_name(left), r_type=type_name(right))
+        if kind == UNARY and isinstance(error, TypeError):
+            return BadOperandForUnaryException(type_name=type_name(self._operand(frame, info.operands[0])))
+        if kind == INPLACE and isinstance(error, TypeError):
+            variable, value = (self._operand(frame, operand) for operand in info.operands)
+            return UnsupportedOperandException(l_type=type_name(variable), r_type=type_name(value), operator=info.extra)
+        if kind == ATTRIBUTE and isinstance(error, AttributeError):
+            return AttributeException(type_name=type_name(self._operand(frame, info.operands[0])), value=info.extra)
+        if kind == ITEM and isinstance(error, IndexError):
+            return OutOfRangeException()
+        if kind == CALL_DYNAMIC and type(self._operand(frame, info.operands[0])) == Classes.Function:
+            kind = CALL_FUNCTION
+        if kind in (CALL_FUNCTION, CALL_BUILTIN, CALL_DYNAMIC) and isinstance(error, TypeError):
+            return TypeException(error)
+        if kind in (CALL_BUILTIN, CALL_DYNAMIC):
+            return UnknownException(error)
+        if isinstance(error, TypeError) and info.loop is not None:
+            return NotIterableException(type_name=type_name(frame.f_locals[info.loop]))
+        return None
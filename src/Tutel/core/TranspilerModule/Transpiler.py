@@ -0,0 +1,437 @@
+import keyword
+from types import ModuleType
+from typing import NamedTuple
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Linker import Linker, Binding
+from Tutel.core.ParserModule import Classes
+
+TRANSPILED_FILENAME = "<tutel-transpiled>"
+
+# Kinds of lines, they tell TranspiledInterpreter how to report an exception raised by a line
+BINARY = "binary"
+UNARY = "unary"
+ATTRIBUTE = "attribute"
+ITEM = "item"
+INPLACE = "inplace"
+CALL_BUILTIN = "call_builtin"
+CALL_FUNCTION = "call_function"
+CALL_DYNAMIC = "call_dynamic"
+
+PYTHON_OPERATORS = {
+    "==": "==",
+    "!=": "!=",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+    "+": "+",
+    "-": "-",
+    "*": "*",
+    "/": "/",
+    "//": "//",
+    "%": "%",
+}
+
+# Right operand is evaluated only under this condition on the left one
+SHORT_CIRCUIT_CONDITIONS = {
+    "and": "if {}:",
+    "or": "if not {}:",
+}
+
+PYTHON_UNARY_OPERATORS = {
+    "-": "-",
+    "not": "not ",
+}
+
+# Codes of values known only at run time, any other code is a Python literal
+RUNTIME_PREFIXES = ("_t", "v_", "b_", "g_")
+
+INPLACE_METHODS = {
+    "+=": "__iadd__",
+    "-=": "__isub__",
+    "*=": "__imul__",
+    "/=": "__idiv__",
+    "%=": "__imod__",
+}
+
+HEADER = [
+    "# Generated by Tutel transpiler.",
+    "# The module is written for inspection only and can't be run on its own: it expects names injected by",
+    "# TranspiledInterpreter, which transpiles the .tut script again whenever it's run with --engine python.",
+    "",
+]
+
+
+class LineInfo(NamedTuple):
+    lineno: int
+    kind: str | None = None
+    operands: tuple[str, ...] = ()
+    extra: any = None
+    loop: str | None = None
+
+
+class TranspiledProgram:
+    def __init__(self, source: str, line_map: dict[int, LineInfo], constants: list, builtins: set[str]) -> None:
+        self.source = source
+        self.line_map = line_map
+        self.constants = constants
+        self.builtins = builtins
+
+    def module_source(self) -> str:
+        lines = {line: info.lineno for line, info in self.line_map.items()}
+        return f"{self.source}\n# Python line -> Tutel line\nLINE_MAP = {lines!r}\n"
+
+
+class Transpiler:
+    """
+    Translates Classes.Program into Python source code, one Python function per Tutel function.
+    Every operation which may fail is put on its own line and described by LineInfo, which tells which Tutel line
+    it comes from and how an exception raised by it has to be reported.
+    Shared state of Interpreter which changes the result of a program (do_else, last_returned) stays shared,
+    return flag is kept in a local variable and passed to called functions.
+    Like in Interpreter, constants and results of operations are unboxed, variables always hold a Value.
+    """
+
+    def __init__(self, builtins: ModuleType = TutelBuiltins) -> None:
+        self.builtins = builtins
+        self.program: Classes.Program | None = None
+        self._lines: list[str] = []
+        self._line_map: dict[int, LineInfo] = {}
+        self._constants: list = []
+        self._used_builtins: set[str] = set()
+        self._indent = 0
+        self._lineno = 0
+        self._temps = 0
+        self._if_bodies = 0
+        self._loop: str | None = None
+
+    def transpile(self, program: Classes.Program) -> TranspiledProgram:
+        return program.accept(self)
+
+    def _emit(self, line: str, kind: str = None, operands=(), extra=None) -> None:
+        self._lines.append("    " * self._indent + line)
+        self._line_map[len(self._lines)] = LineInfo(self._lineno, kind, tuple(operands), extra, self._loop)
+
+    def _temp(self) -> str:
+        self._temps += 1
+        return f"_t{self._temps}"
+
+    def _constant(self, value) -> str:
+        self._constants.append(value)
+        return f"_k[{len(self._constants) - 1}]"
+
+    @staticmethod
+    def _is_literal(code: str) -> bool:
+        return not code.startswith(RUNTIME_PREFIXES)
+
+    def _unboxed(self, code: str) -> str:
+        if self._is_literal(code):
+            return code
+        if code.startswith("v_"):
+            return f"{code}.value"
+        return f"({code}.value if type({code}) is _Value else {code})"
+
+    @staticmethod
+    def _emits_code(node) -> bool:
+        return not isinstance(node, Classes.Atom) or isinstance(node, Classes.List)
+
+    def _read(self, code: str) -> str:
+        # Reads local variable at this very moment, so missing variable is reported before evaluating anything else
+        if not code.startswith("v_"):
+            return code
+        temp = self._temp()
+        self._emit(f"{temp} = {code}", operands=(code,))
+        return temp
+
+    def _value(self, node) -> str:
+        if type(node) != Classes.Identifier:
+            return node.accept(self)
+        return self._resolve(node)
+
+    def _resolve(self, identifier: Classes.Identifier) -> str:
+        name = identifier.value
+        if identifier.binding == Binding.BUILTIN:
+            self._used_builtins.add(name)
+            return f"b_{name}"
+        if identifier.binding == Binding.FUNCTION:
+            return f"g_{name}"
+        return f"v_{name}"
+
+    def _operands(self, nodes) -> list[str]:
+        result = []
+        for index, node in enumerate(nodes):
+            code = self._value(node)
+            if any(self._emits_code(next_node) for next_node in nodes[index + 1:]):
+                code = self._read(code)
+            result.append(code)
+        return result
+
+    def _boxed(self, code: str) -> str:
+        if self._is_literal(code):
+            return f"_Value({code})"
+        if code.startswith("v_"):
+            return code
+        return f"{code} if type({code}) is _Value else _Value({code})"
+
+    def _return_check(self) -> None:
+        do_else = "_rt.do_else = False; " if self._if_bodies else ""
+        self._emit(f"if _rf: {do_else}return _rt.last_returned")
+
+    def _stop_check(self) -> None:
+        self._emit("if _rt._stopped: raise _Stop")
+
+    def visit_program(self, program: Classes.Program) -> TranspiledProgram:
+        Linker(builtins=self.builtins).link(program)
+        self.program = program
+        self._lines = list(HEADER)
+        for function in program.functions.values():
+            function.accept(self)
+            self._lines.append("")
+        return TranspiledProgram("\n".join(self._lines), self._line_map, self._constants, self._used_builtins)
+
+    def visit_function(self, function: Classes.Function) -> None:
+        name = function.name.value
+        params = [f"v_{param.value}" for param in function.params]
+        self._temps = 0
+        self._if_bodies = 0
+        self._loop = None
+        self._lineno = function.lineno
+        self._emit(f"def f_{name}({', '.join(['_rf'] + [f'{param}=_UNBOUND' for param in params])}):")
+        self._indent += 1
+        self._stop_check()
+        if params:
+            # Like in Interpreter, function started by the runner doesn't get its parameters
+            self._emit(f"if {params[0]} is _UNBOUND: del {', '.join(params)}")
+        self._emit("try:")
+        self._indent += 1
+        function.statements.accept(self)
+        self._emit("return _rt.last_returned")
+        self._indent -= 1
+        self._emit("except Exception as _e:")
+        self._indent += 1
+        self._emit("_convert(_e)")
+        self._emit("raise")
+        self._indent -= 2
+
+    def visit_block(self, block: Classes.Block) -> None:
+        self._lineno = block.lineno
+        if not block:
+            self._emit("pass")
+        for statement in block:
+            self._statement(statement)
+            self._return_check()
+
+    visit_else_block = visit_block
+
+    def _statement(self, statement) -> None:
+        if type(statement) == Classes.FunCall:
+            self._fun_call(statement, used=False)
+        else:
+            statement.accept(self)
+
+    def visit_atom(self, atom: Classes.Atom) -> str:
+        return repr(atom.value)
+
+    def visit_identifier(self, identifier: Classes.Identifier) -> str:
+        return repr(identifier.value)
+
+    def visit_list(self, list_: Classes.List) -> str:
+        elements = self._operands(list_.value)
+        temp = self._temp()
+        self._emit(f"{temp} = [{', '.join(self._boxed(element) for element in elements)}]", operands=elements)
+        return temp
+
+    def visit_if_statement(self, if_stmt: Classes.IfStatement) -> None:
+        self._lineno = if_stmt.lineno
+        self._emit("_rt.do_else = True")
+        condition = if_stmt.condition.accept(self)
+        self._emit(f"if {condition}:")
+        self._indent += 1
+        self._if_bodies += 1
+        if_stmt.statements.accept(self)
+        self._emit("_rt.do_else = False")
+        self._indent -= 1
+        if if_stmt.elif_stmts:
+            self._emit("if _rt.do_else:")
+            self._indent += 1
+            for index, elif_stmt in enumerate(if_stmt.elif_stmts):
+                if index:
+                    # Set return flag stops checking elif blocks, but else block still can be executed
+                    self._emit("if not _rf:")
+                    self._indent += 1
+                elif_stmt.accept(self)
+            self._indent -= len(if_stmt.elif_stmts)
+        self._if_bodies -= 1
+        if if_stmt.else_stmt:
+            self._emit("if _rt.do_else:")
+            self._indent += 1
+            if_stmt.else_stmt.accept(self)
+            self._indent -= 1
+
+    def visit_elif_block(self, elif_block: Classes.ElifBlock) -> None:
+        self._lineno = elif_block.lineno
+        condition = elif_block.condition.accept(self)
+        self._emit(f"if {condition}:")
+        self._indent += 1
+        elif_block.statements.accept(self)
+        self._emit("_rt.do_else = False")
+        self._indent -= 1
+
+    def visit_for_statement(self, for_stmt: Classes.ForStatement) -> None:
+        self._lineno = for_stmt.lineno
+        iterable = self._value(for_stmt.iterable)
+        if not iterable.startswith("_t"):
+            temp = self._temp()
+            self._emit(f"{temp} = {iterable}", operands=(iterable,))
+            iterable = temp
+        outer_loop, self._loop = self._loop, iterable
+        iterator = f"v_{for_stmt.iterator.value}"
+        self._emit(f"for {iterator} in {iterable}:")
+        self._indent += 1
+        self._emit(f"if type({iterator}) is not _Value: {iterator} = _Value({iterator})")
+        self._stop_check()
+        for_stmt.statements.accept(self)
+        if not for_stmt.statements:
+            self._return_check()
+        self._indent -= 1
+        self._loop = outer_loop
+
+    def visit_while_statement(self, while_stmt: Classes.WhileStatement) -> None:
+        self._lineno = while_stmt.lineno
+        self._emit("while True:")
+        self._indent += 1
+        self._stop_check()
+        condition = while_stmt.condition.accept(self)
+        self._emit(f"if not {condition}: break")
+        while_stmt.statements.accept(self)
+        if not while_stmt.statements:
+            self._return_check()
+        self._indent -= 1
+
+    def visit_return_statement(self, return_stmt: Classes.ReturnStatement) -> None:
+        self._lineno = return_stmt.lineno
+        self._emit("_rf = True")
+        values = [value.accept(self) for value in return_stmt.values]
+        if len(values) == 0:
+            self._emit("_rt.last_returned = _Value(None)")
+        elif len(values) == 1:
+            self._emit(f"_rt.last_returned = {self._boxed(values[0])}")
+        else:
+            self._emit(f"_rt.last_returned = [{', '.join(values)}]")
+
+    def visit_basic_assignment(self, assignment: Classes.BasicAssignment) -> None:
+        self._lineno = assignment.lineno
+        left = assignment.left_expr
+        if not issubclass(type(left), Classes.Assignable):
+            self._emit(f"_fail(_E.CannotAssignException(value={self._constant(left)}))")
+            return
+        if type(left) == Classes.Identifier:
+            right = self._value(assignment.right_expr)
+            self._emit(f"v_{left.value} = {self._boxed(right)}", operands=(right,))
+        else:
+            target = self._accept(left)
+            self._read(self._value(assignment.right_expr))
+            self._emit(f"_store_dynamic({target})")
+
+    def visit_modifying_assignment(self, assignment: Classes.ModifyingAssignment) -> None:
+        self._lineno = assignment.lineno
+        left = assignment.left_expr
+        if type(left) != Classes.Identifier:
+            self._emit(f"_fail(_E.NotDefinedException(name={self._accept(left)}))")
+            return
+        variable = f"v_{left.value}"
+        if self._emits_code(assignment.right_expr):
+            variable = self._read(variable)
+        right = self._value(assignment.right_expr)
+        self._emit(f"{variable}.{INPLACE_METHODS[assignment.operator]}({right})", INPLACE, (variable, right),
+                   assignment.operator)
+
+    def _accept(self, node) -> str:
+        if type(node) == Classes.FunCall:
+            return self._fun_call(node, used=True)
+        return node.accept(self)
+
+    def visit_one_sided_expression(self, expr: Classes.OneSidedExpression) -> str:
+        self._lineno = expr.lineno
+        value = self._value(expr.value)
+        temp = self._temp()
+        self._emit(f"{temp} = {PYTHON_UNARY_OPERATORS[expr.operator]}{value}", UNARY, (value,))
+        return temp
+
+    def visit_two_sided_expression(self, expr: Classes.TwoSidedExpression) -> str:
+        self._lineno = expr.lineno
+        if expr.operator in SHORT_CIRCUIT_CONDITIONS:
+            return self._short_circuit_expression(expr)
+        left, right = self._operands([expr.left_expr, expr.right_expr])
+        temp = self._temp()
+        if expr.operator in PYTHON_OPERATORS:
+            self._emit(f"{temp} = {left} {PYTHON_OPERATORS[expr.operator]} {right}", BINARY, (left, right),
+                       expr.operator)
+        else:
+            self._emit(f"{temp} = _operators[{expr.operator!r}]({left}, {right})", BINARY, (left, right),
+                       expr.operator)
+        return temp
+
+    def _short_circuit_expression(self, expr: Classes.TwoSidedExpression) -> str:
+        left = self._value(expr.left_expr)
+        temp = self._temp()
+        self._emit(f"{temp} = {left}", operands=(left,))
+        self._emit(SHORT_CIRCUIT_CONDITIONS[expr.operator].format(temp))
+        self._indent += 1
+        right = self._value(expr.right_expr)
+        self._emit(f"{temp} = {right}", operands=(right,))
+        self._indent -= 1
+        return temp
+
+    def visit_dot_operator(self, obj: Classes.DotOperator) -> str:
+        self._lineno = obj.lineno
+        left = self._value(obj.left_expr)
+        name = obj.right_expr.value
+        temp = self._temp()
+        attribute = f"getattr({left}, {name!r})" if keyword.iskeyword(name) else f"{left}.{name}"
+        self._emit(f"{temp} = {attribute}", ATTRIBUTE, (left,), name)
+        return temp
+
+    def visit_fun_call(self, fun_call: Classes.FunCall) -> str:
+        return self._fun_call(fun_call, used=True)
+
+    def _fun_call(self, fun_call: Classes.FunCall, used: bool) -> str:
+        self._lineno = fun_call.lineno
+        left = fun_call.left_expr
+        resolved = self._resolve(left) if type(left) == Classes.Identifier else ""
+        callee, *arguments = self._operands([left] + fun_call.right_expr)
+        temp = self._temp() if used else None
+        assign = f"{temp} = " if used else ""
+        if resolved.startswith("g_"):
+            function = self.program.functions[left.value]
+            if len(arguments) != len(function.params):
+                self._emit(f"_fail(_E.MismatchedArgsCountException(fun_name={self._constant(function.name)}, "
+                           f"expected_min={len(function.params)}, expected_max={len(function.params)}, "
+                           f"got_number={len(arguments)}), {function.name.value!r}, {function.lineno})",
+                           operands=arguments)
+                return "None"
+            boxed = ", ".join(["_rf"] + [self._boxed(argument) for argument in arguments])
+            self._emit(f"{assign}f_{left.value}({boxed})", CALL_FUNCTION, arguments)
+            self._emit("_rf = False")
+        elif resolved.startswith("v_"):
+            self._emit(f"{assign}_call(_rf, {callee}, ({''.join(f'{argument}, ' for argument in arguments)}))",
+                       CALL_DYNAMIC, [callee] + arguments)
+            self._emit(f"_rf = _rf and type({callee}) is not _Function", operands=(callee,))
+        elif (builtin := fun_call.builtin) is not None and not builtin.accepts(len(arguments)):
+            self._emit(f"_fail(_E.MismatchedArgsCountException(fun_name={builtin.name!r}, "
+                       f"expected_min={builtin.min_args}, expected_max={builtin.max_args}, "
+                       f"got_number={len(arguments)}))", operands=arguments)
+            return "None"
+        else:
+            unboxed = ", ".join(self._unboxed(argument) if builtin is None or builtin.unboxed else argument
+                                for argument in arguments)
+            self._emit(f"{assign}{callee}({unboxed})", CALL_BUILTIN, [callee] + arguments)
+        return temp
+
+    def visit_list_element(self, list_el: Classes.ListElement) -> str:
+        self._lineno = list_el.lineno
+        list_, index = self._operands([list_el.left_expr, list_el.right_expr])
+        temp = self._temp()
+        self._emit(f"{temp} = {list_}[{self._unboxed(index)}]", ITEM, (list_, index))
+        return temp
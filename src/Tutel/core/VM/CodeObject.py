@@ -0,0 +1,81 @@
+from array import array
+
+from Tutel.core.InterpreterModule.AttributeCache import AttributeCache
+from Tutel.core.InterpreterModule.Builtin import Builtin
+from Tutel.core.VM.OpCodes import OpCode
+
+
+class CodeObject:
+    """
+    Bytecode of a single Tutel function.
+    Instructions are kept in parallel arrays of opcodes, arguments and line numbers (the line table),
+    names of local variables are kept in a slot table and referenced by their index.
+    """
+
+    def __init__(self, name: str, name_lineno: int, lineno: int, params: list[str]) -> None:
+        self.name = name
+        self.name_lineno = name_lineno
+        self.lineno = lineno
+        self.params = params
+        self.ops = array("B")
+        self.args = array("i")
+        self.lines = array("I")
+        self.constants: list = []
+        self.names: list[str] = []
+        self.varnames: list[str] = []
+        # Inline caches of DotOperators read by GET_ATTR and LOAD_METHOD
+        self.attribute_caches: list[AttributeCache] = []
+        # Builtin called by CALL_BUILTIN and the number of arguments it's called with
+        self.builtin_calls: list[tuple[Builtin, int]] = []
+        # Index of every name in varnames, used as slots of stack frames
+        self.slots: dict[str, int] = {}
+        # (first instruction, instruction after last one, stack index of iterable) of every for loop
+        self.loops: list[tuple[int, int, int]] = []
+        self._constants_index: dict[tuple[type, any], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def emit(self, op: OpCode, arg: int = 0, lineno: int = None) -> int:
+        self.ops.append(op)
+        self.args.append(arg)
+        self.lines.append(self.lines[-1] if lineno is None and self.lines else lineno or self.lineno)
+        return len(self.ops) - 1
+
+    def patch(self, index: int, arg: int) -> None:
+        self.args[index] = arg
+
+    def add_constant(self, value) -> int:
+        try:
+            key = (type(value), value)
+            if (index := self._constants_index.get(key)) is None:
+                index = self._constants_index[key] = len(self.constants)
+                self.constants.append(value)
+            return index
+        except TypeError:
+            self.constants.append(value)
+            return len(self.constants) - 1
+
+    def add_name(self, name: str) -> int:
+        if name not in self.names:
+            self.names.append(name)
+        return self.names.index(name)
+
+    def add_attribute_cache(self, cache: AttributeCache) -> int:
+        self.attribute_caches.append(cache)
+        return len(self.attribute_caches) - 1
+
+    def add_builtin_call(self, builtin: Builtin, args_count: int) -> int:
+        self.builtin_calls.append((builtin, args_count))
+        return len(self.builtin_calls) - 1
+
+    def add_varname(self, name: str) -> int:
+        if (index := self.slots.get(name)) is None:
+            index = self.slots[name] = len(self.varnames)
+            self.varnames.append(name)
+        return index
+
+
+class CompiledProgram:
+    def __init__(self, functions: dict[str, CodeObject]) -> None:
+        self.functions = functions
@@ -0,0 +1,259 @@
+from types import ModuleType
+
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Linker import Linker, Binding
+from Tutel.core.InterpreterModule.Operators import modifying_operators, one_sided_operators, two_sided_operators
+from Tutel.core.ParserModule import Classes
+from Tutel.core.ParserModule.Resolver import Resolver
+from Tutel.core.VM.CodeObject import CodeObject, CompiledProgram
+from Tutel.core.VM.OpCodes import OpCode, RETURN_FROM_LOOP, RETURN_FROM_IF_BODY
+
+MODIFYING_OPERATORS = list(modifying_operators)
+ONE_SIDED_OPERATORS = list(one_sided_operators)
+TWO_SIDED_OPERATORS = list(two_sided_operators)
+SHORT_CIRCUIT_JUMPS = {"and": OpCode.JUMP_IF_FALSE_OR_POP, "or": OpCode.JUMP_IF_TRUE_OR_POP}
+
+
+class Compiler:
+    """
+    Compiles Classes.Program into bytecode executed by VirtualMachine.
+    Nodes are visited in the same order as Interpreter visits them and a TRACE instruction is emitted wherever
+    Interpreter updates its line number, so debug callbacks are called at the very same moments.
+    Like in Interpreter, identifiers evaluated by accept are names, identifiers evaluated as values are looked up.
+    """
+
+    def __init__(self, builtins: ModuleType = TutelBuiltins) -> None:
+        self.builtins = builtins
+        self.code: CodeObject | None = None
+        self._loops = 0
+        self._for_loops = 0
+        self._if_bodies = 0
+
+    def compile(self, program: Classes.Program) -> CompiledProgram:
+        return program.accept(self)
+
+    def _emit(self, op: OpCode, arg: int = 0, lineno: int = None) -> int:
+        return self.code.emit(op, arg, lineno)
+
+    def _here(self) -> int:
+        return len(self.code)
+
+    def _value(self, node) -> None:
+        if type(node) != Classes.Identifier:
+            node.accept(self)
+            return
+        name = node.value
+        if node.binding == Binding.BUILTIN:
+            self._emit(OpCode.LOAD_BUILTIN, self.code.add_name(name))
+        elif node.binding == Binding.FUNCTION:
+            self._emit(OpCode.LOAD_FUNCTION, self.code.add_name(name))
+        else:
+            self._emit(OpCode.LOAD_LOCAL, self.code.add_varname(name))
+
+    def _store(self, name: str) -> None:
+        self._emit(OpCode.STORE_LOCAL, self.code.add_varname(name))
+
+    def visit_program(self, program: Classes.Program) -> CompiledProgram:
+        Resolver().resolve(program)
+        Linker(builtins=self.builtins).link(program)
+        return CompiledProgram({name: function.accept(self) for name, function in program.functions.items()})
+
+    def visit_function(self, function: Classes.Function) -> CodeObject:
+        params = [param.value for param in function.params]
+        self.code = CodeObject(function.name.value, function.name.lineno, function.lineno, params)
+        self._loops = 0
+        self._for_loops = 0
+        self._if_bodies = 0
+        self._emit(OpCode.TRACE, lineno=function.lineno)
+        for name in function.slots:
+            self.code.add_varname(name)
+        self._emit(OpCode.BIND_ARGUMENTS)
+        function.statements.accept(self)
+        self._emit(OpCode.END)
+        code, self.code = self.code, None
+        return code
+
+    def visit_block(self, block: Classes.Block) -> None:
+        self._emit(OpCode.TRACE, lineno=block.lineno)
+        for statement in block:
+            self._statement(statement)
+            self._return()
+
+    visit_else_block = visit_block
+
+    def _return(self) -> None:
+        flags = (RETURN_FROM_LOOP if self._loops else 0) | (RETURN_FROM_IF_BODY if self._if_bodies else 0)
+        self._emit(OpCode.RETURN, flags)
+
+    def _statement(self, statement) -> None:
+        statement.accept(self)
+        if not isinstance(statement, (Classes.IfStatement, Classes.ForStatement, Classes.WhileStatement,
+                                      Classes.ReturnStatement, Classes.Assignment)):
+            self._emit(OpCode.POP_TOP)
+
+    def visit_atom(self, atom: Classes.Atom) -> None:
+        self._emit(OpCode.LOAD_CONST, self.code.add_constant(atom.value))
+
+    def visit_identifier(self, identifier: Classes.Identifier) -> None:
+        self._emit(OpCode.LOAD_CONST, self.code.add_constant(identifier.value))
+
+    def visit_list(self, list_: Classes.List) -> None:
+        for el in list_.value:
+            self._value(el)
+        self._emit(OpCode.BUILD_LIST, len(list_.value))
+
+    def visit_if_statement(self, if_stmt: Classes.IfStatement) -> None:
+        self._emit(OpCode.TRACE, lineno=if_stmt.lineno)
+        self._emit(OpCode.SET_DO_ELSE, 1)
+        if_stmt.condition.accept(self)
+        jump_over_body = self._emit(OpCode.POP_JUMP_IF_FALSE)
+        self._if_bodies += 1
+        if_stmt.statements.accept(self)
+        self._emit(OpCode.SET_DO_ELSE, 0)
+        self.code.patch(jump_over_body, self._here())
+        jumps_to_end = [self._emit(OpCode.JUMP_IF_NOT_DO_ELSE)]
+        # Like in Interpreter, set return flag stops checking elif blocks, but else block still can be executed
+        jumps_to_else = []
+        for elif_stmt in if_stmt.elif_stmts:
+            elif_stmt.accept(self)
+            jumps_to_else.append(self._emit(OpCode.JUMP_IF_RETURN_FLAG))
+        self._if_bodies -= 1
+        for jump in jumps_to_else:
+            self.code.patch(jump, self._here())
+        if if_stmt.else_stmt:
+            jumps_to_end.append(self._emit(OpCode.JUMP_IF_NOT_DO_ELSE))
+            if_stmt.else_stmt.accept(self)
+        for jump in jumps_to_end:
+            self.code.patch(jump, self._here())
+
+    def visit_elif_block(self, elif_block: Classes.ElifBlock) -> None:
+        self._emit(OpCode.TRACE, lineno=elif_block.lineno)
+        elif_block.condition.accept(self)
+        jump_over_body = self._emit(OpCode.POP_JUMP_IF_FALSE)
+        elif_block.statements.accept(self)
+        self._emit(OpCode.SET_DO_ELSE, 0)
+        self.code.patch(jump_over_body, self._here())
+
+    def visit_for_statement(self, for_stmt: Classes.ForStatement) -> None:
+        self._emit(OpCode.TRACE, lineno=for_stmt.lineno)
+        self._value(for_stmt.iterable)
+        start = self._emit(OpCode.SET_IN_LOOP, 1)
+        self._emit(OpCode.GET_ITER)
+        loop = self._emit(OpCode.FOR_ITER)
+        self._emit(OpCode.WRAP_VALUE)
+        self._store(for_stmt.iterator.value)
+        self._loops += 1
+        self._for_loops += 1
+        for_stmt.statements.accept(self)
+        if not for_stmt.statements:
+            self._return()
+        self._loops -= 1
+        self._for_loops -= 1
+        self._emit(OpCode.JUMP, loop)
+        self.code.patch(loop, self._here())
+        # The iterable stays on the stack under its iterator, right above iterables of enclosing for loops
+        self.code.loops.append((start, self._here(), 2 * self._for_loops))
+        self._emit(OpCode.SET_IN_LOOP, 0)
+
+    def visit_while_statement(self, while_stmt: Classes.WhileStatement) -> None:
+        self._emit(OpCode.TRACE, lineno=while_stmt.lineno)
+        loop = self._here()
+        while_stmt.condition.accept(self)
+        jump_to_end = self._emit(OpCode.POP_JUMP_IF_FALSE)
+        self._emit(OpCode.SET_IN_LOOP, 1)
+        self._loops += 1
+        while_stmt.statements.accept(self)
+        if not while_stmt.statements:
+            self._return()
+        self._loops -= 1
+        self._emit(OpCode.JUMP, loop)
+        self.code.patch(jump_to_end, self._here())
+        self._emit(OpCode.SET_IN_LOOP, 0)
+
+    def visit_return_statement(self, return_stmt: Classes.ReturnStatement) -> None:
+        self._emit(OpCode.TRACE, lineno=return_stmt.lineno)
+        self._emit(OpCode.SET_RETURN_FLAG)
+        for value in return_stmt.values:
+            value.accept(self)
+        self._emit(OpCode.STORE_RETURNED, len(return_stmt.values))
+
+    def visit_basic_assignment(self, assignment: Classes.BasicAssignment) -> None:
+        self._emit(OpCode.TRACE, lineno=assignment.lineno)
+        if not issubclass(type(assignment.left_expr), Classes.Assignable):
+            self._emit(OpCode.CANNOT_ASSIGN, self.code.add_constant(assignment.left_expr))
+            return
+        if type(assignment.left_expr) == Classes.Identifier:
+            self._value(assignment.right_expr)
+            self._emit(OpCode.WRAP_VALUE)
+            self._store(assignment.left_expr.value)
+        else:
+            assignment.left_expr.accept(self)
+            self._value(assignment.right_expr)
+            self._emit(OpCode.WRAP_VALUE)
+            self._emit(OpCode.STORE_DYNAMIC)
+
+    def visit_modifying_assignment(self, assignment: Classes.ModifyingAssignment) -> None:
+        self._emit(OpCode.TRACE, lineno=assignment.lineno)
+        if type(assignment.left_expr) == Classes.Identifier:
+            self._emit(OpCode.LOAD_MODIFIED, self.code.add_varname(assignment.left_expr.value))
+        else:
+            assignment.left_expr.accept(self)
+            self._emit(OpCode.LOAD_MODIFIED_DYNAMIC)
+        self._value(assignment.right_expr)
+        self._emit(OpCode.INPLACE, MODIFYING_OPERATORS.index(assignment.operator))
+
+    def visit_one_sided_expression(self, expr: Classes.OneSidedExpression) -> None:
+        self._emit(OpCode.TRACE, lineno=expr.lineno)
+        self._value(expr.value)
+        self._emit(OpCode.UNARY, ONE_SIDED_OPERATORS.index(expr.operator))
+
+    def visit_two_sided_expression(self, expr: Classes.TwoSidedExpression) -> None:
+        self._emit(OpCode.TRACE, lineno=expr.lineno)
+        self._value(expr.left_expr)
+        if expr.operator in SHORT_CIRCUIT_JUMPS:
+            # Left operand stays on the stack as the result if it decides it
+            jump_over_right = self._emit(SHORT_CIRCUIT_JUMPS[expr.operator])
+            self._value(expr.right_expr)
+            self.code.patch(jump_over_right, self._here())
+            return
+        self._value(expr.right_expr)
+        if expr.operator in TWO_SIDED_OPERATORS:
+            self._emit(OpCode.BINARY, TWO_SIDED_OPERATORS.index(expr.operator))
+        else:
+            self._emit(OpCode.BINARY, -self.code.add_constant(expr.operator) - 1)
+
+    def visit_dot_operator(self, obj: Classes.DotOperator) -> None:
+        self._emit(OpCode.TRACE, lineno=obj.lineno)
+        self._value(obj.left_expr)
+        self._emit(OpCode.GET_ATTR, self.code.add_attribute_cache(obj.cache))
+
+    def visit_fun_call(self, fun_call: Classes.FunCall) -> None:
+        self._emit(OpCode.TRACE, lineno=fun_call.lineno)
+        if type(fun_call.left_expr) == Classes.DotOperator:
+            return self._method_call(fun_call)
+        if fun_call.builtin is not None:
+            for arg in fun_call.right_expr:
+                self._value(arg)
+            self._emit(OpCode.CALL_BUILTIN, self.code.add_builtin_call(fun_call.builtin, len(fun_call.right_expr)))
+            return
+        self._value(fun_call.left_expr)
+        for arg in fun_call.right_expr:
+            self._value(arg)
+        self._emit(OpCode.CALL, len(fun_call.right_expr))
+
+    def _method_call(self, fun_call: Classes.FunCall) -> None:
+        method = fun_call.left_expr
+        self._emit(OpCode.TRACE, lineno=method.lineno)
+        self._value(method.left_expr)
+        self._emit(OpCode.LOAD_METHOD, self.code.add_attribute_cache(method.cache))
+        for arg in fun_call.right_expr:
+            self._value(arg)
+        # CALL_METHOD skips the following CALL, which calls attributes that are not methods
+        self._emit(OpCode.CALL_METHOD, len(fun_call.right_expr))
+        self._emit(OpCode.CALL, len(fun_call.right_expr))
+
+    def visit_list_element(self, list_el: Classes.ListElement) -> None:
+        self._emit(OpCode.TRACE, lineno=list_el.lineno)
+        self._value(list_el.left_expr)
+        self._value(list_el.right_expr)
+        self._emit(OpCode.GET_ITEM)
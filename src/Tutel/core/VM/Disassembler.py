@@ -0,0 +1,63 @@
+from Tutel.core.VM.CodeObject import CodeObject, CompiledProgram
+from Tutel.core.VM.Compiler import MODIFYING_OPERATORS, ONE_SIDED_OPERATORS, TWO_SIDED_OPERATORS
+from Tutel.core.VM.OpCodes import OpCode, JUMP_OPS
+
+NO_ARG_OPS = {
+    OpCode.TRACE, OpCode.LOAD_MODIFIED_DYNAMIC, OpCode.STORE_DYNAMIC, OpCode.WRAP_VALUE, OpCode.POP_TOP,
+    OpCode.GET_ITEM, OpCode.GET_ITER, OpCode.BIND_ARGUMENTS, OpCode.SET_RETURN_FLAG, OpCode.END,
+}
+
+
+def describe_arg(code: CodeObject, op: OpCode, arg: int) -> str:
+    if op in (OpCode.LOAD_CONST, OpCode.CANNOT_ASSIGN):
+        return repr(code.constants[arg])
+    if op in (OpCode.LOAD_BUILTIN, OpCode.LOAD_FUNCTION):
+        return code.names[arg]
+    if op in (OpCode.GET_ATTR, OpCode.LOAD_METHOD):
+        return code.attribute_caches[arg].name
+    if op == OpCode.CALL_BUILTIN:
+        return code.builtin_calls[arg][0].name
+    if op in (OpCode.LOAD_LOCAL, OpCode.LOAD_MODIFIED, OpCode.STORE_LOCAL):
+        return code.varnames[arg]
+    if op == OpCode.UNARY:
+        return ONE_SIDED_OPERATORS[arg]
+    if op == OpCode.BINARY:
+        return TWO_SIDED_OPERATORS[arg] if arg >= 0 else repr(code.constants[-arg - 1])
+    if op == OpCode.INPLACE:
+        return MODIFYING_OPERATORS[arg]
+    if op in JUMP_OPS:
+        return f"to {arg}"
+    return ""
+
+
+def disassemble_code(code: CodeObject) -> str:
+    result = [f"Disassembly of {code.name}({', '.join(code.params)}), line {code.lineno}:"]
+    jump_targets = {arg for op, arg in zip(code.ops, code.args) if op in JUMP_OPS}
+    previous_line = None
+    for index, (op, arg, line) in enumerate(zip(code.ops, code.args, code.lines)):
+        op = OpCode(op)
+        line_column = str(line) if line != previous_line else ""
+        previous_line = line
+        marker = ">>" if index in jump_targets else ""
+        arg_column = "" if op in NO_ARG_OPS else str(arg)
+        description = describe_arg(code, op, arg)
+        result.append(f"{line_column:>5} {marker:>2} {index:>5} {op.name:<22} {arg_column:>5}"
+                      f"{f' ({description})' if description else ''}".rstrip())
+    return "\n".join(result)
+
+
+def disassemble(program: CompiledProgram) -> str:
+    return "\n\n".join(disassemble_code(code) for code in program.functions.values())
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from Tutel.core.LexerModule.Lexer import Lexer
+    from Tutel.core.ParserModule.Parser import Parser
+    from Tutel.core.VM.Compiler import Compiler
+
+    arg_parser = argparse.ArgumentParser(description="Prints bytecode of a Tutel script")
+    arg_parser.add_argument("filename", type=argparse.FileType("r"), help="Relative or absolute path to a script")
+    args = arg_parser.parse_args()
+    print(disassemble(Compiler().compile(Parser().parse(Lexer(args.filename.read())))))
@@ -0,0 +1,51 @@
+from enum import IntEnum, auto
+
+
+# noinspection PyArgumentList
+class OpCode(IntEnum):
+    TRACE = auto()
+    LOAD_CONST = auto()
+    LOAD_LOCAL = auto()
+    LOAD_BUILTIN = auto()
+    LOAD_FUNCTION = auto()
+    LOAD_MODIFIED = auto()
+    LOAD_MODIFIED_DYNAMIC = auto()
+    STORE_LOCAL = auto()
+    STORE_DYNAMIC = auto()
+    WRAP_VALUE = auto()
+    BUILD_LIST = auto()
+    POP_TOP = auto()
+    UNARY = auto()
+    BINARY = auto()
+    INPLACE = auto()
+    GET_ATTR = auto()
+    LOAD_METHOD = auto()
+    GET_ITEM = auto()
+    CALL = auto()
+    CALL_METHOD = auto()
+    CALL_BUILTIN = auto()
+    JUMP = auto()
+    POP_JUMP_IF_FALSE = auto()
+    JUMP_IF_FALSE_OR_POP = auto()
+    JUMP_IF_TRUE_OR_POP = auto()
+    JUMP_IF_NOT_DO_ELSE = auto()
+    JUMP_IF_RETURN_FLAG = auto()
+    SET_DO_ELSE = auto()
+    SET_IN_LOOP = auto()
+    GET_ITER = auto()
+    FOR_ITER = auto()
+    BIND_ARGUMENTS = auto()
+    SET_RETURN_FLAG = auto()
+    STORE_RETURNED = auto()
+    RETURN = auto()
+    CANNOT_ASSIGN = auto()
+    END = auto()
+
+
+# Arguments of these instructions are indexes of other instructions
+JUMP_OPS = {OpCode.JUMP, OpCode.POP_JUMP_IF_FALSE, OpCode.JUMP_IF_FALSE_OR_POP, OpCode.JUMP_IF_TRUE_OR_POP,
+            OpCode.JUMP_IF_NOT_DO_ELSE, OpCode.JUMP_IF_RETURN_FLAG, OpCode.FOR_ITER}
+# RETURN leaves the function only if return flag is set, it follows every statement just like Interpreter checks
+# the flag after every statement. Its flags describe the state left by unwinding enclosing statements
+RETURN_FROM_LOOP = 1
+RETURN_FROM_IF_BODY = 2
@@ -0,0 +1,370 @@
+from Tutel.common.ErrorType import MismatchedArgsCountException, OutOfRangeException, TypeException, \
+    UnknownException, Stop, RecursionException
+from Tutel.common.ErrorType import NotIterableException, CannotAssignException, NotDefinedException, \
+    UnsupportedOperandException, BadOperandForUnaryException, AttributeException
+from Tutel.core.InterpreterModule.AttributeCache import UNBOUND
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Operators import modifying_operators, one_sided_operators, two_sided_operators
+from Tutel.core.InterpreterModule.Value import Value, box, unbox, type_name
+from Tutel.core.ParserModule import Classes
+from Tutel.core.VM.CodeObject import CodeObject, CompiledProgram
+from Tutel.core.VM.Compiler import Compiler, MODIFYING_OPERATORS, ONE_SIDED_OPERATORS, TWO_SIDED_OPERATORS
+from Tutel.core.VM.OpCodes import OpCode, RETURN_FROM_LOOP, RETURN_FROM_IF_BODY
+
+TRACE = int(OpCode.TRACE)
+LOAD_CONST = int(OpCode.LOAD_CONST)
+LOAD_LOCAL = int(OpCode.LOAD_LOCAL)
+LOAD_BUILTIN = int(OpCode.LOAD_BUILTIN)
+LOAD_FUNCTION = int(OpCode.LOAD_FUNCTION)
+LOAD_MODIFIED = int(OpCode.LOAD_MODIFIED)
+LOAD_MODIFIED_DYNAMIC = int(OpCode.LOAD_MODIFIED_DYNAMIC)
+STORE_LOCAL = int(OpCode.STORE_LOCAL)
+STORE_DYNAMIC = int(OpCode.STORE_DYNAMIC)
+WRAP_VALUE = int(OpCode.WRAP_VALUE)
+BUILD_LIST = int(OpCode.BUILD_LIST)
+POP_TOP = int(OpCode.POP_TOP)
+UNARY = int(OpCode.UNARY)
+BINARY = int(OpCode.BINARY)
+INPLACE = int(OpCode.INPLACE)
+GET_ATTR = int(OpCode.GET_ATTR)
+LOAD_METHOD = int(OpCode.LOAD_METHOD)
+GET_ITEM = int(OpCode.GET_ITEM)
+CALL = int(OpCode.CALL)
+CALL_METHOD = int(OpCode.CALL_METHOD)
+CALL_BUILTIN = int(OpCode.CALL_BUILTIN)
+JUMP = int(OpCode.JUMP)
+POP_JUMP_IF_FALSE = int(OpCode.POP_JUMP_IF_FALSE)
+JUMP_IF_FALSE_OR_POP = int(OpCode.JUMP_IF_FALSE_OR_POP)
+JUMP_IF_TRUE_OR_POP = int(OpCode.JUMP_IF_TRUE_OR_POP)
+JUMP_IF_NOT_DO_ELSE = int(OpCode.JUMP_IF_NOT_DO_ELSE)
+JUMP_IF_RETURN_FLAG = int(OpCode.JUMP_IF_RETURN_FLAG)
+SET_DO_ELSE = int(OpCode.SET_DO_ELSE)
+SET_IN_LOOP = int(OpCode.SET_IN_LOOP)
+GET_ITER = int(OpCode.GET_ITER)
+FOR_ITER = int(OpCode.FOR_ITER)
+BIND_ARGUMENTS = int(OpCode.BIND_ARGUMENTS)
+SET_RETURN_FLAG = int(OpCode.SET_RETURN_FLAG)
+STORE_RETURNED = int(OpCode.STORE_RETURNED)
+RETURN = int(OpCode.RETURN)
+CANNOT_ASSIGN = int(OpCode.CANNOT_ASSIGN)
+END = int(OpCode.END)
+
+MODIFYING_FUNCTIONS = [modifying_operators[operator] for operator in MODIFYING_OPERATORS]
+ONE_SIDED_FUNCTIONS = [one_sided_operators[operator] for operator in ONE_SIDED_OPERATORS]
+TWO_SIDED_FUNCTIONS = [two_sided_operators[operator] for operator in TWO_SIDED_OPERATORS]
+
+DEFAULT_MAX_CALL_DEPTH = 100_000
+
+
+class VirtualMachine(Interpreter):
+    """
+    Compiles the program with Compiler and executes its bytecode.
+    Tutel calls don't nest Python calls, state of every unfinished call is kept on an explicit stack, so recursion
+    depth is limited only by max_call_depth. Execution paused from the debug callback returns from execute
+    and continues when resume is called.
+    """
+
+    def __init__(self, *args, max_call_depth: int = DEFAULT_MAX_CALL_DEPTH, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compiled_program: CompiledProgram | None = None
+        self._compiled_from = None
+        self._codes: dict[int, CodeObject] = {}
+        self.max_call_depth = max_call_depth
+        self.paused = False
+        self._pause_requested = False
+        # (code, function, pc, operand stack, arguments) of every unfinished call, the last one is executed next
+        self._calls: list[tuple[CodeObject, Classes.Function, int, list, list | None]] = []
+
+    def clean_up(self):
+        super().clean_up()
+        self.paused = False
+        self._pause_requested = False
+        self._calls = []
+
+    def pause(self):
+        self._pause_requested = True
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        try:
+            self._execute()
+        except RecursionError:
+            self.error_handler.handle_error(RecursionException(), self.call_stack)
+
+    def _run(self, function: Classes.Function):
+        if self._compiled_from is not self.program_to_execute:
+            self.compiled_program = Compiler(self.builtins).compile(self.program_to_execute)
+            self._codes = {id(function): self.compiled_program.functions[name]
+                           for name, function in self.program_to_execute.functions.items()}
+            self._compiled_from = self.program_to_execute
+        code = self._codes[id(function)]
+        self._add_stack_frame(code.name, code.name_lineno, code.slots)
+        self._calls.append((code, function, 0, [], None))
+        self._execute()
+
+    def _execute(self):
+        calls = self._calls
+        codes = self._codes
+        code, function, pc, stack, arguments = calls.pop()
+        ops, args, lines = code.ops, code.args, code.lines
+        constants, names, varnames = code.constants, code.names, code.varnames
+        attribute_caches, builtin_calls = code.attribute_caches, code.builtin_calls
+        loc = self.call_stack[-1].values
+        error_handler = self.error_handler
+        push = stack.append
+        pop = stack.pop
+        try:
+            while True:
+                op = ops[pc]
+                arg = args[pc]
+                pc += 1
+                if op == TRACE:
+                    # Same as Interpreter.lineno setter without going through the properties
+                    if self._stopped:
+                        raise Stop
+                    if self.lineno_update_enabled and ((lineno := lines[pc - 1]) != self._lineno or self.in_loop):
+                        self.call_stack[-1].lineno = lineno
+                        self._lineno = lineno
+                        self.debug_callback()
+                        if self._pause_requested:
+                            self._pause_requested = False
+                            self.paused = True
+                            calls.append((code, function, pc, stack, arguments))
+                            return
+                elif op == RETURN:
+                    if self.return_flag:
+                        if arg & RETURN_FROM_LOOP:
+                            self.in_loop = False
+                        if arg & RETURN_FROM_IF_BODY:
+                            self.do_else = False
+                        # Every function ends with END
+                        pc = len(ops) - 1
+                elif op == LOAD_LOCAL:
+                    if (value := loc[arg]) is None:
+                        error_handler.handle_error(NotDefinedException(name=varnames[arg]), self.call_stack)
+                    push(value)
+                elif op == BINARY:
+                    right = pop()
+                    left = pop()
+                    try:
+                        if arg < 0:
+                            raise KeyError(constants[-arg - 1])
+                        push(TWO_SIDED_FUNCTIONS[arg](left, right))
+                    except (KeyError, TypeError):
+                        operator = constants[-arg - 1] if arg < 0 else TWO_SIDED_OPERATORS[arg]
+                        error_handler.handle_error(
+                            UnsupportedOperandException(operator=operator, l_type=type_name(left),
+                                                        r_type=type_name(right)), self.call_stack)
+                elif op == LOAD_BUILTIN:
+                    push(getattr(self.builtins, names[arg]))
+                elif op == LOAD_CONST:
+                    push(constants[arg])
+                elif op == CALL_BUILTIN:
+                    builtin, args_count = builtin_calls[arg]
+                    arguments_ = stack[len(stack) - args_count:]
+                    del stack[len(stack) - args_count:]
+                    if builtin.unboxed and builtin.accepts(args_count):
+                        try:
+                            push(builtin.function(*[unbox(argument) for argument in arguments_]))
+                        except TypeError as e:
+                            error_handler.handle_error(TypeException(e), self.call_stack)
+                        except Exception as e:
+                            error_handler.handle_error(UnknownException(e), self.call_stack)
+                    else:
+                        push(self._call_builtin(builtin, arguments_))
+                elif op == CALL:
+                    arguments_ = stack[len(stack) - arg:]
+                    del stack[len(stack) - arg:]
+                    callee = pop()
+                    if type(callee) == Classes.Function:
+                        if len(self.call_stack) >= self.max_call_depth:
+                            error_handler.handle_error(RecursionException(), self.call_stack)
+                        calls.append((code, function, pc, stack, None))
+                        code, function, pc, stack, arguments = codes[id(callee)], callee, 0, [], arguments_
+                        ops, args, lines = code.ops, code.args, code.lines
+                        constants, names, varnames = code.constants, code.names, code.varnames
+                        attribute_caches, builtin_calls = code.attribute_caches, code.builtin_calls
+                        self._add_stack_frame(code.name, code.name_lineno, code.slots)
+                        loc = self.call_stack[-1].values
+                        push = stack.append
+                        pop = stack.pop
+                    else:
+                        try:
+                            push(callee(*[unbox(argument) for argument in arguments_]))
+                        except TypeError as e:
+                            error_handler.handle_error(TypeException(e), self.call_stack)
+                        except Exception as e:
+                            error_handler.handle_error(UnknownException(e), self.call_stack)
+                elif op == GET_ATTR:
+                    left = pop()
+                    try:
+                        push(attribute_caches[arg].get(left))
+                    except AttributeError:
+                        error_handler.handle_error(
+                            AttributeException(type_name=type_name(left), value=attribute_caches[arg].name),
+                            self.call_stack)
+                elif op == LOAD_METHOD:
+                    left = pop()
+                    try:
+                        stack.extend(attribute_caches[arg].get_method(left))
+                    except AttributeError:
+                        error_handler.handle_error(
+                            AttributeException(type_name=type_name(left), value=attribute_caches[arg].name),
+                            self.call_stack)
+                        stack.extend((None, UNBOUND))
+                elif op == CALL_METHOD:
+                    owner = stack[len(stack) - arg - 1]
+                    if owner is UNBOUND:
+                        # Attribute is not a method, it's called by the following CALL
+                        del stack[len(stack) - arg - 1]
+                    else:
+                        pc += 1
+                        arguments_ = stack[len(stack) - arg:]
+                        callee = stack[len(stack) - arg - 2]
+                        del stack[len(stack) - arg - 2:]
+                        try:
+                            push(callee(owner, *[unbox(argument) for argument in arguments_]))
+                        except TypeError as e:
+                            error_handler.handle_error(TypeException(e), self.call_stack)
+                        except Exception as e:
+                            error_handler.handle_error(UnknownException(e), self.call_stack)
+                elif op == WRAP_VALUE:
+                    stack[-1] = box(stack[-1])
+                elif op == STORE_LOCAL:
+                    loc[arg] = pop()
+                elif op == POP_TOP:
+                    pop()
+                elif op == POP_JUMP_IF_FALSE:
+                    if not pop():
+                        pc = arg
+                elif op == JUMP:
+                    pc = arg
+                elif op == JUMP_IF_FALSE_OR_POP:
+                    if stack[-1]:
+                        pop()
+                    else:
+                        pc = arg
+                elif op == JUMP_IF_TRUE_OR_POP:
+                    if stack[-1]:
+                        pc = arg
+                    else:
+                        pop()
+                elif op == FOR_ITER:
+                    try:
+                        push(next(stack[-1]))
+                    except StopIteration:
+                        del stack[-2:]
+                        pc = arg
+                elif op == GET_ITEM:
+                    index = pop()
+                    list_ = pop()
+                    try:
+                        push(list_[unbox(index)])
+                    except IndexError:
+                        error_handler.handle_error(OutOfRangeException(), self.call_stack)
+                elif op == LOAD_FUNCTION:
+                    push(self.program_globals[names[arg]])
+                elif op == SET_IN_LOOP:
+                    self.in_loop = bool(arg)
+                elif op == SET_DO_ELSE:
+                    self.do_else = bool(arg)
+                elif op == JUMP_IF_NOT_DO_ELSE:
+                    if not self.do_else:
+                        pc = arg
+                elif op == JUMP_IF_RETURN_FLAG:
+                    if self.return_flag:
+                        pc = arg
+                elif op == UNARY:
+                    value = pop()
+                    try:
+                        push(ONE_SIDED_FUNCTIONS[arg](value))
+                    except TypeError:
+                        error_handler.handle_error(
+                            BadOperandForUnaryException(type_name=type_name(value)), self.call_stack)
+                elif op == LOAD_MODIFIED:
+                    if (value := loc[arg]) is None:
+                        error_handler.handle_error(NotDefinedException(name=varnames[arg]), self.call_stack)
+                    push(value)
+                elif op == INPLACE:
+                    value = pop()
+                    variable = pop()
+                    try:
+                        MODIFYING_FUNCTIONS[arg](variable, value)
+                    except TypeError:
+                        error_handler.handle_error(
+                            UnsupportedOperandException(l_type=type_name(variable), r_type=type_name(value),
+                                                        operator=MODIFYING_OPERATORS[arg]), self.call_stack)
+                elif op == BUILD_LIST:
+                    elements = [box(element) for element in stack[len(stack) - arg:]]
+                    del stack[len(stack) - arg:]
+                    push(elements)
+                elif op == GET_ITER:
+                    push(iter(stack[-1]))
+                elif op == SET_RETURN_FLAG:
+                    self.return_flag = True
+                elif op == STORE_RETURNED:
+                    if arg == 0:
+                        self.last_returned = Value(None)
+                    elif arg == 1:
+                        self.last_returned = box(pop())
+                    else:
+                        self.last_returned = stack[len(stack) - arg:]
+                        del stack[len(stack) - arg:]
+                elif op == BIND_ARGUMENTS:
+                    if arguments is not None:
+                        if len(arguments) != len(code.params):
+                            error_handler.handle_error(
+                                MismatchedArgsCountException(
+                                    fun_name=function.name,
+                                    expected_min=len(code.params),
+                                    expected_max=len(code.params),
+                                    got_number=len(arguments)
+                                ), self.call_stack
+                            )
+                        for argument, param in zip(arguments, code.params):
+                            loc[code.slots[param]] = box(argument)
+                elif op == STORE_DYNAMIC:
+                    value = pop()
+                    self._set_local_var(pop(), value)
+                elif op == LOAD_MODIFIED_DYNAMIC:
+                    name = pop()
+                    if (value := self._get_local_var(name)) is None:
+                        error_handler.handle_error(NotDefinedException(name=name), self.call_stack)
+                    push(value)
+                elif op == CANNOT_ASSIGN:
+                    error_handler.handle_error(CannotAssignException(value=constants[arg]), self.call_stack)
+                elif op == END:
+                    self.return_flag = False
+                    self.function_args = None
+                    self._drop_stack_frame()
+                    if not calls:
+                        return
+                    code, function, pc, stack, arguments = calls.pop()
+                    ops, args, lines = code.ops, code.args, code.lines
+                    constants, names, varnames = code.constants, code.names, code.varnames
+                    attribute_caches, builtin_calls = code.attribute_caches, code.builtin_calls
+                    loc = self.call_stack[-1].values
+                    push = stack.append
+                    pop = stack.pop
+                    push(self.last_returned)
+                    if self._pause_requested:
+                        self._pause_requested = False
+                        self.paused = True
+                        calls.append((code, function, pc, stack, arguments))
+                        return
+                else:
+                    raise ValueError(f"Unknown opcode {op}")
+        except TypeError as error:
+            # Interpreter turns every TypeError raised inside of a for loop into NotIterableException,
+            # loops are sorted from the innermost one
+            for start, end, iterable_index in code.loops:
+                if start <= pc - 1 < end:
+                    error_handler.handle_error(
+                        NotIterableException(type_name=type_name(stack[iterable_index])),
+                        self.call_stack)
+            # Other ones are turned into TypeException by the caller
+            if not calls:
+                raise
+            error_handler.handle_error(TypeException(error), self.call_stack)
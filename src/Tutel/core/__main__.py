@@ -1,13 +1,18 @@
 import argparse
 import atexit
+import importlib.util
 import os
 import signal
 import sys
 from time import sleep
 
 import Tutel
+from Tutel.core.GuiModule.CommandSink import DEFAULT_BUFFER_SIZE
+from Tutel.core.InterpreterModule.Memoizer import DEFAULT_MEMOIZE_SIZE
+from Tutel.core.Runner.ProgramCache import DEFAULT_CACHE_SIZE
 from Tutel.core.Runner.TutelOptions import TutelOptions
 from Tutel.core.Runner.TutelRunner import TutelRunner
+from Tutel.core.VM.VirtualMachine import DEFAULT_MAX_CALL_DEPTH
 
 
 def get_arg_parser():
@@ -52,10 +57,134 @@ def get_arg_parser():
         "--output",
         required=False
     )
+    arg_parser.add_argument(
+        "--gui-buffer-size",
+        default=DEFAULT_BUFFER_SIZE,
+        type=int,
+        help="Number of characters of GUI commands buffered before they are written, 0 writes every command",
+    )
+    arg_parser.add_argument(
+        "--gui-batch",
+        default=False,
+        action="store_true",
+        help="Write buffered GUI commands as a single BATCH command",
+    )
+    arg_parser.add_argument(
+        "--gui-stats",
+        default=False,
+        action="store_true",
+        help="Print number of turtle state changes not sent to GUI, as nothing changed, to stderr",
+    )
+    arg_parser.add_argument(
+        "--gui-coalesce",
+        default=False,
+        action="store_true",
+        help="Merge consecutive forward moves of a turtle in the same direction into a single GUI command",
+    )
+    arg_parser.add_argument(
+        "--render",
+        default="",
+        metavar="IMAGE",
+        help="Draw the turtles into a PNG image, PPM if the path ends with .ppm or SVG if it ends with .svg, "
+             "without any display; PNG and PPM require numpy",
+    )
+    arg_parser.add_argument(
+        "--lexer",
+        default="default",
+        choices=["default", "fast"],
+        help="Lexer engine used to tokenize the script",
+    )
+    arg_parser.add_argument(
+        "--engine",
+        default="visitor",
+        choices=["visitor", "closure", "vm", "python"],
+        help="Engine used to execute the script, a script transpiled to Python can't be debugged",
+    )
+    arg_parser.add_argument(
+        "--trace-lines",
+        default=False,
+        action="store_true",
+        help="Track line numbers on every node like under the debugger instead of running in release mode",
+    )
+    arg_parser.add_argument(
+        "-O",
+        "--optimize",
+        default=False,
+        action="store_true",
+        help="Fold constant expressions, propagate constants and remove dead code before running the script",
+    )
+    arg_parser.add_argument(
+        "--report-dce",
+        default=False,
+        action="store_true",
+        help="Print dead code removed from the script to stderr, implies -O",
+    )
+    arg_parser.add_argument(
+        "--memoize",
+        default=False,
+        action="store_true",
+        help="Cache results of functions without side effects, works with visitor and closure engines, "
+             "other engines warn and run without it",
+    )
+    arg_parser.add_argument(
+        "--memoize-size",
+        default=DEFAULT_MEMOIZE_SIZE,
+        type=int,
+        help="Maximal number of results cached for a single function",
+    )
+    arg_parser.add_argument(
+        "--memoize-stats",
+        default=False,
+        action="store_true",
+        help="Print cache hits and misses of memoized functions to stderr, implies --memoize",
+    )
+    arg_parser.add_argument(
+        "--max-call-depth",
+        default=DEFAULT_MAX_CALL_DEPTH,
+        type=int,
+        help="Maximal depth of Tutel calls in the vm engine, which doesn't use Python recursion",
+    )
+    arg_parser.add_argument(
+        "--cache-dir",
+        default="",
+        help="Directory where parsed scripts are cached between runs. Entries are pickles signed with a key kept in "
+             "~/.tutel, a directory not owned by you or writable by others is refused",
+    )
+    arg_parser.add_argument(
+        "--cache-size",
+        default=DEFAULT_CACHE_SIZE,
+        type=int,
+        help="Maximal size of the cache directory in bytes",
+    )
+
+    subparsers = arg_parser.add_subparsers(dest="command")
+    transpile_parser = subparsers.add_parser("transpile",
+                                             help="Writes the script transpiled to Python to a file for inspection")
+    transpile_parser.add_argument(
+        "script",
+        type=argparse.FileType('r'),
+        help="Relative or absolute path to a script",
+    )
+    transpile_parser.add_argument(
+        "-o",
+        "--output",
+        dest="module_path",
+        default=None,
+        help="Path of the generated Python module, by default the script path with .py extension",
+    )
 
     return arg_parser
 
 
+def transpile(args, options: TutelOptions):
+    module_path = args.module_path or os.path.splitext(args.script.name)[0] + ".py"
+    with args.script as file:
+        code = file.read()
+    with open(module_path, "w") as file:
+        file.write(TutelRunner(code=code, options=options).transpile())
+    print(f"Transpiled script written to {module_path}")
+
+
 def main():
     arg_parser = get_arg_parser()
     args = arg_parser.parse_args()
@@ -67,13 +196,38 @@ def main():
 
     if args.vscode:
         options["gui"] = "vscode"
+    options["gui_buffer_size"] = args.gui_buffer_size
+    options["gui_batch"] = args.gui_batch
+    options["gui_stats"] = args.gui_stats
+    options["gui_coalesce"] = args.gui_coalesce
+    options["render_path"] = args.render
     options["verbose"] = args.verbose
+    options["lexer"] = args.lexer
+    options["engine"] = args.engine
+    options["release"] = not args.trace_lines
+    options["optimize"] = args.optimize or args.report_dce
+    options["report_dce"] = args.report_dce
+    options["memoize"] = args.memoize or args.memoize_stats
+    options["memoize_size"] = args.memoize_size
+    options["memoize_stats"] = args.memoize_stats
+    options["cache_dir"] = args.cache_dir
+    options["cache_size"] = args.cache_size
+    options["max_call_depth"] = args.max_call_depth
 
     if args.output:
         options["gui_out_path"] = args.output
 
     options = TutelOptions(**options)
 
+    if options.render_path and not options.render_path.lower().endswith(".svg") \
+            and importlib.util.find_spec("numpy") is None:
+        print("Rendering requires numpy, install it with: pip install numpy", file=sys.stderr)
+        exit(-1)
+
+    if args.command == "transpile":
+        transpile(args, options)
+        exit(0)
+
     code = args.code
     if args.filename:
         args.filename = os.path.realpath(args.filename.name)
@@ -1,3 +1,4 @@
+import functools
 import os
 import threading
 from enum import auto, Enum
@@ -8,13 +9,15 @@ from typing import Callable
 from Tutel import debugger
 from Tutel.common.ErrorHandler import ErrorHandler
 from Tutel.common.ErrorType import InterpreterException, Stop, TutelException
-from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core import GuiModule
 from Tutel.core.InterpreterModule.StackFrame import StackFrame
-from Tutel.core.LexerModule.Lexer import get_bp_possible_lines, Lexer
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.LexerModule.TokenBuffer import get_bp_possible_lines
 from Tutel.core.ParserModule.Classes import Visited
 from Tutel.core.ParserModule.Parser import Parser
 from Tutel.core.Runner.TutelOptions import TutelOptions
 from Tutel.core.Runner.TutelRunner import TutelRunner
+from Tutel.core.VM.VirtualMachine import VirtualMachine
 
 
 class StopEvent(Enum):
@@ -51,7 +54,9 @@ class TutelDebugger(TutelRunner):
         self.bp_possible_lines: dict[str, set[int]] = {}
         self.breakpoints: dict[str, dict[int, Visited | None]] = {}
         # self.expr_breakpoints: dict[str, list[tuple[int, Visited]]] = {}
-        self.interpreter = Interpreter(debug_callback=self.check_line)
+        self.interpreter = self._create_interpreter(debug_callback=self.check_line)
+        # Execution started or resumed on the debugger thread when the engine can be paused
+        self._continuation: Callable | None = None
         self.step_into_mode = False
         self.step_over_mode = False
         self.watched_frame = None
@@ -62,7 +67,7 @@ class TutelDebugger(TutelRunner):
             self.breakpoints[self.filename] = {}
             with open(self.filename, "r") as file:
                 self.code = file.read()
-            self.bp_possible_lines[self.filename] = get_bp_possible_lines(self.code)
+            self.bp_possible_lines[self.filename] = self._get_bp_possible_lines()
         if debugger.DEBUGGER_OUT:
             with open(debugger.DEBUGGER_OUT, "w"):
                 pass
@@ -70,8 +75,25 @@ class TutelDebugger(TutelRunner):
     def message(self, msg):
         pass
 
+    def _get_bp_possible_lines(self) -> set[int]:
+        lines = get_bp_possible_lines(self.tokens)
+        if not self.options.optimize:
+            return lines
+        try:
+            self._parse(debug=True)
+        except TutelException:
+            # Error is reported when the program is run
+            return lines
+        return lines - self.dead_code.dead_lines
+
+    @property
+    def cooperative(self) -> bool:
+        # Paused VirtualMachine returns from execute, so it doesn't need a thread blocked in the debug callback
+        return isinstance(self.interpreter, VirtualMachine)
+
     def start(self):
         self.run()
+        self._run_continuation()
 
     def _clean_up(self):
         self.step_into_mode = False
@@ -80,6 +102,7 @@ class TutelDebugger(TutelRunner):
         self.pause_mode = False
         # print("clean up")
         self.interpreter.clean_up()
+        GuiModule.GUI.close()
         if self.options.gui_out_path:
             with open(self.options.gui_out_path, "a") as file:
                 file.write('\n')
@@ -97,6 +120,9 @@ class TutelDebugger(TutelRunner):
         if self.options.gui_out_path:
             with open(self.options.gui_out_path, "w"):
                 pass
+        if self.cooperative:
+            self._continuation = functools.partial(self.interpreter.execute, self.program, "main")
+            return True
         thread = InterpreterThread(
             exec_fun=self.interpreter.execute,
             exec_args=(self.program, "main"),
@@ -107,6 +133,21 @@ class TutelDebugger(TutelRunner):
 
         return True
 
+    def _run_continuation(self):
+        continuation, self._continuation = self._continuation, None
+        if continuation is None:
+            return
+        try:
+            continuation()
+        except Stop:
+            self._clean_up()
+            return
+        except InterpreterException as e:
+            self._post_morten(e)
+            return
+        if not self.interpreter.paused:
+            self._clean_up()
+
     def check_line(self):
         if self.step_into_mode:
             self._break(StopEvent.StepInto)
@@ -116,6 +157,7 @@ class TutelDebugger(TutelRunner):
             self._break(StopEvent.Breakpoint)
 
     def _break(self, _type: StopEvent):
+        GuiModule.GUI.flush()
         self.message(f"Program stopped in function {self.interpreter.curr_frame.name} "
                      f"at line {self.interpreter.curr_frame.lineno}")
 
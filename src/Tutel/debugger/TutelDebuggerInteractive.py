@@ -10,7 +10,6 @@ from typing import Callable, Type, NamedTuple
 from Tutel import debugger
 from Tutel.common.ErrorType import InterpreterException, Stop, TutelDebuggerException
 from Tutel.common.Utils import mock_debug_callback
-from Tutel.core.LexerModule.Lexer import get_bp_possible_lines
 from Tutel.debugger import TutelDebugger
 from Tutel.debugger.RequestsHandler.Commands import Command
 from Tutel.debugger.RequestsHandler.DataStructures import DebuggerResponse, DebuggerEvent, DebuggerRequest, \
@@ -42,6 +41,11 @@ HELP = {
 }
 
 
+# Commands which start or end the program are not handled while it runs on the debugger thread,
+# the program is suspended until they are handled
+DEFERRED_COMMANDS = {Command.FILE, Command.RUN, Command.RUN_UNSTOPPABLE, Command.RESTART, Command.EXIT}
+
+
 class Action(NamedTuple):
     func: Callable
     args: list
@@ -71,6 +75,10 @@ class TutelDebuggerInteractive(TutelDebugger):
         self.message_handler = io.StringIO() if communication_class is WebSocketsRequestsHandler else sys.stdout
 
         self.resume_event = threading.Event()
+        # Requests received while the program was running on the debugger thread
+        self.deferred_requests: list[tuple[DebuggerRequest, DebuggerResponse]] = []
+        # Tells if the program was paused only to handle deferred requests
+        self.suspended = False
         atexit.register(self.__exit)
 
     @property
@@ -115,7 +123,14 @@ class TutelDebuggerInteractive(TutelDebugger):
     def _stop_session(self):
         self.running = False
         self.interpreter.stop()
-        self.resume_event.set()
+        self._resume()
+
+    def _resume(self):
+        if self.cooperative:
+            if self.interpreter.paused:
+                self._continuation = self.interpreter.resume
+        else:
+            self.resume_event.set()
 
     def _post_morten(self, e: InterpreterException):
         super()._post_morten(e)
@@ -129,8 +144,17 @@ class TutelDebuggerInteractive(TutelDebugger):
     def start(self):
         self.message("Type h(help) to see available commands.")
         while not self.exit:
-            request, response = self.request_queue.get()
+            if self.deferred_requests:
+                request, response = self.deferred_requests.pop(0)
+            else:
+                request, response = self.request_queue.get()
             self.execute_request(request, response)
+            if self.deferred_requests or self.exit:
+                continue
+            if self.suspended:
+                self.suspended = False
+                self._resume()
+            self._run_continuation()
         self.__exit()
         self.communication_class().join()
 
@@ -138,10 +162,28 @@ class TutelDebuggerInteractive(TutelDebugger):
         super()._break(_type)
         self.emit_event(DebuggerEvent(type=_type.name))
 
+        if self.cooperative:
+            self.suspended = False
+            self.interpreter.pause()
+            return
         self.resume_event.clear()
         self.resume_event.wait()
 
+    def poll_requests(self):
+        while not self.request_queue.empty():
+            request, response = self.request_queue.get()
+            if request.command in DEFERRED_COMMANDS:
+                self.deferred_requests.append((request, response))
+                self.suspended = True
+                self.interpreter.pause()
+            elif self.deferred_requests:
+                self.deferred_requests.append((request, response))
+            else:
+                self.execute_request(request, response)
+
     def check_line(self):
+        if self.cooperative:
+            self.poll_requests()
         if not self.running:
             raise Stop
         if not self.interpreter.call_stack:
@@ -200,7 +242,7 @@ class TutelDebuggerInteractive(TutelDebugger):
             with open(path, "r") as file:
                 self.code = file.read()
             self.filename = path
-            self.bp_possible_lines[self.filename] = get_bp_possible_lines(self.code)
+            self.bp_possible_lines[self.filename] = self._get_bp_possible_lines()
             if self.breakpoints.get(self.filename) is None:
                 self.breakpoints[self.filename] = {}
             else:
@@ -232,7 +274,7 @@ class TutelDebuggerInteractive(TutelDebugger):
 
     def run_no_debug_request(self, response: DebuggerResponse):
         if not self.running:
-            self.interpreter.debug_callback = mock_debug_callback
+            self.interpreter.debug_callback = self.poll_requests if self.cooperative else mock_debug_callback
             self.running = True
             if not self.run():
                 self.running = False
@@ -267,7 +309,7 @@ class TutelDebuggerInteractive(TutelDebugger):
 
     def continue_request(self, response: DebuggerResponse):
         if self.running:
-            self.resume_event.set()
+            self._resume()
             response.type = DebuggerResponseType.RESUMED
         else:
             msg = "Program is not running, use command `r(un)` to run it."
@@ -278,7 +320,7 @@ class TutelDebuggerInteractive(TutelDebugger):
     def step_into_request(self, response: DebuggerResponse):
         self.step_into_mode = True
         if self.running:
-            self.resume_event.set()
+            self._resume()
             response.type = DebuggerResponseType.RESUMED
         else:
             self.run_request(response)
@@ -287,7 +329,7 @@ class TutelDebuggerInteractive(TutelDebugger):
         self.step_over_mode = True
         if self.running:
             self.watched_frame = self.interpreter.curr_frame.index
-            self.resume_event.set()
+            self._resume()
             response.type = DebuggerResponseType.RESUMED
         else:
             self.watched_frame = 0
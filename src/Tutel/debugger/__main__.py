@@ -38,6 +38,31 @@ def get_arg_parser():
         "--output",
         required=False
     )
+    arg_parser.add_argument(
+        "--gui-batch",
+        default=False,
+        action="store_true",
+        help="Write buffered GUI commands as a single BATCH command",
+    )
+    arg_parser.add_argument(
+        "--engine",
+        default="visitor",
+        choices=["visitor", "closure", "vm"],
+        help="Engine used to execute the script, vm is paused without blocking an interpreter thread",
+    )
+    arg_parser.add_argument(
+        "-O",
+        "--optimize",
+        default=False,
+        action="store_true",
+        help="Fold constant expressions, propagate constants and remove dead code before running the script",
+    )
+    arg_parser.add_argument(
+        "--report-dce",
+        default=False,
+        action="store_true",
+        help="Print dead code removed from the script to stderr, implies -O",
+    )
 
     return arg_parser
 
@@ -53,6 +78,10 @@ def main():
 
     if args.output:
         options["gui_out_path"] = args.output
+    options["gui_batch"] = args.gui_batch
+    options["engine"] = args.engine
+    options["optimize"] = args.optimize or args.report_dce
+    options["report_dce"] = args.report_dce
 
     options = TutelOptions(**options)
 
@@ -1,7 +1,12 @@
 import io
 import logging
+import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
+from contextlib import redirect_stdout
 from io import StringIO
 
 from parameterized import parameterized
@@ -10,9 +15,11 @@ from Tutel import debugger
 from Tutel.common.ErrorHandler import ErrorHandler
 from Tutel.common.ErrorType import TutelDebuggerException, CommandNotEndedProperly, InvalidCommandArgs
 from Tutel.debugger.RequestsHandler.Commands import Command
-from Tutel.debugger.RequestsHandler.DataStructures import DebuggerRequest
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.debugger.RequestsHandler.DataStructures import DebuggerRequest, DebuggerResponse, DebuggerResponseType
 from Tutel.debugger.RequestsHandler.RequestLexer import RequestLexer
 from Tutel.debugger.RequestsHandler.RequestParser import RequestParser
+from Tutel.debugger.RequestsHandler.RequestsHandlerInterface import RequestsHandlerInterface
 from Tutel.debugger.TutelDebuggerInteractive import TutelDebuggerInteractive
 
 
@@ -220,8 +227,91 @@ class TestDebugger(unittest.TestCase):
             self.fail(f"Debugger exception: {e}")
 
 
+class QueueRequestsHandler(RequestsHandlerInterface):
+    request_queue = None
+    events: list[str] = []
+
+    def start(self, request_queue):
+        QueueRequestsHandler.request_queue = request_queue
+
+    def emit_event(self, event):
+        self.events.append(event.type)
+
+
+class TestCooperativeDebugger(unittest.TestCase):
+    def setUp(self) -> None:
+        QueueRequestsHandler.events.clear()
+        self.file = tempfile.NamedTemporaryFile("w", suffix=".tut", delete=False)
+        self.file.write("main(){\na = 1;\nfoo(a);\nprint(a);\n}\nfoo(x){\nprint(x);\nx = 2;\n}\n")
+        self.file.close()
+        self.debugger = TutelDebuggerInteractive(communication_class=QueueRequestsHandler, filename=self.file.name,
+                                                 options=TutelOptions(engine="vm"),
+                                                 error_handler=get_error_handler())
+        self.debugger.message_handler = io.StringIO()
+        self.thread = threading.Thread(target=self.debugger.start)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.request(Command.EXIT)
+        self.thread.join(5)
+        os.remove(self.file.name)
+
+    @staticmethod
+    def request(command: Command, *args) -> DebuggerResponse:
+        request, response = DebuggerRequest(command, args), DebuggerResponse()
+        QueueRequestsHandler.request_queue.put((request, response))
+        request.finished.wait(5)
+        return response
+
+    @staticmethod
+    def wait_for_event(event: str):
+        deadline = time.time() + 5
+        while event not in QueueRequestsHandler.events and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_paused_without_interpreter_thread(self):
+        # GIVEN
+        self.request(Command.BREAK, self.file.name, 7)
+
+        # WHEN
+        with io.StringIO() as output, redirect_stdout(output):
+            self.request(Command.RUN)
+            self.wait_for_event("Breakpoint")
+            stack = self.request(Command.STACK)
+            interpreter_threads = [thread for thread in threading.enumerate() if thread.name == "Interpreter"]
+            paused_output = output.getvalue()
+            self.request(Command.CONTINUE)
+            self.wait_for_event("end")
+            result = output.getvalue()
+
+        # THEN
+        self.assertTrue(self.thread.is_alive())
+        self.assertEqual([], interpreter_threads, "Interpreter thread started.")
+        self.assertEqual(DebuggerResponseType.STACK, stack.type)
+        self.assertEqual(["foo", "main"], [frame.name for frame in stack.body["stack"]])
+        self.assertEqual("", paused_output, "Program not paused.")
+        self.assertEqual("1\n1\n", result)
+        self.assertEqual(["Breakpoint", "end"], QueueRequestsHandler.events)
+
+    def test_stopped_while_paused(self):
+        # GIVEN
+        self.request(Command.BREAK, self.file.name, 7)
+        self.request(Command.RUN)
+        self.wait_for_event("Breakpoint")
+
+        # WHEN
+        self.request(Command.STOP)
+        self.wait_for_event("end")
+
+        # THEN
+        self.assertFalse(self.debugger.running)
+        self.assertFalse(self.debugger.interpreter.paused)
+        self.assertIn("end", QueueRequestsHandler.events)
+
+
 def suite():
     suite_ = unittest.TestSuite()
     suite_.addTest(unittest.makeSuite(TestRequestParser, 'test'))
     suite_.addTest(unittest.makeSuite(TestDebugger, 'test'))
+    suite_.addTest(unittest.makeSuite(TestCooperativeDebugger, 'test'))
     return suite_
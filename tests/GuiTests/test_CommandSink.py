@@ -0,0 +1,227 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+
+from parameterized import parameterized
+
+from Tutel.core import GuiModule
+from Tutel.core.GuiModule.CommandSink import CommandSink
+from Tutel.core.GuiModule.GuiVsCode import create_request
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+
+COMMANDS = [create_request(method="GO", id=0, body={"position": {"x": i, "y": 0}}) for i in range(5)]
+
+PROGRAM = """
+main() {
+    t = Turtle();
+    for (i in range(20)) {
+        t.forward(10);
+        t.turn_left();
+    }
+}
+"""
+
+
+def read_commands(path: str) -> list[dict]:
+    commands = []
+    with open(path) as file:
+        for line in file:
+            command = json.loads(line)
+            commands.extend(command["body"] if command["method"] == "BATCH" else [command])
+    return commands
+
+
+class TestCommandSink(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "gui.out")
+        open(self.path, "w").close()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _read(self) -> str:
+        with open(self.path) as file:
+            return file.read()
+
+    def test_buffered(self):
+        # GIVEN
+        sink = CommandSink(flush_interval=60, path=self.path)
+
+        # WHEN
+        for command in COMMANDS:
+            sink.write(command)
+        written = self._read()
+        sink.flush()
+
+        # THEN
+        self.assertEqual("", written)
+        self.assertEqual("".join(COMMANDS), self._read())
+        sink.close()
+
+    def test_buffer_size(self):
+        # GIVEN
+        sink = CommandSink(buffer_size=2 * len(COMMANDS[0]), flush_interval=60, path=self.path)
+
+        # WHEN
+        for command in COMMANDS:
+            sink.write(command)
+
+        # THEN
+        self.assertEqual("".join(COMMANDS[:4]), self._read())
+        sink.close()
+        self.assertEqual("".join(COMMANDS), self._read())
+
+    def test_flush_interval(self):
+        # GIVEN
+        sink = CommandSink(flush_interval=0, path=self.path)
+
+        # WHEN
+        sink.write(COMMANDS[0])
+
+        # THEN
+        self.assertEqual(COMMANDS[0], self._read())
+        sink.close()
+
+    def test_flushed_by_timer(self):
+        # GIVEN
+        sink = CommandSink(flush_interval=0.05, path=self.path)
+
+        # WHEN
+        sink.write(COMMANDS[0])
+        written = self._read()
+        deadline = time.monotonic() + 5
+        while not self._read() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # THEN
+        self.assertEqual("", written)
+        self.assertEqual(COMMANDS[0], self._read())
+        sink.close()
+
+    def test_single_flusher_thread(self):
+        # GIVEN
+        sink = CommandSink(flush_interval=0.02, path=self.path)
+        threads = threading.active_count()
+
+        # WHEN
+        for i, command in enumerate(COMMANDS):
+            sink.write(command)
+            deadline = time.monotonic() + 5
+            while self._read() != "".join(COMMANDS[:i + 1]) and time.monotonic() < deadline:
+                time.sleep(0.01)
+        running = threading.active_count()
+        sink.close()
+        deadline = time.monotonic() + 5
+        while threading.active_count() > threads and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # THEN
+        self.assertEqual("".join(COMMANDS), self._read())
+        self.assertEqual(threads + 1, running)
+        self.assertEqual(threads, threading.active_count())
+
+    @parameterized.expand([
+        ("many", COMMANDS, 1),
+        ("single", COMMANDS[:1], 1),
+    ])
+    def test_batch(self, _, commands, lines):
+        # GIVEN
+        sink = CommandSink(flush_interval=60, batch=True, path=self.path)
+
+        # WHEN
+        for command in commands:
+            sink.write(command)
+        sink.close()
+
+        # THEN
+        self.assertEqual(lines, len(self._read().splitlines()))
+        self.assertEqual([json.loads(command) for command in commands], read_commands(self.path))
+
+    def test_reopened_after_close(self):
+        # GIVEN
+        sink = CommandSink(path=self.path)
+        sink.write(COMMANDS[0])
+        sink.close()
+
+        # WHEN
+        sink.write(COMMANDS[1])
+        sink.close()
+
+        # THEN
+        self.assertEqual("".join(COMMANDS[:2]), self._read())
+
+    def test_stdout(self):
+        # GIVEN
+        sink = CommandSink(flush_interval=60, path="")
+        output = io.StringIO()
+
+        # WHEN
+        with redirect_stdout(output):
+            for command in COMMANDS:
+                sink.write(command)
+            sink.flush()
+
+        # THEN
+        self.assertEqual("".join(COMMANDS), output.getvalue())
+
+
+class TestGuiVsCodeOutput(unittest.TestCase):
+    def setUp(self):
+        self.gui, self.gui_out = GuiModule.GUI, GuiModule.GUI_OUT
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "gui.out")
+
+    def tearDown(self):
+        GuiModule.GUI, GuiModule.GUI_OUT = self.gui, self.gui_out
+        self.directory.cleanup()
+
+    def _run(self, code: str, **options) -> list[dict]:
+        Turtle.id = 0
+        TutelRunner(code, TutelOptions(gui="vscode", gui_out_path=self.path, **options)).run()
+        return read_commands(self.path)
+
+    @parameterized.expand([
+        ("buffered", {}),
+        ("batch", {"gui_batch": True}),
+        ("small_buffer", {"gui_buffer_size": 100, "gui_batch": True}),
+    ])
+    def test_same_commands(self, _, options):
+        # GIVEN
+        expected = self._run(PROGRAM, gui_buffer_size=0)
+
+        # WHEN
+        result = self._run(PROGRAM, **options)
+
+        # THEN
+        self.assertEqual(41, len(expected))
+        self.assertEqual(expected, result)
+
+    def test_flushed_before_print(self):
+        # GIVEN
+        GuiModule.GUI_OUT = ""
+        output = io.StringIO()
+        Turtle.id = 0
+
+        # WHEN
+        with redirect_stdout(output):
+            TutelRunner("main(){t = Turtle(); print('drawn'); t.forward(1);}", TutelOptions(gui="vscode")).run()
+
+        # THEN
+        lines = output.getvalue().splitlines()
+        self.assertEqual(["ADD", "drawn", "GO"],
+                         [line if line == "drawn" else json.loads(line)["method"] for line in lines])
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestCommandSink, 'test'))
+    suite_.addTest(unittest.makeSuite(TestGuiVsCodeOutput, 'test'))
+    return suite_
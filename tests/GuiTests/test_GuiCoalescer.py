@@ -0,0 +1,152 @@
+import glob
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from parameterized import parameterized
+
+from Tutel.core import GuiModule
+from Tutel.core.GuiModule.GuiCoalescer import GuiCoalescer
+from Tutel.core.GuiModule.GuiInterface import GuiInterface
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "..", "examples")
+STEPPING = "main(){t = Turtle(); for(i in range(30)){for(j in range(i)){t.forward(1);} t.turn_left();}" \
+           "u = Turtle(); u.set_orientation(33); for(i in range(30)){u.forward(1);} u.forward(-5);}"
+
+
+class RecordingGui(GuiInterface):
+    def __init__(self) -> None:
+        self.commands = []
+
+    def add_turtle(self, turtle) -> bool:
+        self.commands.append(("ADD", tuple(turtle.position)))
+        return True
+
+    def set_color(self, turtle_id, color) -> bool:
+        self.commands.append(("COLOR", tuple(color)))
+        return True
+
+    def set_position(self, turtle_id, position) -> bool:
+        self.commands.append(("POSITION", tuple(position)))
+        return True
+
+    def set_orientation(self, turtle_id, orientation) -> bool:
+        self.commands.append(("ORIENTATION", orientation))
+        return True
+
+    def go_forward(self, turtle_id, position) -> bool:
+        self.commands.append(("GO", tuple(position)))
+        return True
+
+
+def run(code: str, coalesce: bool) -> list:
+    GuiModule.GUI = gui = RecordingGui()
+    with redirect_stdout(io.StringIO()):
+        TutelRunner(code, TutelOptions(gui_coalesce=coalesce)).run()
+    return gui.commands
+
+
+class TestGuiCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.gui = GuiModule.GUI
+
+    def tearDown(self):
+        GuiModule.GUI = self.gui
+
+    def test_moves_merged(self):
+        # WHEN
+        commands = run("main(){t = Turtle(); for(i in range(5)){t.forward(1);} t.turn_left(); t.forward(2);}", True)
+
+        # THEN
+        self.assertEqual([("ADD", (0, 0)), ("GO", (0, 5)), ("ORIENTATION", 90), ("GO", (2, 5))], commands)
+        self.assertEqual(4, GuiModule.GUI.coalesced_moves)
+
+    @parameterized.expand([
+        ("turn", "t.turn_left();", 2),
+        ("color", "t.set_color(Color(0, 0, 0));", 2),
+        ("position_read", "p = t.position;", 2),
+        ("print", "print(1);", 2),
+        ("other_turtle", "u = Turtle(); u.forward(1);", 3),
+        ("backwards", "t.forward(-1);", 3),
+        ("same_direction", "t.forward(3);", 1),
+        ("nothing_changed", "t.set_orientation(0);", 1),
+    ])
+    def test_moves_sent(self, _, event, moves):
+        # WHEN
+        commands = run(f"main(){{t = Turtle(); t.forward(1); t.forward(1); {event} t.forward(1);}}", True)
+
+        # THEN
+        self.assertEqual(moves, [command for command, _ in commands].count("GO"))
+
+    def test_slanted_moves_not_merged(self):
+        # WHEN
+        commands = run("main(){t = Turtle(); t.set_orientation(45); for(i in range(3)){t.forward(1);}}", True)
+
+        # THEN
+        self.assertEqual(3, [command for command, _ in commands].count("GO"))
+
+    def test_wrapping_nothing(self):
+        # GIVEN
+        GuiModule.GUI = GuiInterface()
+
+        # WHEN
+        TutelRunner("main(){t = Turtle(); t.forward(1); t.forward(1); t.turn_left(); p = t.position;}",
+                    TutelOptions(gui_coalesce=True)).run()
+
+        # THEN
+        self.assertIsInstance(GuiModule.GUI, GuiCoalescer)
+        self.assertEqual(1, GuiModule.GUI.coalesced_moves)
+
+    @parameterized.expand([
+        (os.path.basename(path), path) for path in sorted(glob.glob(os.path.join(EXAMPLES, "*.tut")))
+    ] + [("stepping", None)])
+    def test_same_drawing(self, _, path):
+        # GIVEN
+        if path is None:
+            code = STEPPING
+        else:
+            with open(path) as file:
+                code = file.read()
+
+        # WHEN
+        commands = run(code, False)
+        coalesced_commands = run(code, True)
+
+        # THEN
+        self.assertEqual([command for command in commands if command[0] != "GO"],
+                         [command for command in coalesced_commands if command[0] != "GO"])
+        # Every move sent is one of the moves of the turtles, and the last one of a line is never left out
+        moves = iter(commands)
+        self.assertTrue(all(command in moves for command in coalesced_commands))
+        self.assertEqual(commands[-1], coalesced_commands[-1])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_same_image(self):
+        # GIVEN
+        images = []
+
+        # WHEN
+        with tempfile.TemporaryDirectory() as directory:
+            for coalesce in (False, True):
+                path = os.path.join(directory, f"{coalesce}.png")
+                TutelRunner(STEPPING, TutelOptions(render_path=path, gui_coalesce=coalesce)).run()
+                with open(path, "rb") as file:
+                    images.append(file.read())
+
+        # THEN
+        self.assertEqual(images[0], images[1])
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestGuiCoalescer, 'test'))
+    return suite_
@@ -0,0 +1,144 @@
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+from parameterized import parameterized
+
+from Tutel.core import GuiModule
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+
+try:
+    import numpy as np
+    from Tutel.core.GuiModule.GuiRaster import GuiRaster, rasterize, encode_png, encode_ppm, PNG_SIGNATURE
+except ImportError:
+    np = None
+
+SQUARE = "main(){t = Turtle(); t.set_color(Color(0, 255, 0)); for(i in range(4)){t.forward(20); t.turn_right();}}"
+
+
+def decode_png(data: bytes) -> "np.ndarray":
+    assert data.startswith(PNG_SIGNATURE)
+    position, chunks = len(PNG_SIGNATURE), {}
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        chunk = data[position + 8:position + 8 + length]
+        assert struct.unpack(">I", data[position + 8 + length:position + 12 + length])[0] == zlib.crc32(kind + chunk)
+        chunks[kind] = chunk
+        position += length + 12
+    width, height = struct.unpack(">II", chunks[b"IHDR"][:8])
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, width * 3 + 1)
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestGuiRaster(unittest.TestCase):
+    def setUp(self):
+        self.gui = GuiModule.GUI
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        GuiModule.GUI = self.gui
+        self.directory.cleanup()
+
+    @parameterized.expand([
+        ("horizontal", (0, 1, 3, 1), [(1, 0), (1, 1), (1, 2), (1, 3)]),
+        ("vertical", (2, 3, 2, 1), [(1, 2), (2, 2), (3, 2)]),
+        ("diagonal", (0, 0, 3, 3), [(0, 0), (1, 1), (2, 2), (3, 3)]),
+        ("point", (2, 2, 2, 2), [(2, 2)]),
+    ])
+    def test_rasterize(self, _, segment, expected):
+        # WHEN
+        canvas = rasterize(np.array([segment], dtype=np.float64), np.array([(1, 2, 3)], dtype=np.uint8), 4, 4)
+
+        # THEN
+        drawn = sorted(zip(*np.nonzero(canvas.any(axis=2))))
+        self.assertEqual(sorted(expected), [(int(row), int(column)) for row, column in drawn])
+        self.assertTrue((canvas[tuple(np.array(expected).T)] == (1, 2, 3)).all())
+
+    def test_later_segments_on_top(self):
+        # WHEN
+        canvas = rasterize(np.array([(0, 0, 2, 0), (1, 0, 1, 0)], dtype=np.float64),
+                           np.array([(10, 10, 10), (20, 20, 20)], dtype=np.uint8), 3, 1)
+
+        # THEN
+        self.assertEqual([10, 20, 10], canvas[0, :, 0].tolist())
+
+    def test_encode_png(self):
+        # GIVEN
+        canvas = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+
+        # WHEN
+        result = decode_png(encode_png(canvas))
+
+        # THEN
+        self.assertTrue((canvas == result).all())
+
+    def test_encode_ppm(self):
+        # GIVEN
+        canvas = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+
+        # WHEN
+        result = encode_ppm(canvas)
+
+        # THEN
+        self.assertEqual(b"P6\n3 2\n255\n" + bytes(range(18)), result)
+
+    def test_render(self):
+        # GIVEN
+        GuiModule.GUI = gui = GuiRaster(os.path.join(self.directory.name, "out.png"), margin=2)
+
+        # WHEN
+        TutelRunner("main(){t = Turtle(); t.forward(4); t.turn_right(); t.forward(2);}").run()
+        canvas = gui.render()
+
+        # THEN
+        self.assertEqual((9, 7, 3), canvas.shape)
+        # Turtle goes down first, then turns right, which is to the left of the image
+        drawn = sorted((int(row), int(column)) for row, column in zip(*np.nonzero(canvas.any(axis=2))))
+        self.assertEqual(sorted([(row, 4) for row in range(2, 7)] + [(6, 2), (6, 3)]), drawn)
+        self.assertEqual([255, 0, 0], canvas[2, 4].tolist())
+
+    def test_scaled_down(self):
+        # GIVEN
+        GuiModule.GUI = gui = GuiRaster(os.path.join(self.directory.name, "out.png"), margin=0, max_size=51)
+
+        # WHEN
+        TutelRunner("main(){t = Turtle(); t.forward(1000); t.turn_right(); t.forward(100);}").run()
+
+        # THEN
+        self.assertEqual((51, 6, 3), gui.render().shape)
+
+    def test_nothing_drawn(self):
+        # WHEN
+        canvas = GuiRaster("out.png", margin=3).render()
+
+        # THEN
+        self.assertEqual((7, 7, 3), canvas.shape)
+        self.assertFalse(canvas.any())
+
+    @parameterized.expand([
+        ("png", "square.png", decode_png),
+        ("ppm", "square.ppm", lambda data: np.frombuffer(data[len(b"P6\n41 41\n255\n"):], dtype=np.uint8)
+         .reshape(41, 41, 3)),
+    ])
+    def test_runner(self, _, name, decode):
+        # GIVEN
+        path = os.path.join(self.directory.name, name)
+
+        # WHEN
+        TutelRunner(SQUARE, TutelOptions(render_path=path)).run()
+
+        # THEN
+        with open(path, "rb") as file:
+            canvas = decode(file.read())
+        self.assertEqual((41, 41, 3), canvas.shape)
+        self.assertEqual(80, int((canvas == (0, 255, 0)).all(axis=2).sum()))
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestGuiRaster, 'test'))
+    return suite_
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from parameterized import parameterized
+
+from Tutel.core import GuiModule
+from Tutel.core.GuiModule.CommandSink import CommandSink
+from Tutel.core.GuiModule.GuiSvg import GuiSvg, format_number, MAX_POINTS
+from Tutel.core.GuiModule.GuiVsCode import GuiVsCode
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+
+NAMESPACE = "{http://www.w3.org/2000/svg}"
+SPIRAL = "main(){t = Turtle(); for(i in range(400)){t.forward(i); t.set_orientation(i * 7);}}"
+
+
+def read_svg(path: str) -> tuple[ElementTree.Element, list[tuple[str, list[str]]]]:
+    root = ElementTree.parse(path).getroot()
+    lines = [(line.get("stroke"), line.get("points").split(" ")) for line in root.iter(NAMESPACE + "polyline")]
+    return root, lines
+
+
+class TestGuiSvg(unittest.TestCase):
+    def setUp(self):
+        self.gui = GuiModule.GUI
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "out.svg")
+
+    def tearDown(self):
+        GuiModule.GUI = self.gui
+        self.directory.cleanup()
+
+    def run_svg(self, code: str, margin: int = 0) -> tuple[ElementTree.Element, list[tuple[str, list[str]]]]:
+        GuiModule.GUI = GuiSvg(self.path, margin=margin)
+        TutelRunner(code).run()
+        return read_svg(self.path)
+
+    @parameterized.expand([
+        ("integer", 3.0, "3"),
+        ("rounded", 0.30000000000000004, "0.3"),
+        ("negative", -2.125, "-2.12"),
+        ("negative_zero", -0.0001, "0"),
+    ])
+    def test_format_number(self, _, value, expected):
+        # WHEN
+        result = format_number(value)
+
+        # THEN
+        self.assertEqual(expected, result)
+
+    def test_moves_merged(self):
+        # WHEN
+        root, lines = self.run_svg("main(){t = Turtle(); for(i in range(4)){t.forward(20); t.turn_right();}}")
+
+        # THEN
+        self.assertEqual([("#ff0000", ["0,0", "0,20", "-20,20", "-20,0", "0,0"])], lines)
+        self.assertEqual(("20", "20", "-20 0 20 20"), (root.get("width"), root.get("height"), root.get("viewBox")))
+
+    def test_color_change_starts_line(self):
+        # WHEN
+        _, lines = self.run_svg("main(){t = Turtle(); t.forward(1); t.set_color(Color(0, 0, 255)); t.forward(1);"
+                                "t.set_position(Position(5, 5));}")
+
+        # THEN
+        self.assertEqual([("#ff0000", ["0,0", "0,1"]), ("#0000ff", ["0,1", "0,2", "5,5"])], lines)
+
+    def test_turtles_interleaved(self):
+        # WHEN
+        _, lines = self.run_svg("main(){a = Turtle(); b = Turtle(); b.turn_left(); a.forward(1); a.forward(1);"
+                                "b.forward(1); a.forward(1);}")
+
+        # THEN
+        self.assertEqual([("#ff0000", ["0,0", "0,1", "0,2"]), ("#ff0000", ["0,0", "1,0"]),
+                          ("#ff0000", ["0,2", "0,3"])], lines)
+
+    def test_long_line_continued(self):
+        # WHEN
+        _, lines = self.run_svg(f"main(){{t = Turtle(); for(i in range({MAX_POINTS + 10})){{t.forward(1);}}}}")
+
+        # THEN
+        self.assertEqual([MAX_POINTS, 12], [len(points) for _, points in lines])
+        self.assertEqual(lines[0][1][-1], lines[1][1][0])
+
+    def test_streamed(self):
+        # GIVEN
+        GuiModule.GUI = gui = GuiSvg(self.path)
+        turtle = Turtle.turtle_init()
+
+        # WHEN
+        for _ in range(MAX_POINTS):
+            turtle.forward(1)
+        gui.flush()
+
+        # THEN
+        with open(self.path) as file:
+            self.assertEqual(1, file.read().count("<polyline"))
+        gui.close()
+        self.assertEqual([MAX_POINTS, 2], [len(points) for _, points in read_svg(self.path)[1]])
+
+    def test_nothing_drawn(self):
+        # WHEN
+        GuiSvg(self.path, margin=3).close()
+
+        # THEN
+        root, lines = read_svg(self.path)
+        self.assertEqual(([], "-3 -3 6 6"), (lines, root.get("viewBox")))
+
+    def test_smaller_than_commands(self):
+        # GIVEN
+        commands_path = os.path.join(self.directory.name, "gui.out")
+        GuiModule.GUI = GuiVsCode(CommandSink(path=commands_path))
+        TutelRunner(SPIRAL).run()
+
+        # WHEN
+        TutelRunner(SPIRAL, TutelOptions(render_path=self.path)).run()
+
+        # THEN
+        _, lines = read_svg(self.path)
+        self.assertEqual(401, sum(len(points) for _, points in lines))
+        self.assertLess(os.path.getsize(self.path) * 5, os.path.getsize(commands_path))
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestGuiSvg, 'test'))
+    return suite_
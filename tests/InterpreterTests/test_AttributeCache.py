@@ -0,0 +1,142 @@
+import pickle
+import unittest
+
+from parameterized import parameterized
+
+from Tutel.core.InterpreterModule.AttributeCache import AttributeCache, UNBOUND, METHOD, PROPERTY, OTHER
+from Tutel.core.InterpreterModule.Turtle.Color import Color
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle
+from Tutel.core.InterpreterModule.Value import Value
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper
+from tests.TranspilerTests.test_Transpiler import run
+
+ATTRIBUTE_CASES = [
+    ("turtle", "main(){t = Turtle(); t.forward(10); t.turn_left(); t.forward(5); print(t.position, t.orientation);}"),
+    ("color", "main(){c = Color(1, 2, 3); print(c.r, c.g, c.b); t = Turtle(); print(t.color.r);}"),
+    ("list_methods", "main(){l = [3, 1]; l.append(2); print(l, l.index(1), l.count(3)); l.pop(); print(l);}"),
+    ("string_methods", "main(){s = 'ab'; print(s.upper(), s.index('b'));}"),
+    ("polymorphic", "main(){for(x in [[5, 6], 'ab', [7, 8], 'cd']){print(x.index(x[1]));}}"),
+    ("property_and_method", "main(){for(x in [Color(1, 2, 3), Turtle(), Color(4, 5, 6)]){print(x.to_json());}}"),
+    ("method_value", "main(){l = [1]; f = l.append; f(2); print(l);}"),
+    ("function_attribute", "main(){f = foo; print(f.value(2));}foo(x){return x + 1;}"),
+    ("value_attribute", "main(){a = 5; print(a.value);}"),
+    ("missing_attribute", "main(){a = 5; print(a.nope);}"),
+    ("missing_method", "main(){a = [5]; a.nope(1);}"),
+    ("wrong_arguments", "main(){a = [5]; a.append(1, 2);}"),
+    ("method_in_arguments", "main(){l = [1, 2]; m = ['a']; print(l.index(m.count(l.count(2))));}"),
+]
+
+
+class TestAttributeCache(unittest.TestCase):
+    @parameterized.expand([
+        ("property", Value(Color(1, 2, 3)), "g", PROPERTY),
+        ("turtle_property", Value(Turtle()), "orientation", PROPERTY),
+        ("method", Value(Turtle()), "forward", METHOD),
+        ("builtin_method", Value([1, 2]), "index", METHOD),
+        ("value_method", Value([1, 2]), "append", METHOD),
+        ("value_slot", Value(1), "value", OTHER),
+        ("instance_attribute", Value(Turtle()), "id", OTHER),
+        ("class", Color, "r", OTHER),
+        ("unwrapped_object", Color(1, 2, 3), "b", PROPERTY),
+    ])
+    def test_get(self, _, receiver, name, kind):
+        # GIVEN
+        cache = AttributeCache(name)
+
+        # WHEN
+        result = cache.get(receiver)
+
+        # THEN
+        self.assertEqual(getattr(receiver, name), result)
+        self.assertEqual(kind, cache.kind)
+
+    def test_method_not_bound(self):
+        # GIVEN
+        receiver = Value([4, 5])
+        cache = AttributeCache("index")
+
+        # WHEN
+        function, owner = cache.get_method(receiver)
+
+        # THEN
+        self.assertIs(list.index, function)
+        self.assertIs(receiver.value, owner)
+        self.assertEqual(1, function(owner, 5))
+
+    def test_attribute_not_method(self):
+        # GIVEN
+        receiver = Value(Color(1, 2, 3))
+        cache = AttributeCache("r")
+
+        # WHEN
+        result = cache.get_method(receiver)
+
+        # THEN
+        self.assertEqual((1, UNBOUND), result)
+
+    def test_instance_attribute_shadowing_method(self):
+        # GIVEN
+        turtle = Turtle()
+        cache = AttributeCache("forward")
+        cache.get(Value(turtle))
+        turtle.forward = print
+
+        # WHEN
+        result = cache.get_method(Value(turtle))
+
+        # THEN
+        self.assertEqual((print, UNBOUND), result)
+
+    def test_resolved_again(self):
+        # GIVEN
+        cache = AttributeCache("index")
+
+        # WHEN
+        results = [cache.get_method(Value(receiver))[0] for receiver in [[1], "a", [2]]]
+
+        # THEN
+        self.assertEqual([list.index, str.index, list.index], results)
+        self.assertIs(list, cache.owner_type)
+
+    def test_missing(self):
+        # GIVEN
+        cache = AttributeCache("nope")
+
+        # THEN
+        with self.assertRaises(AttributeError):
+            cache.get(Value(1))
+        with self.assertRaises(AttributeError):
+            cache.get_method(Value(1))
+
+    def test_pickle(self):
+        # GIVEN
+        cache = AttributeCache("r")
+        cache.get(Value(Color(1, 2, 3)))
+
+        # WHEN
+        result = pickle.loads(pickle.dumps(cache))
+
+        # THEN
+        self.assertEqual(("r", None, OTHER), (result.name, result.receiver_type, result.kind))
+
+    @parameterized.expand([
+        (engine, *case)
+        for engine in ["release", "closure", "vm"]
+        for case in ATTRIBUTE_CASES
+    ])
+    def test_same_result(self, engine, _, case):
+        # GIVEN
+        interpreter_class = release_interpreter_mapper["visitor"] if engine == "release" else interpreter_mapper[engine]
+
+        # WHEN
+        expected = run(interpreter_mapper["visitor"], case)
+        result = run(interpreter_class, case)
+
+        # THEN
+        self.assertEqual(expected, result)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestAttributeCache, 'test'))
+    return suite_
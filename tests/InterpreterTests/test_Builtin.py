@@ -0,0 +1,127 @@
+import unittest
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import MismatchedArgsCountException
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Builtin import Builtin, REGISTRY, find_builtin
+from Tutel.core.InterpreterModule.Linker import Linker
+from Tutel.core.InterpreterModule.Value import Value
+from Tutel.core.Runner.TutelRunner import interpreter_mapper, release_interpreter_mapper
+from tests.TranspilerTests.test_Transpiler import parse, run
+
+BUILTIN_CASES = [
+    ("results", "main(){print(type(1), hex(255), min(3, 1, 2), max(3, 1), abs(-2), len([1, 2]), pow(2, 5));}"),
+    ("conversions", "main(){a = str(12); a += '3'; print(a, int('7') + 1, Color(1, 2, 3).g, Position(1, 2).y);}"),
+    ("range", "main(){for(i in range(1, 10, 4)){print(i);}}"),
+    ("nested", "main(){print(str(len(str(max(12, 345)))));}"),
+    ("dynamic_call", "main(){f = len; print(f([1, 2, 3]));}"),
+    ("too_many", "main(){print(abs(1, 2));}"),
+    ("too_few", "main(){print(pow(2));}"),
+    ("none_given", "main(){a = max();}"),
+    ("too_many_in_loop", "main(){for(i in range(3)){print(i); hex(i, i);}}"),
+    ("type_error", "main(){print(len(5));}"),
+    ("arguments_evaluated_first", "main(){Color(foo(1), foo(2));}foo(x){print(x); return x + 0;}"),
+]
+
+
+class TestBuiltin(unittest.TestCase):
+    def test_registry(self):
+        # THEN
+        for name, builtin in REGISTRY.items():
+            self.assertEqual(name, builtin.name)
+            self.assertIs(getattr(TutelBuiltins, name), builtin.function)
+
+    @parameterized.expand([
+        ("exact", Builtin("f", print, 2, 2), [False, False, True, False]),
+        ("range", Builtin("f", print, 1, 2), [False, True, True, False]),
+        ("unlimited", Builtin("f", print, 1, None), [False, True, True, True]),
+    ])
+    def test_accepts(self, _, builtin, expected):
+        # WHEN
+        result = [builtin.accepts(args_count) for args_count in range(4)]
+
+        # THEN
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([
+        ("boxed_argument", "len", [Value([1, 2])], 2),
+        ("unboxed_argument", "str", [5], "5"),
+        ("variadic", "max", [Value(1), 4, Value(2)], 4),
+    ])
+    def test_call(self, _, name, arguments, expected):
+        # WHEN
+        result = REGISTRY[name].call(arguments)
+
+        # THEN
+        self.assertEqual((type(expected), expected), (type(result), result))
+
+    def test_find_builtin(self):
+        # THEN
+        self.assertIs(REGISTRY["len"], find_builtin("len", TutelBuiltins.len))
+        self.assertIsNone(find_builtin("len", TutelBuiltins.str))
+        self.assertIsNone(find_builtin("Turtle", TutelBuiltins.Color))
+
+    def test_linked(self):
+        # GIVEN
+        program = parse("main(){print(len([1])); f = print; f(1); g(); [1].count(1);}g(){}")
+
+        # WHEN
+        Linker().link(program)
+
+        # THEN
+        statements = program.functions["main"].statements
+        calls = [statements[0], statements[2], statements[3], statements[4]]
+        self.assertIs(REGISTRY["print"], calls[0].builtin)
+        self.assertIs(REGISTRY["len"], calls[0].right_expr[0].builtin)
+        self.assertEqual([None, None, None], [call.builtin for call in calls[1:]])
+
+    @parameterized.expand([
+        ("exact", ("sleep", 2, 1, 1), "Execution error: sleep() takes 1 arguments but 2 were given"),
+        ("range", ("range", 0, 1, 3), "Execution error: range() takes from 1 to 3 arguments but 0 were given"),
+        ("at_least", ("max", 0, 1, None), "Execution error: max() takes at least 1 arguments but 0 were given"),
+    ])
+    def test_mismatched_args_count_message(self, _, args, expected):
+        # WHEN
+        result = str(MismatchedArgsCountException(*args))
+
+        # THEN
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([
+        (engine, "main(){\nhex(\n1, 2);\n}")
+        for engine in ["visitor", "release", "closure", "vm", "python"]
+    ])
+    def test_mismatched_args_count(self, engine, case):
+        # GIVEN
+        interpreter_class = release_interpreter_mapper["visitor"] if engine == "release" else interpreter_mapper[engine]
+
+        # WHEN
+        _, error, _ = run(interpreter_class, case)
+
+        # THEN
+        self.assertEqual(
+            (MismatchedArgsCountException, "Execution error: hex() takes 1 arguments but 2 were given"), error
+        )
+
+    @parameterized.expand([
+        (engine, *case)
+        for engine in ["release", "closure", "vm", "python"]
+        for case in BUILTIN_CASES
+    ])
+    def test_same_result(self, engine, _, case):
+        # GIVEN
+        interpreter_class = release_interpreter_mapper["visitor"] if engine == "release" else interpreter_mapper[engine]
+
+        # WHEN
+        expected = run(interpreter_mapper["visitor"], case)
+        result = run(interpreter_class, case)
+
+        # THEN
+        self.assertEqual(expected, result)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestBuiltin, 'test'))
+    return suite_
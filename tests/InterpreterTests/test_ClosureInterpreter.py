@@ -0,0 +1,127 @@
+import io
+import logging
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorHandler import ErrorHandler
+from Tutel.common.ErrorType import InterpreterException
+from Tutel.core.InterpreterModule.ClosureInterpreter import ClosureInterpreter
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from tests.InterpreterTests import test_Interpreter
+
+
+def get_error_handler():
+    return ErrorHandler(module="test_closure_interpreter", level=logging.CRITICAL)
+
+
+def trace(interpreter_class, case, start_with=None):
+    error_handler = get_error_handler()
+    program = Parser(error_handler).parse(Lexer(StringIO(case), error_handler))
+    events = []
+    interpreter = interpreter_class(error_handler)
+    interpreter.debug_callback = lambda: events.append(
+        (interpreter.lineno, [(frame.name, frame.lineno, str(frame.locals)) for frame in interpreter.call_stack],
+         interpreter.dropped_frame is not None)
+    )
+    output = io.StringIO()
+    error = None
+    with redirect_stdout(output):
+        try:
+            interpreter.execute(program, start_with)
+        except InterpreterException as e:
+            error = (type(e), str(e))
+    return events, output.getvalue(), error
+
+
+PARITY_CASES = [
+    ("arithmetic", "main(){a = 1; b = a + 2 * 3 - 4 / 2 // 1 % 5; print(a, b, -b, not a);}"),
+    ("aliasing", "main(){a = 1; b = a; a += 1; print(a, b);}"),
+    ("return_name", "main(){x = foo(); print(x);}foo(){a = 1; return a;}"),
+    ("return_many", "main(){x = foo(); print(x);}foo(){return 1, 2 + 3;}"),
+    ("stale_return", "main(){x = foo(); y = boo(); print(x, y);}foo(){return 5;}boo(){a = 1;}"),
+    ("if_elif_else", "main(){for(i in range(4)){if(i == 0){print(0);}elif(i > 1){print(1);}"
+                     "elif(i > 2){print(2);}else{print(3);}}}"),
+    ("empty_else", "main(){if(false){}else{}a = 1;}"),
+    ("nested_loops", "main(){\nfor(i in [1, 2]){\nj = 0;\nwhile(j < 2){\nj += 1;\n}\nprint(i, j);\n}\n}"),
+    ("recursion", "main(){print(fib(8));}\nfib(n){\nif(n < 2){\nreturn n;\n}\nreturn fib(n - 1) + fib(n - 2);\n}"),
+    ("return_in_loop", "main(){print(foo());}foo(){for(i in range(10)){if(i == 3){return i;}}}"),
+    ("lists", "main(){a = [1, [2, 3], 'x']; print(a[1][0], len(a), 2 in a[1], a);}"),
+    ("builtins", "main(){t = Turtle(); t.set_color(Color(1, 2, 3)); t.forward(10); print(t.position, type(1));}"),
+    ("do_else_shared", "main(){if(foo()){print(1);}else{print(2);}}foo(){if(true){}return false;}"),
+    ("shadow_builtin", "main(){print = 1;}"),
+    ("shadow_function", "main(){foo = 1;}foo(){}"),
+    ("not_defined", "main(){a = b;}"),
+    ("not_iterable", "main(){for(i in 1){}}"),
+    ("bad_operand", "main(){a = 1 + 'a';}"),
+    ("bad_unary", "main(){a = -'a';}"),
+    ("type_error_in_call", "main(){foo();}foo(){a = 1; b = a[0];}"),
+    ("args_count", "main(){foo(1);}foo(){}"),
+    ("attribute", "main(){a = 1; a.b;}"),
+    ("out_of_range", "main(){a = [1]; a[3];}"),
+    ("cannot_assign", "main(){1 = 2;}"),
+    ("recursion_limit", "main(){foo();}foo(){foo();}"),
+    ("leaked_return_flag", "main(){print(foo());}foo(){return bar(1);}bar(a){a = 2; b = 3; return a;}"),
+    ("leaked_return_flag_elif", "main(){x = foo();}foo(){return bar();}bar(){if(false){print(0);}elif(false){print(1);}"
+                                "elif(true){print(2);}else{print(3);}print(4);}"),
+    ("unboxed_aliasing", "main(){a = 1; b = a; c = a + 0; a += 1; print(a, b, c, a == b, c < a);}"),
+    ("unboxed_param", "main(){foo(1, true);}foo(x, y){a = 2; print(x + a, y == true, not y, -a);}"),
+    ("unboxed_iterator", "main(){s = 0; for(i in [1, 2]){s = s + i * 2;} print(s, s != 6);}"),
+    ("unboxed_lists", "main(){a = [1]; b = a + a; a.append(2); print(a, b, a * 2, len(b) > 1);}"),
+    ("unboxed_not_defined", "main(){if(false){a = 1;} b = a + 1;}"),
+    ("unboxed_bad_operand", "main(){a = 'a'; b = a - 1;}"),
+    ("unboxed_bad_unary", "main(){a = 'a'; b = -a;}"),
+    ("boxed_param", "main(){a = 1; foo(a); print(a);}foo(x){x += 5;}"),
+    ("boxed_list_slots", "main(){a = 1; l = [a, 2]; a += 1; m = l; m += [3]; x = l[1]; x += 10; print(l, m);}"),
+    ("boxed_return", "main(){l = [1]; x = foo(l); x += 1; print(l);}foo(l){return l[0];}"),
+    ("boxed_iterator", "main(){l = []; for(i in range(3)){l = l + [i];} for(j in l){j += 10;} print(l);}"),
+    ("unboxed_in", "main(){a = 'b'; l = [1, 2]; c = a in 'abc'; d = 2 in l; print(c, d, 'x' in 'abc');}"),
+    ("unboxed_mixed", "main(){a = 2; b = 10 - a; c = 'ab' * a; d = 7 // a + 7 % a; print(b, c, d, 1 < a, true + 1);}"),
+    ("short_circuit", "main(){\nxs = [1];\nfor(i in range(3)){\nif(i < len(xs) and xs[i] > 0 or foo(i)){\n"
+                      "print(i);\n}\n}\nprint(0 and foo(1), 2 or foo(2), 0 or 3, 4 and 5);\n}\nfoo(x){\nreturn x > 1;\n}"),
+    ("short_circuit_error", "main(){a = true and b;}"),
+    ("leaked_return_flag_loops", "main(){x = foo();}foo(){return bar();}bar(){for(i in [1, 2]){}while(i < 2){i += 1;}}"),
+]
+
+
+class TestClosureInterpreter(test_Interpreter.TestInterpreter):
+    interpreter_class = ClosureInterpreter
+
+
+class TestClosureInterpreterParity(unittest.TestCase):
+    @parameterized.expand(PARITY_CASES)
+    def test_same_trace(self, _, case):
+        # WHEN
+        expected = trace(Interpreter, case)
+        result = trace(ClosureInterpreter, case)
+
+        # THEN
+        if expected[2] is not None and expected[2][0].__name__ == "RecursionException":
+            self.assertEqual(expected[2], result[2], "Different exception raised.")
+            return
+        self.assertEqual(expected, result, "Execution differs from visitor interpreter.")
+
+    def test_program_compiled_once(self):
+        # GIVEN
+        error_handler = get_error_handler()
+        program = Parser(error_handler).parse(Lexer(StringIO("main(){a = 1;}"), error_handler))
+        interpreter = ClosureInterpreter(error_handler)
+
+        # WHEN
+        interpreter.execute(program)
+        compiled = interpreter._compiled_functions
+        interpreter.execute(program)
+
+        # THEN
+        self.assertIs(compiled, interpreter._compiled_functions, "Program compiled again.")
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestClosureInterpreter, 'test'))
+    suite_.addTest(unittest.makeSuite(TestClosureInterpreterParity, 'test'))
+    return suite_
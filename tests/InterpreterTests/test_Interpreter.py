@@ -1,5 +1,6 @@
 import logging
 import unittest
+from contextlib import redirect_stdout
 from io import StringIO
 
 from parameterized import parameterized
@@ -7,8 +8,9 @@ from parameterized import parameterized
 from Tutel.common.ErrorHandler import ErrorHandler
 from Tutel.common.ErrorType import InterpreterException, NothingToRunException, RecursionException, \
     NotDefinedException, NotIterableException, CannotAssignException, UnsupportedOperandException, \
-    BadOperandForUnaryException, AttributeException, MismatchedArgsCountException, OutOfRangeException, TypeException
+    BadOperandForUnaryException, AttributeException, MismatchedArgsCountException, OutOfRangeException
 from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Value import Value
 from Tutel.core.LexerModule.Lexer import Lexer
 from Tutel.core.ParserModule.Parser import Parser
 
@@ -18,6 +20,8 @@ def get_error_handler():
 
 
 class TestInterpreter(unittest.TestCase):
+    interpreter_class = Interpreter
+
     # def setUp(self) -> None:
     #     from Tutel.InterpreterModule.Interpreter import set_gui
     #     set_gui(GuiMock(verbose=True))
@@ -121,7 +125,7 @@ class TestInterpreter(unittest.TestCase):
         lexer = Lexer(StringIO(case), error_handler)
         parser = Parser(error_handler)
         program = parser.parse(lexer)
-        interpreter = Interpreter(error_handler)
+        interpreter = self.interpreter_class(error_handler)
 
         # WHEN
         try:
@@ -147,7 +151,7 @@ class TestInterpreter(unittest.TestCase):
         lexer = Lexer(StringIO(case), error_handler)
         parser = Parser(error_handler)
         program = parser.parse(lexer)
-        interpreter = Interpreter(error_handler)
+        interpreter = self.interpreter_class(error_handler)
 
         # WHEN
         try:
@@ -171,7 +175,7 @@ class TestInterpreter(unittest.TestCase):
         ("foo(){boo(1);}boo(){}", MismatchedArgsCountException),
         ("foo(){boo();}boo(a){}", MismatchedArgsCountException),
         ("foo(){slee();}", NotDefinedException),
-        ("foo(){sleep(1, 2);}", TypeException),
+        ("foo(){sleep(1, 2);}", MismatchedArgsCountException),
         ("foo(){a = [1, 2]; a[2];}", OutOfRangeException),
     ])
     def test_exceptions(self, case, exception):
@@ -180,11 +184,93 @@ class TestInterpreter(unittest.TestCase):
         lexer = Lexer(StringIO(case), error_handler)
         parser = Parser(error_handler)
         program = parser.parse(lexer)
-        interpreter = Interpreter(error_handler)
+        interpreter = self.interpreter_class(error_handler)
 
         # THEN
         self.assertRaises(exception, lambda _: interpreter.execute(program), f"{exception} not caught.")
 
+    @parameterized.expand([
+        ("and_not_defined", "foo(){a = false and b;print(a);}", "False\n"),
+        ("or_not_defined", "foo(){a = true or b;print(a);}", "True\n"),
+        ("and_call", "foo(){a = 0 and boo();print(a);}boo(){print('called');}", "0\n"),
+        ("or_call", "foo(){a = 1 or boo();print(a);}boo(){print('called');}", "1\n"),
+        ("guard", "foo(){xs = [1];i = 1;if(i < len(xs) and xs[i] > 0){print(1);}else{print(0);}}", "0\n"),
+        ("chained", "foo(){a = false and boo() or 2;print(a);}boo(){print('called');}", "2\n"),
+        ("and_right", "foo(){a = 1 and boo();print(a);}boo(){print('called');return 2;}", "called\n2\n"),
+        ("or_right", "foo(){a = 0 or boo();print(a);}boo(){print('called');return 2;}", "called\n2\n"),
+    ])
+    def test_short_circuit(self, _, case, expected):
+        # GIVEN
+        error_handler = get_error_handler()
+        lexer = Lexer(StringIO(case), error_handler)
+        parser = Parser(error_handler)
+        program = parser.parse(lexer)
+        interpreter = self.interpreter_class(error_handler)
+        output = StringIO()
+
+        # WHEN
+        with redirect_stdout(output):
+            interpreter.execute(program)
+
+        # THEN
+        self.assertEqual(expected, output.getvalue(), "Right operand evaluated when left one decided the result.")
+
+    @parameterized.expand([
+        ("range", "foo(){for(i in range(3)){print(i);}print(i);}", "0\n1\n2\n2\n"),
+        ("variable", "foo(){r = range(1, 7, 2);for(i in r){r = 0;print(i);}}", "1\n3\n5\n"),
+        ("empty", "foo(){i = 5;for(i in range(0)){print(i);}print(i);}", "5\n"),
+        ("fresh_value", "foo(){l = [];for(i in range(3)){a = i;a += 10;l.append(a);}print(l);}", "[10, 11, 12]\n"),
+        ("assigned", "foo(){for(i in range(3)){i = 7;print(i);}}", "7\n7\n7\n"),
+        ("return", "foo(){print(boo());}boo(){for(i in range(10)){if(i == 2){return i * 1;}}}", "2\n"),
+        ("nested", "foo(){for(i in range(2)){for(j in range(i, 2)){print(i, j);}}}", "0 0\n0 1\n1 1\n"),
+        ("recursive", "foo(){boo(2);}boo(n){for(i in range(n)){boo(n - 1);print(n, i);}}",
+         "1 0\n2 0\n1 0\n2 1\n"),
+    ])
+    def test_range_loop(self, _, case, expected):
+        # GIVEN
+        error_handler = get_error_handler()
+        lexer = Lexer(StringIO(case), error_handler)
+        parser = Parser(error_handler)
+        program = parser.parse(lexer)
+        interpreter = self.interpreter_class(error_handler)
+        output = StringIO()
+
+        # WHEN
+        with redirect_stdout(output):
+            interpreter.execute(program)
+
+        # THEN
+        self.assertEqual(expected, output.getvalue(), "Range loop gave different result.")
+
+    @parameterized.expand([
+        ("expressions", "foo(){i = 0;s = 0;while(i < 100){s = s + i * 2 - 1;i += 1;}}", 102),
+        ("builtins", "foo(){a = len('ab') + abs(-1);print(a > 2, max(a, 5), [1, 2][0] + 1);}", 3),
+        ("list", "foo(){a = 1;l = [a, 2, a + 1];}", 4),
+        ("call", "foo(){a = boo(1, 2);}boo(x, y){return x + y;}", 3),
+    ])
+    def test_values_created(self, _, case, expected):
+        # GIVEN
+        error_handler = get_error_handler()
+        program = Parser(error_handler).parse(Lexer(StringIO(case), error_handler))
+        interpreter = self.interpreter_class(error_handler)
+        created = []
+        init = Value.__init__
+
+        def counting_init(value_obj, value):
+            created.append(value)
+            init(value_obj, value)
+
+        # WHEN
+        Value.__init__ = counting_init
+        try:
+            with redirect_stdout(StringIO()):
+                interpreter.execute(program)
+        finally:
+            Value.__init__ = init
+
+        # THEN
+        self.assertEqual(expected, len(created), "Values created for more than variables, list slots and returns.")
+
     def test_start_with_specific_function(self):
         # GIVEN
         case = "foo(){a += 1;}boo(){}"
@@ -193,7 +279,7 @@ class TestInterpreter(unittest.TestCase):
         lexer = Lexer(StringIO(case), error_handler)
         parser = Parser(error_handler)
         program = parser.parse(lexer)
-        interpreter = Interpreter(error_handler)
+        interpreter = self.interpreter_class(error_handler)
 
         # WHEN
         try:
@@ -211,13 +297,37 @@ class TestInterpreter(unittest.TestCase):
         lexer = Lexer(StringIO(case), error_handler)
         parser = Parser(error_handler)
         program = parser.parse(lexer)
-        interpreter = Interpreter(error_handler)
+        interpreter = self.interpreter_class(error_handler)
 
         # THEN
         self.assertRaises(exception, lambda _: interpreter.execute(program, start_with), f"{exception} not caught.")
 
 
+class TestCountedLoop(unittest.TestCase):
+    def test_same_lines_as_list(self):
+        # GIVEN
+        cases = ["foo(){\nfor(i in range(3)){\na = i;\nb = a;\n}\n}", "foo(){\nfor(i in [0, 1, 2]){\na = i;\nb = a;\n}\n}"]
+        lines = []
+        for case in cases:
+            program = Parser(get_error_handler()).parse(Lexer(StringIO(case), get_error_handler()))
+            events = []
+
+            def record():
+                frame = interpreter.call_stack[-1] if interpreter.call_stack else None
+                events.append((interpreter.lineno, frame and repr(frame.locals)))
+
+            interpreter = Interpreter(get_error_handler(), debug_callback=record)
+
+            # WHEN
+            interpreter.execute(program)
+            lines.append(events)
+
+        # THEN
+        self.assertEqual(lines[1], lines[0], "Debugger would stop at different lines.")
+
+
 def suite():
     suite_ = unittest.TestSuite()
     suite_.addTest(unittest.makeSuite(TestInterpreter, 'test'))
+    suite_.addTest(unittest.makeSuite(TestCountedLoop, 'test'))
     return suite_
@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import BuiltinFunctionShadowException
+from Tutel.core.InterpreterModule import TutelBuiltins
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.Linker import Linker, Binding
+from tests.TranspilerTests.test_Transpiler import RecordingErrorHandler, parse, run
+
+
+class TestLinker(unittest.TestCase):
+    def test_bindings(self):
+        # GIVEN
+        program = parse("main(){a = print; foo(a, len);}foo(x, y){}")
+
+        # WHEN
+        Linker(RecordingErrorHandler()).link(program)
+
+        # THEN
+        main = program.functions["main"]
+        assignment, call = main.statements
+        self.assertEqual((Binding.LOCAL, None), (assignment.left_expr.binding, assignment.left_expr.target))
+        self.assertEqual((Binding.BUILTIN, TutelBuiltins.print),
+                         (assignment.right_expr.binding, assignment.right_expr.target))
+        self.assertEqual((Binding.FUNCTION, program.functions["foo"]), (call.left_expr.binding, call.left_expr.target))
+        self.assertEqual([Binding.LOCAL, Binding.BUILTIN], [argument.binding for argument in call.right_expr])
+
+    def test_builtin_before_function(self):
+        # GIVEN
+        program = parse("main(){print(1);}print(x){}")
+
+        # WHEN
+        Linker(RecordingErrorHandler()).link(program)
+
+        # THEN
+        self.assertEqual(Binding.BUILTIN, program.functions["main"].statements[0].left_expr.binding)
+
+    @parameterized.expand([
+        ("assignment", "main(){foo = 1;}foo(){}"),
+        ("param", "main(){}bar(foo){}foo(){}"),
+        ("iterator", "main(){for(foo in [1]){}}foo(){}"),
+        ("not_executed", "main(){if(false){foo = 1;}}foo(){}"),
+    ])
+    def test_shadowing(self, _, case):
+        # THEN
+        with self.assertRaises(BuiltinFunctionShadowException):
+            Linker(RecordingErrorHandler()).link(parse(case))
+
+    def test_attribute_caches(self):
+        # GIVEN
+        program = parse("main(){t = Turtle(); t.forward(t.orientation);}")
+        call = program.functions["main"].statements[1]
+        caches = (call.left_expr.cache, call.right_expr[0].cache)
+
+        # WHEN
+        Linker(RecordingErrorHandler()).link(program)
+
+        # THEN
+        self.assertEqual((None, None), caches, "Parser created runtime caches.")
+        self.assertEqual(["forward", "orientation"], [call.left_expr.cache.name, call.right_expr[0].cache.name])
+
+    def test_shadowing_reported_before_run(self):
+        # WHEN
+        output, error, _ = run(Interpreter, "main(){print(1);foo = 1;}foo(){}")
+
+        # THEN
+        self.assertEqual("", output, "Program started before reporting the error.")
+        self.assertEqual(BuiltinFunctionShadowException, error[0])
+
+    def test_no_lookup_at_runtime(self):
+        # GIVEN
+        case = "main(){a = 1; print(a, len([a])); foo(a);}foo(x){b = x + 1;}"
+
+        # WHEN
+        with patch.object(Interpreter, "_get_builtin_global_or_local_var", side_effect=AssertionError):
+            output, error, _ = run(Interpreter, case)
+
+        # THEN
+        self.assertEqual(("1 1\n", None), (output, error))
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestLinker, 'test'))
+    return suite_
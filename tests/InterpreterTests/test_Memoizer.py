@@ -0,0 +1,164 @@
+import io
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import InterpreterException
+from Tutel.core.__main__ import get_arg_parser
+from Tutel.core.InterpreterModule.Memoizer import Memoizer, CacheInfo
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner, interpreter_mapper, release_interpreter_mapper
+from tests.InterpreterTests.test_ClosureInterpreter import PARITY_CASES
+from tests.TranspilerTests.test_Transpiler import RecordingErrorHandler, parse
+
+MEMOIZER_CASES = [
+    ("repeated_calls", "main(){for(i in range(20)){print(sq(i % 4));}}sq(x){return x * x;}"),
+    ("recursion", "main(){print(fib(15));}fib(n){if(n < 2){return n + 0;} a = fib(n - 1); b = fib(n - 2); return a + b;}"),
+    ("stale_return", "main(){print(bar(1)); print(foo(2)); print(bar(1));}foo(x){return x * 10;}bar(x){if(x > 5){return 1;}}"),
+    ("stale_return_of_callee", "main(){print(foo(1)); print(bar(3)); print(foo(1));}foo(x){baz(x); return;}"
+                               "bar(x){return x * 2;}baz(x){if(x > 5){return 1;}}"),
+    ("return_flag", "main(){print(baz(2)); print(foo(2)); print(baz(2)); print(foo(2));}"
+                    "baz(n){return foo(n) + 1;}foo(n){a = n * 2; return a + 1;}"),
+    ("returned_argument", "main(){a = 1; b = foo(a); b += 1; print(a); c = foo(a); c += 1; print(a);}foo(x){return x or 0;}"),
+    ("else_flag", "main(){if(foo(1)){print(1);} elif(foo(0)){print(2);} else{print(3);}"
+                  "if(foo(0)){print(4);} elif(foo(0)){print(5);} else{print(6);}}foo(x){if(x){y = 1;} return x + 0;}"),
+    ("argument_types", "main(){print(foo(1)); print(foo(true)); print(foo('1')); print(foo(1));}foo(x){return str(x);}"),
+    ("list_argument", "main(){l = [1]; print(foo(l)); l += [2]; print(foo(l));}foo(l){return len(l);}"),
+    ("impure", "main(){foo(1); foo(1);}foo(x){print(x);}"),
+    ("error", "main(){print(foo(1)); print(foo('a')); print(foo('a'));}foo(x){return x - 1;}"),
+]
+
+
+def run(interpreter_class, case, memoizer=None):
+    error_handler = RecordingErrorHandler()
+    program = parse(case, error_handler)
+    output = io.StringIO()
+    error = None
+    with redirect_stdout(output):
+        try:
+            interpreter_class(error_handler, memoizer=memoizer).execute(program, "main")
+        except InterpreterException as e:
+            error = (type(e), str(e))
+    return output.getvalue(), error
+
+
+class TestMemoizer(unittest.TestCase):
+    @parameterized.expand([
+        (engine, *case)
+        for engine in ["visitor", "release", "closure"]
+        for case in PARITY_CASES + MEMOIZER_CASES
+    ])
+    def test_same_result(self, engine, _, case):
+        # GIVEN
+        interpreter_class = release_interpreter_mapper["visitor"] if engine == "release" else interpreter_mapper[engine]
+
+        # WHEN
+        expected = run(interpreter_class, case)
+        result = run(interpreter_class, case, Memoizer())
+
+        # THEN
+        self.assertEqual(expected, result, "Memoized program behaves differently.")
+
+    @parameterized.expand([
+        ("repeated_calls", "main(){for(i in range(20)){sq(i % 4);}}sq(x){return x * x;}", {"sq": CacheInfo(16, 4, 128, 4)}),
+        ("recursion", "main(){fib(10);}fib(n){if(n < 2){return n + 0;} a = fib(n - 1); b = fib(n - 2); return a + b;}",
+         {"fib": CacheInfo(8, 11, 128, 11)}),
+        ("impure", "main(){foo(1);}foo(x){print(x);}", {}),
+        ("stale_return", "main(){foo(1); foo(1);}foo(x){if(x > 5){return 1;}}", {"foo": CacheInfo(0, 2, 128, 0)}),
+        ("returned_argument", "main(){a = 1; foo(a); foo(a);}foo(x){return x or 0;}", {"foo": CacheInfo(0, 2, 128, 0)}),
+        ("list_argument", "main(){foo([1]); foo([1]);}foo(l){return len(l);}", {"foo": CacheInfo(0, 0, 128, 0)}),
+    ])
+    def test_stats(self, _, case, expected):
+        # GIVEN
+        memoizer = Memoizer()
+
+        # WHEN
+        with redirect_stdout(io.StringIO()):
+            interpreter_mapper["visitor"](memoizer=memoizer).execute(parse(case), "main")
+
+        # THEN
+        self.assertEqual(expected, {name: info for name, info in memoizer.stats().items() if name != "main"})
+
+    def test_least_recently_used(self):
+        # GIVEN
+        memoizer = Memoizer(maxsize=2)
+        case = "main(){foo(1); foo(2); foo(1); foo(3); foo(1); foo(2);}foo(x){return x + 1;}"
+
+        # WHEN
+        interpreter_mapper["visitor"](memoizer=memoizer).execute(parse(case), "main")
+
+        # THEN
+        self.assertEqual(CacheInfo(2, 4, 2, 2), memoizer.stats()["foo"])
+        self.assertEqual([((int, 1),), ((int, 2),)], list(memoizer.caches["foo"].entries))
+
+    def test_str(self):
+        # GIVEN
+        memoizer = Memoizer()
+        interpreter_mapper["visitor"](memoizer=memoizer).execute(parse("main(){foo(1); foo(1);}foo(x){return x;}"), "main")
+
+        # WHEN
+        result = str(memoizer)
+
+        # THEN
+        self.assertEqual("function                 hits   misses         size\n"
+                         "main                        0        0        0/128\n"
+                         "foo                         1        1        1/128", result)
+        self.assertEqual("No pure functions to memoize", str(Memoizer()))
+
+
+class TestMemoizeOption(unittest.TestCase):
+    def test_runner(self):
+        # GIVEN
+        runner = TutelRunner("main(){foo(); foo();}foo(){return 1;}", TutelOptions(memoize=True, memoize_stats=True))
+        stderr = io.StringIO()
+
+        # WHEN
+        with redirect_stderr(stderr):
+            runner.run()
+
+        # THEN
+        self.assertEqual({"main": CacheInfo(0, 0, 128, 0), "foo": CacheInfo(1, 1, 128, 1)}, runner.interpreter.memoizer.stats())
+        self.assertEqual(f"{runner.interpreter.memoizer}\n", stderr.getvalue())
+
+    @parameterized.expand([
+        ("not_enabled", TutelOptions(), False),
+        ("visitor", TutelOptions(memoize=True), True),
+        ("closure", TutelOptions(memoize=True, engine="closure"), True),
+        ("vm", TutelOptions(memoize=True, engine="vm"), False),
+        ("python", TutelOptions(memoize=True, engine="python"), False),
+    ])
+    def test_engines(self, _, options, expected):
+        # GIVEN
+        stderr = io.StringIO()
+
+        # WHEN
+        with redirect_stderr(stderr):
+            runner = TutelRunner("main(){}", options)
+
+        # THEN
+        self.assertEqual(expected, runner.interpreter.memoizer is not None)
+        warned = options.memoize and not expected
+        self.assertEqual(warned, f"not supported by the {options.engine} engine" in stderr.getvalue())
+
+    def test_size(self):
+        # WHEN
+        runner = TutelRunner("main(){}", TutelOptions(memoize=True, memoize_size=4))
+
+        # THEN
+        self.assertEqual(4, runner.interpreter.memoizer.maxsize)
+
+    def test_command_line(self):
+        # WHEN
+        args = get_arg_parser().parse_args(["-c", "main(){}", "--memoize-stats", "--memoize-size", "16"])
+
+        # THEN
+        self.assertEqual((False, True, 16), (args.memoize, args.memoize_stats, args.memoize_size))
+        self.assertFalse(get_arg_parser().parse_args(["-c", "main(){}"]).memoize)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestMemoizer, 'test'))
+    suite_.addTest(unittest.makeSuite(TestMemoizeOption, 'test'))
+    return suite_
@@ -0,0 +1,101 @@
+import threading
+import unittest
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import Stop
+from Tutel.core.__main__ import get_arg_parser
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.InterpreterModule.ReleaseInterpreter import ReleaseInterpreter
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+from tests.InterpreterTests import test_Interpreter
+from tests.InterpreterTests.test_ClosureInterpreter import PARITY_CASES
+from tests.TranspilerTests.test_Transpiler import RecordingErrorHandler, parse, run
+
+
+class TestReleaseInterpreter(test_Interpreter.TestInterpreter):
+    interpreter_class = ReleaseInterpreter
+
+
+class TestReleaseInterpreterParity(unittest.TestCase):
+    @parameterized.expand(PARITY_CASES + [
+        ("nested_frames", "main(){\na = 1;\nfoo(a);\n}\nfoo(x){\ny = x;\nz = [1,\n2][5];\n}"),
+        ("error_in_loop_body", "main(){\nfor(i in [1, 2]){\nfoo(i);\n}\n}\nfoo(x){\nif(x > 1){\nx.bar;\n}\n}"),
+        ("error_in_while_condition", "main(){\na = 0;\nwhile(a < 2){\na += 1;\nb = 1;\n}\n}"),
+        ("while_condition_after_body", "main(){\na = [1];\nwhile(a[0] < 2){\na = 'x';\n}\n}"),
+        ("error_in_elif", "main(){\na = 1;\nif(a > 1){\nb = 1;\n}\nelif(a + 'x'){\nb = 2;\n}\n}"),
+        ("error_in_else", "main(){\nif(false){\nb = 1;\n}\nelse{\nb = 2;\nb.c;\n}\n}"),
+        ("multiline_expression", "main(){\na = 1 +\n2 -\n-'x';\n}"),
+    ])
+    def test_same_result(self, _, case):
+        # WHEN
+        expected = run(Interpreter, case)
+        result = run(ReleaseInterpreter, case)
+
+        # THEN
+        if expected[1] is not None and expected[1][0].__name__ == "RecursionException":
+            self.assertEqual(expected[1], result[1], "Different exception raised.")
+            return
+        self.assertEqual(expected, result, "Execution differs from visitor interpreter.")
+
+    def test_no_line_tracking(self):
+        # GIVEN
+        program = parse("main(){a = 0; while(a < 3){a += 1;} foo();}foo(){}")
+        events = []
+        interpreter = ReleaseInterpreter(RecordingErrorHandler(), debug_callback=lambda: events.append(1))
+
+        # WHEN
+        interpreter.execute(program)
+
+        # THEN
+        self.assertEqual([], events, "Debug callback called.")
+
+    @parameterized.expand([
+        ("while", "main(){while(true){a = 1;}}"),
+        ("for", "main(){a = [1]; for(i in a){a.append(i);}}"),
+        ("call_in_loop", "main(){while(true){foo();}}foo(){a = 1;}"),
+        ("range", "main(){for(i in range(1000000000)){a = i;}}"),
+    ])
+    def test_stop(self, _, case):
+        # GIVEN
+        program = parse(case)
+        interpreter = ReleaseInterpreter(RecordingErrorHandler())
+        timer = threading.Timer(0.05, interpreter.stop)
+
+        # WHEN
+        timer.start()
+        try:
+            # THEN
+            with self.assertRaises(Stop):
+                interpreter.execute(program)
+        finally:
+            timer.cancel()
+
+
+class TestReleaseMode(unittest.TestCase):
+    def test_runner(self):
+        # WHEN
+        release = TutelRunner("main(){}", TutelOptions(release=True))
+        traced = TutelRunner("main(){}", TutelOptions(release=False))
+
+        # THEN
+        self.assertEqual(ReleaseInterpreter, type(release.interpreter))
+        self.assertEqual(Interpreter, type(traced.interpreter))
+
+    def test_default_for_command_line(self):
+        # WHEN
+        default = get_arg_parser().parse_args(["-c", "main(){}"])
+        traced = get_arg_parser().parse_args(["-c", "main(){}", "--trace-lines"])
+
+        # THEN
+        self.assertFalse(default.trace_lines)
+        self.assertTrue(traced.trace_lines)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestReleaseInterpreter, 'test'))
+    suite_.addTest(unittest.makeSuite(TestReleaseInterpreterParity, 'test'))
+    suite_.addTest(unittest.makeSuite(TestReleaseMode, 'test'))
+    return suite_
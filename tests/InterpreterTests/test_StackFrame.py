@@ -0,0 +1,78 @@
+import json
+import unittest
+
+from Tutel.common.JsonSerializable import JsonSerializable
+from Tutel.core.InterpreterModule.StackFrame import StackFrame
+from Tutel.core.InterpreterModule.Value import Value
+
+
+class TestStackFrame(unittest.TestCase):
+    def test_slots(self):
+        # GIVEN
+        frame = StackFrame("main", 1, {"a": 0, "b": 1})
+
+        # WHEN
+        frame.set("b", Value(2))
+
+        # THEN
+        self.assertEqual([None, frame.get("b")], frame.values)
+        self.assertIsNone(frame.get("a"))
+        self.assertIsNone(frame.unresolved, "Unresolved locals created.")
+
+    def test_unresolved(self):
+        # GIVEN
+        frame = StackFrame("main", 1, {"a": 0})
+        value = Value(1)
+
+        # WHEN
+        frame.set("x", value)
+
+        # THEN
+        self.assertIs(value, frame.get("x"))
+        self.assertEqual([None], frame.values)
+
+    def test_locals_view(self):
+        # GIVEN
+        frame = StackFrame("main", 1, {"a": 0, "b": 1, "c": 2})
+        frame.set("c", Value(3))
+        frame.set("a", Value(1))
+        frame.set("x", Value(4))
+
+        # WHEN
+        frame.locals["b"] = Value(2)
+        del frame.locals["c"]
+
+        # THEN
+        self.assertEqual(["a", "b", "x"], list(frame.locals))
+        self.assertEqual(3, len(frame.locals))
+        self.assertNotIn("c", frame.locals)
+        self.assertIs(frame.get("b"), frame.locals["b"])
+        with self.assertRaises(KeyError):
+            frame.locals["c"]
+
+    def test_json(self):
+        # GIVEN
+        frame = StackFrame("main", 3, {"a": 0, "b": 1})
+        frame.file = "file.tut"
+        frame.set("a", Value([1, Value(2)]))
+
+        # WHEN
+        serialized = json.dumps(frame, default=lambda o: o.to_json() if isinstance(o, JsonSerializable) else o)
+
+        # THEN
+        self.assertEqual({"file": "file.tut", "name": "main", "lineno": 3, "locals": {"a": [1, 2]}},
+                         json.loads(serialized))
+
+    def test_no_instance_dict(self):
+        # WHEN
+        frame = StackFrame("main", 1)
+
+        # THEN
+        with self.assertRaises(AttributeError):
+            frame.other = 1
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestStackFrame, 'test'))
+    return suite_
@@ -0,0 +1,141 @@
+import io
+import math
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from parameterized import parameterized
+
+from Tutel.core import GuiModule
+from Tutel.core.GuiModule.GuiMock import GuiMock
+from Tutel.core.InterpreterModule.Turtle.Color import Color
+from Tutel.core.InterpreterModule.Turtle.Position import Position
+from Tutel.core.InterpreterModule.Turtle.Turtle import Turtle, DIRECTIONS, direction
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner, interpreter_mapper
+from tests.TranspilerTests.test_Transpiler import run
+
+
+class RecordingGui(GuiMock):
+    def __init__(self) -> None:
+        super().__init__()
+        self.commands = []
+
+    def _message(self, msg: str):
+        self.commands.append(msg.split(" [")[0])
+
+
+class TestTurtle(unittest.TestCase):
+    def setUp(self):
+        self.gui = GuiModule.GUI
+        GuiModule.GUI = RecordingGui()
+
+    def tearDown(self):
+        GuiModule.GUI = self.gui
+
+    @parameterized.expand([
+        ("color", Color(1, 2, 3), Color(1, 2, 3), Color(1, 2, 4)),
+        ("clamped_color", Color(-5, 300, 0), Color(0, 255, 0), Color(0, 254, 0)),
+        ("position", Position(1, 2), Position(1.0, 2.0), Position(2, 1)),
+    ])
+    def test_equality(self, _, value, equal, different):
+        # THEN
+        self.assertEqual(value, equal)
+        self.assertEqual(hash(value), hash(equal))
+        self.assertNotEqual(value, different)
+        self.assertNotEqual(value, tuple(value))
+
+    @parameterized.expand([
+        ("color", lambda t: t.set_color(Color(255, 0, 0)), lambda t: t.set_color(Color(0, 0, 0)), "Set color of"),
+        ("position", lambda t: t.set_position(Position(0, 0)), lambda t: t.set_position(Position(0, 1)),
+         "Set position of"),
+        ("orientation", lambda t: t.set_orientation(360), lambda t: t.set_orientation(90), "Set orientation of"),
+    ])
+    def test_redundant_change_suppressed(self, _, redundant_change, change, command):
+        # GIVEN
+        turtle = Turtle.turtle_init()
+        suppressed_commands = Turtle.suppressed_commands
+
+        # WHEN
+        redundant_change(turtle)
+        change(turtle)
+        change(turtle)
+
+        # THEN
+        self.assertEqual(["Add", command], GuiModule.GUI.commands)
+        self.assertEqual(2, Turtle.suppressed_commands - suppressed_commands)
+
+    def test_state_changed(self):
+        # GIVEN
+        turtle = Turtle.turtle_init()
+
+        # WHEN
+        turtle.set_color(Color(1, 2, 3))
+        turtle.set_position(Position(4, 5))
+        turtle.turn_left()
+
+        # THEN
+        self.assertEqual((Color(1, 2, 3), Position(4, 5), 90), (turtle.color, turtle.position, turtle.orientation))
+
+    def test_directions(self):
+        # THEN
+        for orientation, (sin, cos) in enumerate(DIRECTIONS):
+            if orientation % 90 == 0:
+                self.assertEqual((round(sin), round(cos)), (sin, cos))
+            else:
+                radians = (orientation / 360) * 2 * math.pi
+                self.assertEqual((math.sin(radians), math.cos(radians)), (sin, cos))
+
+    @parameterized.expand([
+        ("table", 30, DIRECTIONS[30]),
+        ("full_turn", 390, DIRECTIONS[30]),
+        ("negative", -90, (-1.0, 0.0)),
+        ("fractional", 22.5, (math.sin(math.pi / 8), math.cos(math.pi / 8))),
+    ])
+    def test_direction(self, _, orientation, expected):
+        # WHEN
+        result = direction(orientation)
+
+        # THEN
+        self.assertEqual(expected, result)
+
+    def test_cardinal_moves_exact(self):
+        # GIVEN
+        turtle = Turtle.turtle_init()
+        positions = []
+
+        # WHEN
+        for _ in range(4):
+            turtle.forward(3)
+            positions.append(turtle.position)
+            turtle.turn_right()
+
+        # THEN
+        self.assertEqual([(0, 3), (-3, 3), (-3, 0), (0, 0)], [tuple(position) for position in positions])
+        self.assertEqual(Position(0, 0), turtle.position)
+
+    def test_colors_compared_by_value(self):
+        # WHEN
+        code = "main(){a = Color(1, 2, 3); b = a == Color(1, 2, 3); c = a != Color(0, 2, 3); print(b, c);}"
+        output, error, _ = run(interpreter_mapper["visitor"], code)
+
+        # THEN
+        self.assertEqual(("True True\n", None), (output, error))
+
+    def test_gui_stats(self):
+        # GIVEN
+        code = "main(){t = Turtle(); c = Color(1, 2, 3); for(i in range(4)){t.set_color(c); t.forward(1);}}"
+        runner = TutelRunner(code, TutelOptions(gui_stats=True))
+        stderr = io.StringIO()
+
+        # WHEN
+        with redirect_stderr(stderr), redirect_stdout(io.StringIO()):
+            runner.run()
+
+        # THEN
+        self.assertEqual("Redundant GUI commands suppressed: 3\n", stderr.getvalue())
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestTurtle, 'test'))
+    return suite_
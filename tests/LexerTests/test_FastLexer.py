@@ -0,0 +1,94 @@
+import glob
+import logging
+import os
+import unittest
+from io import StringIO
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorHandler import ErrorHandler
+from Tutel.common.ErrorType import LexerException
+from Tutel.core.LexerModule.FastLexer import FastLexer
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.LexerModule.Tokens import TokenType
+from tests.LexerTests import test_Lexer
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "examples")
+
+
+def get_error_handler():
+    return ErrorHandler(module="test_fast_lexer", level=logging.CRITICAL)
+
+
+def get_tokens(lexer_class, source):
+    lexer = lexer_class(StringIO(source), get_error_handler())
+    tokens = []
+    try:
+        while (token := lexer.get_next_token()).type != TokenType.T_ETX:
+            tokens.append(token)
+        tokens.append(token)
+    except LexerException as e:
+        tokens.append((type(e), lexer.token))
+    return tokens
+
+
+class TestFastLexerSimple(test_Lexer.TestLexerSimple):
+    lexer_class = FastLexer
+
+
+class TestFastLexerComplexer(test_Lexer.TestLexerComplexer):
+    lexer_class = FastLexer
+
+
+class TestFastLexerErrorHandling(test_Lexer.TestLexerErrorHandling):
+    lexer_class = FastLexer
+
+
+class TestFastLexerParity(unittest.TestCase):
+    @parameterized.expand([(os.path.basename(path), path) for path in sorted(glob.glob(f"{EXAMPLES_DIR}/*.tut"))])
+    def test_examples(self, _, path):
+        # GIVEN
+        with open(path, "r") as file:
+            source = file.read()
+
+        # WHEN
+        expected = get_tokens(Lexer, source)
+        result = get_tokens(FastLexer, source)
+
+        # THEN
+        self.assertEqual(expected, result, "Token streams differ.")
+
+    @parameterized.expand([
+        ("crlf_comment", "# comment\r\nfoo();\r\n"),
+        ("lfcr_lines", "a\n\rb\r\rc\n\n\rd"),
+        ("cr_in_text_const", "x = 'a\rb';"),
+        ("unicode_identifier", "żółw = 1; ²x = 2;"),
+        ("unicode_digits", "a = ٣٤;"),
+        ("leading_zeros", "a = 0; b = 00; c = 007;"),
+        ("max_integer", "a = 2147483647; b = 2147483648;"),
+        ("long_identifier", "a" * 70 + " = 1;"),
+        ("long_identifier_underscores", "a" * 64 + "_" * 5 + " = 1;"),
+        ("long_comment", "#" + "c" * 1030 + "\nfoo"),
+        ("long_text_const", "'" + "s" * 1030 + "'"),
+        ("escapes", "'\\n\\t\\'\\\"' \"\\q\""),
+        ("unterminated", "'abc\n'"),
+        ("etx_inside", "foo();\x03bar();"),
+        ("unknown", "a = 1 @ 2;"),
+        ("operators", "a<=b>=c==d!=e+=f-=g*=h/=i//j%=k%l"),
+    ])
+    def test_edge_cases(self, _, source):
+        # WHEN
+        expected = get_tokens(Lexer, source)
+        result = get_tokens(FastLexer, source)
+
+        # THEN
+        self.assertEqual(expected, result, "Token streams differ.")
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestFastLexerSimple, 'test'))
+    suite_.addTest(unittest.makeSuite(TestFastLexerComplexer, 'test'))
+    suite_.addTest(unittest.makeSuite(TestFastLexerErrorHandling, 'test'))
+    suite_.addTest(unittest.makeSuite(TestFastLexerParity, 'test'))
+    return suite_
@@ -1,6 +1,6 @@
 import logging
 import unittest
-from io import StringIO
+from io import StringIO, BytesIO
 
 from parameterized import parameterized
 
@@ -12,9 +12,12 @@ from Tutel.common.ErrorType import IdentifierTooLongLexerException, TextConstToo
 from Tutel.core.LexerModule.Lexer import Lexer, Token
 from Tutel.core.LexerModule.Lexer import MAX_IDENTIFIER_LENGTH, MAX_TEXT_CONST_LENGTH, MAX_COMMENT_LENGTH
 from Tutel.core.LexerModule.Lexer import operators, TokenType, keywords
+from Tutel.core.LexerModule.TokenBuffer import TokenBuffer, get_bp_possible_lines
 
 
 class TestLexerSimple(unittest.TestCase):
+    lexer_class = Lexer
+
     @parameterized.expand([
         ("\ntest", Token(TokenType.T_IDENTIFIER, "test", 2, 1)),
         ("\n\rtest", Token(TokenType.T_IDENTIFIER, "test", 2, 1)),
@@ -26,7 +29,7 @@ class TestLexerSimple(unittest.TestCase):
     def test_skip_whites(self, case, expect):
         # GIVEN
         source = case
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -38,7 +41,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = "\x03"
         expected = Token(TokenType.T_ETX, '\x03', 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -55,7 +58,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = case
         expected = Token(TokenType.T_COMMENT, expect, 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -77,7 +80,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = case
         expected = Token(TokenType.T_IDENTIFIER, expect, 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -104,7 +107,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = case
         expected = Token(keywords[expect], expect, 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -126,7 +129,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = case
         expected = Token(TokenType.T_TEXT_CONST, expect, 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -145,7 +148,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = case
         expected = Token(TokenType.T_NUMBER, expect, 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -172,7 +175,7 @@ class TestLexerSimple(unittest.TestCase):
         # GIVEN
         source = case
         expected = Token(operators[expect], expect, 1, 1)
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
 
         # WHEN
         token = lexer.get_next_token()
@@ -182,6 +185,8 @@ class TestLexerSimple(unittest.TestCase):
 
 
 class TestLexerComplexer(unittest.TestCase):
+    lexer_class = Lexer
+
     @parameterized.expand([
         (
                 "while true 12 asdf5",
@@ -216,7 +221,7 @@ class TestLexerComplexer(unittest.TestCase):
     ])
     def test_get_next_token_one_line(self, source, expected):
         # GIVEN
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
         result = []
 
         # WHEN
@@ -251,7 +256,43 @@ class TestLexerComplexer(unittest.TestCase):
     ])
     def test_get_next_token_multiple_lines(self, source, expected):
         # GIVEN
-        lexer = Lexer(StringIO(source), get_error_handler())
+        lexer = self.lexer_class(StringIO(source), get_error_handler())
+        result = []
+
+        # WHEN
+        token = lexer.get_next_token()
+        result.append(token)
+        while token.type != TokenType.T_ETX:
+            token = lexer.get_next_token()
+            result.append(token)
+
+        # THEN
+        self.assertEqual(expected, result, "Wrong tokens detected.")
+
+    @parameterized.expand([
+        ("str", lambda code: code),
+        ("bytes", lambda code: code.encode()),
+        ("text_stream", lambda code: StringIO(code)),
+        ("binary_stream", lambda code: BytesIO(code.encode())),
+    ])
+    def test_get_next_token_source_types(self, _, make_source):
+        # GIVEN
+        source = "foo() {\r\n\tprint('żółw');\n\r}\rbar"
+        expected = [
+            Token(TokenType.T_IDENTIFIER, "foo", 1, 1),
+            Token(TokenType.T_LEFT_BRACKET, "(", 1, 4),
+            Token(TokenType.T_RIGHT_BRACKET, ")", 1, 5),
+            Token(TokenType.T_LEFT_CURLY_BRACKET, "{", 1, 7),
+            Token(TokenType.T_IDENTIFIER, "print", 2, 2),
+            Token(TokenType.T_LEFT_BRACKET, "(", 2, 7),
+            Token(TokenType.T_TEXT_CONST, "żółw", 2, 8),
+            Token(TokenType.T_RIGHT_BRACKET, ")", 2, 14),
+            Token(TokenType.T_SEMICOLON, ";", 2, 15),
+            Token(TokenType.T_RIGHT_CURLY_BRACKET, "}", 3, 1),
+            Token(TokenType.T_IDENTIFIER, "bar", 4, 1),
+            Token(TokenType.T_ETX, "\x03", 4, 4),
+        ]
+        lexer = self.lexer_class(make_source(source), get_error_handler())
         result = []
 
         # WHEN
@@ -270,6 +311,8 @@ def get_error_handler():
 
 
 class TestLexerErrorHandling(unittest.TestCase):
+    lexer_class = Lexer
+
     @parameterized.expand([
         ('\1', '\1'),
         ("\2", "\2"),
@@ -279,7 +322,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_UNKNOWN, expect, 1, 1)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(UnknownTokenLexerException, lexer.get_next_token)
@@ -294,7 +337,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 2)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(UnterminatedStringLexerException, lexer.get_next_token)
@@ -309,7 +352,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 1)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(TextConstTooLongLexerException, lexer.get_next_token)
@@ -324,7 +367,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 1)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(IdentifierTooLongLexerException, lexer.get_next_token)
@@ -339,7 +382,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 1)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(CommentTooLongLexerException, lexer.get_next_token)
@@ -354,7 +397,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 1)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(IntegerTooLargeLexerException, lexer.get_next_token)
@@ -369,7 +412,7 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 2)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(LeadingZerosInIntegerLexerException, lexer.get_next_token)
@@ -384,16 +427,74 @@ class TestLexerErrorHandling(unittest.TestCase):
         source = case
         expected = Token(TokenType.T_ILLEGAL, expect, 1, 2)
         error_handler = get_error_handler()
-        lexer = Lexer(StringIO(source), error_handler)
+        lexer = self.lexer_class(StringIO(source), error_handler)
 
         # THEN
         self.assertRaises(UnknownEscapingLexerException, lexer.get_next_token)
         self.assertEqual(expected, lexer.token, "T_ILLEGAL not detected correctly.")
 
 
+class CountingLexer(Lexer):
+    calls = 0
+
+    def get_next_token(self) -> Token:
+        self.calls += 1
+        return super().get_next_token()
+
+
+class TestTokenBuffer(unittest.TestCase):
+    @parameterized.expand([
+        ("foo() {\n  # comment\n  a = 'text' + 12;\n}\n",),
+        ("",),
+        ("main() { return [1, 2]; }",),
+    ])
+    def test_same_tokens_as_lexer(self, case):
+        # GIVEN
+        lexer = Lexer(StringIO(case))
+        expected = []
+        while (token := lexer.get_next_token()).type != TokenType.T_ETX:
+            expected.append(token)
+        expected.append(token)
+
+        # WHEN
+        result = list(TokenBuffer(Lexer(StringIO(case))))
+
+        # THEN
+        self.assertEqual(expected, result, "Tokens differ from lexer output.")
+
+    def test_tokenize_once(self):
+        # GIVEN
+        source = "foo() {\n  # comment\n  a = 1;\n}\n"
+        lexer = CountingLexer(StringIO(source))
+        tokens = TokenBuffer(lexer)
+
+        # WHEN
+        lines = get_bp_possible_lines(tokens)
+        first = list(tokens)
+        second = list(tokens)
+
+        # THEN
+        self.assertEqual({1, 3}, lines, "Wrong breakpoint lines.")
+        self.assertEqual(first, second, "Tokens differ between reads.")
+        self.assertEqual(len(first), lexer.calls, "Source was lexed more than once.")
+        self.assertEqual(Token(TokenType.T_ETX, "\x03", 5, 1), tokens[len(tokens) + 3], "ETX not repeated.")
+
+    def test_error_is_kept(self):
+        # GIVEN
+        source = "a = 1;\nb = @;"
+        tokens = TokenBuffer(Lexer(StringIO(source), get_error_handler()))
+
+        # THEN
+        self.assertEqual(Token(TokenType.T_IDENTIFIER, "a", 1, 1), tokens[0], "Wrong first token.")
+        self.assertRaises(UnknownTokenLexerException, tokens.fill)
+        self.assertEqual(Token(TokenType.T_IDENTIFIER, "b", 2, 1), tokens[4], "Tokens before error lost.")
+        self.assertRaises(UnknownTokenLexerException, lambda: tokens[6])
+
+
 def suite():
     suite_ = unittest.TestSuite()
     suite_.addTest(unittest.makeSuite(TestLexerSimple, 'test'))
     suite_.addTest(unittest.makeSuite(TestLexerComplexer, 'test'))
     suite_.addTest(unittest.makeSuite(TestLexerErrorHandling, 'test'))
+    suite_.addTest(unittest.makeSuite(TestTokenBuffer, 'test'))
     return suite_
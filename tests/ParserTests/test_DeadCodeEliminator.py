@@ -0,0 +1,235 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import InterpreterException
+from Tutel.core.__main__ import get_arg_parser
+from Tutel.core.ParserModule.DeadCodeEliminator import DeadCodeEliminator
+from Tutel.core.ParserModule.Optimizer import Optimizer
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner, interpreter_mapper
+from Tutel.debugger.TutelDebugger import TutelDebugger
+from tests.InterpreterTests.test_ClosureInterpreter import PARITY_CASES
+from tests.ParserTests.test_Optimizer import OPTIMIZER_CASES
+from tests.TranspilerTests.test_Transpiler import RecordingErrorHandler, parse
+
+DCE_CASES = [
+    ("after_return", "main(){print(1); return; print(2);}"),
+    ("after_returning_if", "main(){foo(1); foo(-1);}foo(x){if(x > 0){return 1;}else{return 2;} print('dead');}"),
+    ("after_returned_call", "main(){print(foo());}foo(){return bar(); print('reached');}bar(){return 1;}"),
+    ("return_flag_observed", "main(){print(foo());}foo(){return bar() + 1;}"
+                             "bar(){if(false){print('no');} print('first'); return 1;}"),
+    ("else_flag_observed", "main(){if(foo()){print(1);}else{print(2);}}"
+                           "foo(){if(true){print('a');} if(false){print('b');} return 0;}"),
+    ("elif_flag_observed", "main(){if(0){print(1);}elif(foo()){print(2);}else{print(3);}}"
+                           "foo(){if(true){print('a');} if(false){print('b');} return 0;}"),
+    ("false_branches", "main(){x = 1; if(false){print(1);} elif(x){print(2);} elif(false){print(3);} else{print(4);}}"),
+    ("true_branches", "main(){if(1){print(1);} elif(true){print(2);} else{print(3);}"
+                      "if(0){print(4);} elif(true){print(5);} elif(2 > 1){print(6);} else{print(7);}}"),
+    ("every_elif_checked", "main(){if(false){print(0);} elif(true){print(1);} elif(true){print(2);}}"),
+    ("inlined_else", "main(){if(null){print(0);} else {print(1); return; print(2);} print(3);}"),
+    ("loops", "main(){while(false){print(1);} for(i in []){print(i);} print(2);}"),
+    ("unreachable_function", "main(){foo();}foo(){print(1);}bar(){print(2);}"),
+    ("called_from_dead_code", "main(){return; foo();}foo(){print(1);}"),
+    ("shadowing_dead_code", "main(){return; foo = 1;}foo(){}"),
+    ("shadowing_function", "main(){}foo(){}bar(foo){}"),
+    ("function_value", "main(){f = foo; f();}foo(){if(false){print(1);} print(2);}"),
+]
+
+
+def run(interpreter_class, case, eliminate):
+    error_handler = RecordingErrorHandler()
+    program = parse(case, error_handler)
+    if eliminate:
+        DeadCodeEliminator().eliminate(Optimizer().optimize(program))
+    output = io.StringIO()
+    error = None
+    with redirect_stdout(output):
+        try:
+            interpreter_class(error_handler).execute(program, "main")
+        except InterpreterException as e:
+            error = (type(e), str(e))
+    return output.getvalue(), error
+
+
+def descriptions(case):
+    report = DeadCodeEliminator().eliminate(parse(case))
+    return [dead_code.description for dead_code in report.removed]
+
+
+class TestDeadCodeEliminator(unittest.TestCase):
+    @parameterized.expand(PARITY_CASES + OPTIMIZER_CASES + DCE_CASES)
+    def test_same_result(self, _, case):
+        # WHEN
+        expected = run(interpreter_mapper["visitor"], case, eliminate=False)
+        result = run(interpreter_mapper["visitor"], case, eliminate=True)
+
+        # THEN
+        self.assertEqual(expected, result, "Program without dead code behaves differently.")
+
+    @parameterized.expand([(engine, *case) for engine in ["closure", "vm", "python"] for case in DCE_CASES])
+    def test_same_result_engines(self, engine, _, case):
+        # WHEN
+        expected = run(interpreter_mapper[engine], case, eliminate=False)
+        result = run(interpreter_mapper[engine], case, eliminate=True)
+
+        # THEN
+        self.assertEqual(expected, result, "Program without dead code behaves differently.")
+
+    @parameterized.expand([
+        ("after_return", "main(){return; a = 1; b = 2;}", ["statement after return"] * 2),
+        ("after_returning_if", "main(){if(true){return;} a = 1;}", ["statement after return"]),
+        ("false_if", "main(){if(false){a = 1;}}", ["if statement with false condition"]),
+        ("false_if_else", "main(){if(0){a = 1;}else{a = 2;}}", ["if branch with false condition"]),
+        ("false_elif", "main(){if(a){b = 1;}elif(''){b = 2;}}", ["elif branch with false condition"]),
+        ("true_if", "main(){if(true){b = 1;}elif(a){b = 2;}else{b = 3;}}",
+         ["elif branch after true condition", "else branch after true condition"]),
+        ("true_elif", "main(){if(a){b = 1;}elif(1){b = 2;}else{b = 3;}}", ["else branch after true elif condition"]),
+        ("false_while", "main(){while(null){a = 1;}}", ["while loop with false condition"]),
+        ("empty_for", "main(){for(i in []){a = 1;}}", ["for loop over empty list"]),
+        ("unreachable_function", "main(){}foo(){}", ["unreachable function"]),
+        ("builtin_name", "main(){print(1);}print(){}", ["unreachable function"]),
+    ])
+    def test_removed(self, _, case, expected):
+        # WHEN
+        result = descriptions(case)
+
+        # THEN
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([
+        ("returned_call", "main(){x = foo();}foo(){return bar(); a = 1;}bar(){}"),
+        ("returning_if_call", "main(){x = foo();}foo(){if(bar()){return;}else{return;} a = 1;}bar(){}"),
+        ("condition_call", "main(){if(foo()){b = 1;}}foo(){if(false){a = 1;}}"),
+        ("returned_value_call", "main(){return foo();}foo(){while(false){a = 1;}}"),
+        ("called_by_observed", "main(){return foo();}foo(){bar();}bar(){for(i in []){a = 1;}}"),
+        ("dynamic_call", "main(){f = foo; if(f()){b = 1;}}foo(){}bar(){if(false){a = 1;}}"),
+        ("shadowing_assignment", "main(){return; foo = 1;}foo(){}"),
+        ("shadowing_iterator", "main(){while(false){for(foo in []){a = 1;}}}foo(){}"),
+        ("shadowing_param", "main(){}foo(){}bar(foo){}"),
+        ("condition_name", "main(){if(a){b = 1;}}"),
+        ("comparison", "main(){if(1 > 2){b = 1;}}"),
+    ])
+    def test_statements_kept(self, _, case):
+        # GIVEN
+        program = parse(case)
+        lengths = {name: len(function.statements) for name, function in program.functions.items()}
+
+        # WHEN
+        DeadCodeEliminator().eliminate(program)
+
+        # THEN
+        self.assertEqual({name: lengths[name] for name in program.functions},
+                         {name: len(function.statements) for name, function in program.functions.items()})
+
+    def test_reachable_functions(self):
+        # GIVEN
+        program = parse("main(){foo(1);}foo(x){return bar(x);}bar(x){t = Turtle(); t.baz();}baz(){}unused(){foo();}")
+
+        # WHEN
+        DeadCodeEliminator().eliminate(program)
+
+        # THEN
+        self.assertEqual(["main", "foo", "bar"], list(program.functions))
+
+    def test_no_main(self):
+        # GIVEN
+        program = parse("foo(){}bar(){}")
+
+        # WHEN
+        DeadCodeEliminator().eliminate(program)
+
+        # THEN
+        self.assertEqual(["foo", "bar"], list(program.functions))
+
+    def test_promoted_elif(self):
+        # GIVEN
+        program = parse("main(){\nif(false){\na = 1;\n}\nelif(b){\na = 2;\n}\n}")
+
+        # WHEN
+        DeadCodeEliminator().eliminate(program)
+
+        # THEN
+        if_stmt = program.functions["main"].statements[0]
+        self.assertEqual(("b", [], 5), (if_stmt.condition.value, if_stmt.elif_stmts, if_stmt.lineno))
+
+    def test_dead_lines(self):
+        # GIVEN
+        program = parse("main(){\nprint(1);\nreturn; a = 1;\nif(false){\nb = 2;\n}\n}\nfoo(){\nc = 3;\n}")
+
+        # WHEN
+        report = DeadCodeEliminator().eliminate(program)
+
+        # THEN
+        self.assertEqual({4, 5, 8, 9}, report.dead_lines)
+
+    def test_report(self):
+        # GIVEN
+        program = parse("main(){\nreturn;\nif(false){\na = 1;\n}\n}\nfoo(){}")
+
+        # WHEN
+        report = DeadCodeEliminator().eliminate(program)
+
+        # THEN
+        self.assertEqual("Dead code removed:\n  main, lines 3-4: statement after return\n  foo, line 7: unreachable function",
+                         str(report))
+        self.assertEqual("No dead code found", str(DeadCodeEliminator().eliminate(parse("main(){}"))))
+
+
+class TestReportDceOption(unittest.TestCase):
+    def test_runner(self):
+        # GIVEN
+        runner = TutelRunner("main(){return; a = 1;}", TutelOptions(optimize=True, report_dce=True))
+        stderr = io.StringIO()
+
+        # WHEN
+        with redirect_stderr(stderr):
+            runner._prepare_to_run()
+
+        # THEN
+        self.assertEqual([], list(runner.program.functions["main"].statements[1:]))
+        self.assertEqual("Dead code removed:\n  main, line 1: statement after return\n", stderr.getvalue())
+
+    def test_not_optimized(self):
+        # GIVEN
+        runner = TutelRunner("main(){return; a = 1;}", TutelOptions())
+
+        # WHEN
+        runner._parse()
+
+        # THEN
+        self.assertEqual(2, len(runner.program.functions["main"].statements))
+        self.assertIsNone(runner.dead_code)
+
+    def test_command_line(self):
+        # WHEN
+        args = get_arg_parser().parse_args(["-c", "main(){}", "--report-dce"])
+
+        # THEN
+        self.assertTrue(args.report_dce)
+        self.assertFalse(get_arg_parser().parse_args(["-c", "main(){}"]).report_dce)
+
+    def test_breakpoint_lines(self):
+        # GIVEN
+        with tempfile.NamedTemporaryFile("w", suffix=".tut", delete=False) as file:
+            file.write("main(){\nprint(1);\nreturn;\nprint(2);\n}\nfoo(){\nprint(3);\n}\n")
+        self.addCleanup(os.remove, file.name)
+
+        # WHEN
+        default = TutelDebugger(file.name).bp_possible_lines[file.name]
+        optimized = TutelDebugger(file.name, TutelOptions(optimize=True)).bp_possible_lines[file.name]
+
+        # THEN
+        self.assertEqual({1, 2, 3, 4, 6, 7}, default)
+        self.assertEqual({1, 2, 3}, optimized)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestDeadCodeEliminator, 'test'))
+    suite_.addTest(unittest.makeSuite(TestReportDceOption, 'test'))
+    return suite_
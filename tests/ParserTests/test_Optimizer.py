@@ -0,0 +1,138 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import InterpreterException
+from Tutel.core.__main__ import get_arg_parser
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.ParserModule import Classes
+from Tutel.core.ParserModule.Optimizer import Optimizer
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+from tests.InterpreterTests.test_ClosureInterpreter import PARITY_CASES
+from tests.TranspilerTests.test_Transpiler import RecordingErrorHandler, parse
+
+OPTIMIZER_CASES = [
+    ("folding", "main(){a = 360 / 6; b = 'ab' * 2 + 'c'; c = -(3 % 2 - 1); print(a, b, c, 7 // 2 == 3);}"),
+    ("comparison_argument", "main(){print(1 < 2);}"),
+    ("comparison_param", "main(){foo(1 < 2);}foo(x){y = x + 1;}"),
+    ("comparison_operand", "main(){a = (1 < 2) + 1;}"),
+    ("not_operand", "main(){a = (not 0) + 1;}"),
+    ("failing", "main(){a = 1 + 'a';}"),
+    ("zero_division", "main(){if(false){a = 1 / 0;}print(1);}"),
+    ("propagation", "main(){n = 10; half = n / 2; for(i in range(3)){print(i * half + n);}}"),
+    ("aliased", "main(){a = 1; b = a; b += 1; print(a);}"),
+    ("passed", "main(){a = 1; foo(a); print(a + 0);}foo(x){x += 1;}"),
+    ("in_list", "main(){a = 1; l = [a]; for(i in l){i += 1;} print(a + 0);}"),
+    ("short_circuit_shared", "main(){a = 1; b = a or 2; b += 1; print(a + 0);}"),
+    ("reassigned", "main(){a = 1; for(i in range(2)){print(a + 1); a = 5;}}"),
+    ("read_before", "main(){for(i in range(2)){if(i == 1){print(a + 1);} a = 5;}}"),
+    ("conditional", "main(){if(false){a = 1;} print(a + 1);}"),
+    ("condition_name", "main(){a = 0; if(a){print(1);}else{print(2);}}"),
+    ("returned_name", "main(){x = foo(); print(x);}foo(){a = 1; return a;}"),
+    ("short_circuit", "main(){a = 0; print(a and foo(), 1 or foo(), true and 2 > 1);}foo(){print('called');}"),
+    ("builtin_name", "main(){len = 1; print(len([1, 2]));}"),
+    ("modified", "main(){a = 1; a += 1; print(a + 0);}"),
+]
+
+
+def run(case, optimize):
+    error_handler = RecordingErrorHandler()
+    program = parse(case, error_handler)
+    if optimize:
+        Optimizer().optimize(program)
+    output = io.StringIO()
+    error = None
+    with redirect_stdout(output):
+        try:
+            Interpreter(error_handler).execute(program)
+        except InterpreterException as e:
+            error = (type(e), str(e))
+    return output.getvalue(), error
+
+
+class TestOptimizer(unittest.TestCase):
+    @parameterized.expand(PARITY_CASES + OPTIMIZER_CASES)
+    def test_same_result(self, _, case):
+        # WHEN
+        expected = run(case, optimize=False)
+        result = run(case, optimize=True)
+
+        # THEN
+        self.assertEqual(expected, result, "Optimized program behaves differently.")
+
+    @parameterized.expand([
+        ("arithmetic", "main(){a = 2 * 3 + 1;}", Classes.Integer(7, 1)),
+        ("division", "main(){a = 360 / 6;}", Classes.Integer(60.0, 1)),
+        ("string", "main(){a = 'a' + 'b';}", Classes.String("ab", 1)),
+        ("comparison", "main(){a = 2 > 1;}", Classes.Boolean(True, 1)),
+        ("negation", "main(){a = not 0;}", Classes.Boolean(True, 1)),
+        ("short_circuit", "main(){a = 0 or 1 + 1;}", Classes.Integer(2, 1)),
+        ("propagated", "main(){a = 4;\nb = a * a;}", Classes.Integer(16, 2)),
+    ])
+    def test_folded(self, _, case, expected):
+        # WHEN
+        program = Optimizer().optimize(parse(case))
+
+        # THEN
+        folded = program.functions["main"].statements[-1].right_expr
+        self.assertEqual((type(expected), expected.value, expected.lineno),
+                         (type(folded), folded.value, folded.lineno))
+
+    @parameterized.expand([
+        ("variable", "main(a){b = a + 1;}"),
+        ("failing", "main(){b = 1 / 0;}"),
+        ("too_long", "main(){b = 'a' * 100000;}"),
+        ("modified", "main(){a = 1; a += 1; b = a + 1;}"),
+        ("assigned_twice", "main(){a = 1; a = 2; b = a + 1;}"),
+        ("nested_assignment", "main(){if(true){a = 1;} b = a + 1;}"),
+    ])
+    def test_not_folded(self, _, case):
+        # WHEN
+        program = Optimizer().optimize(parse(case))
+
+        # THEN
+        self.assertIsInstance(program.functions["main"].statements[-1].right_expr, Classes.TwoSidedExpression)
+
+    def test_lines_preserved(self):
+        # GIVEN
+        program = parse("main(){\na = 1;\nwhile(a < 2 * 2){\na += 10 - 9;\n}\n}")
+        lines = [statement.lineno for statement in program.functions["main"].statements]
+
+        # WHEN
+        Optimizer().optimize(program)
+
+        # THEN
+        statements = program.functions["main"].statements
+        self.assertEqual(lines, [statement.lineno for statement in statements])
+        self.assertEqual(4, statements[1].statements[0].right_expr.lineno)
+
+
+class TestOptimizeOption(unittest.TestCase):
+    def test_runner(self):
+        # GIVEN
+        runner = TutelRunner("main(){a = 1 + 2;}", TutelOptions(optimize=True))
+
+        # WHEN
+        runner._parse()
+
+        # THEN
+        self.assertIsInstance(runner.program.functions["main"].statements[0].right_expr, Classes.Integer)
+
+    def test_command_line(self):
+        # WHEN
+        default = get_arg_parser().parse_args(["-c", "main(){}"])
+        optimized = get_arg_parser().parse_args(["-c", "main(){}", "-O"])
+
+        # THEN
+        self.assertFalse(default.optimize)
+        self.assertTrue(optimized.optimize)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestOptimizer, 'test'))
+    suite_.addTest(unittest.makeSuite(TestOptimizeOption, 'test'))
+    return suite_
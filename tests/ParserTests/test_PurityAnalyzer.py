@@ -0,0 +1,58 @@
+import unittest
+
+from parameterized import parameterized
+
+from Tutel.core.ParserModule.PurityAnalyzer import PurityAnalyzer
+from tests.TranspilerTests.test_Transpiler import parse
+
+
+class TestPurityAnalyzer(unittest.TestCase):
+    @parameterized.expand([
+        ("arithmetic", "foo(a, b){return a * b + 1;}"),
+        ("locals", "foo(a){b = a + 1; b += 2; return b;}"),
+        ("loops", "foo(n){s = 0; for(i in range(n)){s += i;} while(s > 100){s -= 100;} return s;}"),
+        ("pure_builtins", "foo(a){return max(abs(a), len(str(a)));}"),
+        ("created_list", "foo(a){l = [a, 1]; l += [2]; return len(l);}"),
+        ("attribute", "foo(c){return c.r;}"),
+        ("pure_call", "foo(a){return bar(a) + 1;}bar(a){return a * 2;}"),
+        ("recursion", "foo(n){if(n < 2){return 1;} a = foo(n - 1); return a * n;}"),
+        ("copied_argument", "foo(a){b = a * 1; b += 1; return b;}"),
+    ])
+    def test_pure(self, _, case):
+        # WHEN
+        result = PurityAnalyzer().analyse(parse(case))
+
+        # THEN
+        self.assertIn("foo", result)
+
+    @parameterized.expand([
+        ("print", "foo(a){print(a);}"),
+        ("input", "foo(){return input();}"),
+        ("sleep", "foo(){sleep(1);}"),
+        ("turtle", "foo(){t = Turtle();}"),
+        ("method", "foo(t){t.forward(10);}"),
+        ("modified_argument", "foo(a){a += 1;}"),
+        ("modified_alias", "foo(a){b = a; b += 1;}"),
+        ("modified_short_circuit_alias", "foo(a){b = a or 1; b += 1;}"),
+        ("modified_iterator", "foo(l){for(i in l){i += 1;}}"),
+        ("modified_element", "foo(l){l[0] = 1;}"),
+        ("modified_attribute", "foo(c){c.r = 1;}"),
+        ("modified_returned_argument", "foo(a){b = bar(a); b += 1;}bar(a){return a or 0;}"),
+        ("impure_call", "foo(a){return bar(a);}bar(a){print(a); return a;}"),
+        ("transitively_impure_call", "foo(){return bar();}bar(){return baz();}baz(){print(1);}"),
+        ("impure_recursion", "foo(n){if(n > 0){foo(n - 1);} print(n);}"),
+        ("dynamic_call", "foo(f){return f();}"),
+        ("unknown_function", "foo(){return bar();}"),
+    ])
+    def test_impure(self, _, case):
+        # WHEN
+        result = PurityAnalyzer().analyse(parse(case))
+
+        # THEN
+        self.assertNotIn("foo", result)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestPurityAnalyzer, 'test'))
+    return suite_
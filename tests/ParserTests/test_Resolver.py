@@ -0,0 +1,42 @@
+import unittest
+
+from parameterized import parameterized
+
+from Tutel.core.ParserModule.Resolver import Resolver
+from tests.TranspilerTests.test_Transpiler import parse
+
+
+class TestResolver(unittest.TestCase):
+    @parameterized.expand([
+        ("no_locals", "main(){print(1);}", {}),
+        ("params_first", "main(a, b){c = 1; a = 2;}", {"a": 0, "b": 1, "c": 2}),
+        ("modifying_assignment", "main(){a += 1;}", {"a": 0}),
+        ("read_only", "main(){print(a);}", {}),
+        ("nested_blocks",
+         "main(){for(i in x){while(true){b = 1;}} if(x){c = 1;}elif(y){d = 1;}else{e = 1;} f = 1;}",
+         {"i": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5}),
+        ("not_identifier", "main(){a.b = 1; a[0] = 2;}", {}),
+    ])
+    def test_slots(self, _, case, expected):
+        # WHEN
+        program = Resolver().resolve(parse(case))
+
+        # THEN
+        self.assertEqual(expected, program.functions["main"].slots)
+
+    def test_resolved_once(self):
+        # GIVEN
+        program = Resolver().resolve(parse("main(){a = 1;}"))
+        slots = program.functions["main"].slots
+
+        # WHEN
+        Resolver().resolve(program)
+
+        # THEN
+        self.assertIs(slots, program.functions["main"].slots, "Function resolved again.")
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestResolver, 'test'))
+    return suite_
@@ -0,0 +1,134 @@
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from Tutel.core.Runner.ProgramCache import ProgramCache, CACHE_SUFFIX
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+
+CODE = """
+main() {
+    a = [1, 2, 3];
+    for (i in a) {
+        if (i > 1) { return i; } elif (i == 1) { a = 0; } else { a = "text"; }
+    }
+}
+"""
+
+
+class TestProgramCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.key_dir = tempfile.TemporaryDirectory()
+        self.key_path = mock.patch("Tutel.core.Runner.ProgramCache.KEY_PATH", os.path.join(self.key_dir.name, "key"))
+        self.key_path.start()
+        self.options = TutelOptions(cache_dir=self.cache_dir.name)
+
+    def tearDown(self):
+        self.key_path.stop()
+        self.key_dir.cleanup()
+        self.cache_dir.cleanup()
+
+    def test_program_loaded_from_cache(self):
+        # GIVEN
+        expected = TutelRunner(CODE)
+        expected._prepare_to_run(debug=True)
+        TutelRunner(CODE, self.options)._prepare_to_run(debug=True)
+        runner = TutelRunner(CODE, self.options)
+
+        # WHEN
+        with mock.patch.object(runner.parser, "parse") as parse:
+            runner._prepare_to_run(debug=True)
+
+        # THEN
+        parse.assert_not_called()
+        self.assertEqual(expected.program, runner.program, "Cached program differs from parsed one.")
+
+    def test_changed_code_invalidates_entry(self):
+        # GIVEN
+        cache = ProgramCache(self.cache_dir.name)
+        TutelRunner(CODE, self.options)._prepare_to_run(debug=True)
+
+        # THEN
+        self.assertIsNotNone(cache.load(CODE), "Program not cached.")
+        self.assertIsNone(cache.load(CODE + " "), "Cache entry used for different code.")
+
+    def test_corrupted_entry_ignored(self):
+        # GIVEN
+        cache = ProgramCache(self.cache_dir.name)
+        os.makedirs(self.cache_dir.name, exist_ok=True)
+        with open(cache.path(CODE), "wb") as file:
+            file.write(b"garbage")
+
+        # THEN
+        self.assertIsNone(cache.load(CODE), "Corrupted entry loaded.")
+        self.assertFalse(os.path.exists(cache.path(CODE)), "Corrupted entry not removed.")
+
+    def test_unsigned_entry_not_unpickled(self):
+        # GIVEN
+        cache = ProgramCache(self.cache_dir.name)
+        TutelRunner(CODE, self.options)._prepare_to_run(debug=True)
+        with open(cache.path(CODE), "rb") as file:
+            entry = file.read()
+        header_size = entry.index(b"\n") + 1
+        with open(cache.path(CODE), "wb") as file:
+            file.write(entry[:header_size] + bytes(32) + entry[header_size + 32:])
+
+        # WHEN
+        with mock.patch("pickle.loads") as loads:
+            program = cache.load(CODE)
+
+        # THEN
+        self.assertIsNone(program, "Entry with wrong signature loaded.")
+        loads.assert_not_called()
+
+    def test_entry_of_other_user_not_loaded(self):
+        # GIVEN
+        TutelRunner(CODE, self.options)._prepare_to_run(debug=True)
+        cache = ProgramCache(self.cache_dir.name, key_path=os.path.join(self.key_dir.name, "other_key"))
+
+        # THEN
+        self.assertIsNone(cache.load(CODE), "Entry signed with other key loaded.")
+
+    def test_world_writable_directory_refused(self):
+        # GIVEN
+        os.chmod(self.cache_dir.name, os.stat(self.cache_dir.name).st_mode | stat.S_IWOTH)
+        cache = ProgramCache(self.cache_dir.name)
+
+        # WHEN
+        cache.store(CODE, TutelRunner(CODE).parser.parse(TutelRunner(CODE).tokens))
+
+        # THEN
+        self.assertFalse(cache.trusted())
+        self.assertEqual([], os.listdir(self.cache_dir.name))
+        self.assertIsNone(cache.load(CODE))
+
+    def test_lru_eviction(self):
+        # GIVEN
+        codes = [f"main() {{ a = {i}; }}" for i in range(3)]
+        cache = ProgramCache(self.cache_dir.name)
+        for i, code in enumerate(codes):
+            runner = TutelRunner(code)
+            runner._prepare_to_run(debug=True)
+            cache.store(code, runner.program)
+            os.utime(cache.path(code), (time.time() - 100 + i, time.time() - 100 + i))
+        entry_size = os.path.getsize(cache.path(codes[0]))
+
+        # WHEN
+        cache.load(codes[0])
+        cache.max_size = 2 * entry_size
+        cache.evict()
+
+        # THEN
+        self.assertEqual(2, len([f for f in os.listdir(self.cache_dir.name) if f.endswith(CACHE_SUFFIX)]))
+        self.assertIsNotNone(cache.load(codes[0]), "Recently used entry evicted.")
+        self.assertIsNone(cache.load(codes[1]), "Least recently used entry kept.")
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestProgramCache, 'test'))
+    return suite_
@@ -0,0 +1,121 @@
+import ast
+import io
+import logging
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorHandler import ErrorHandler, get_stack_trace
+from Tutel.common.ErrorType import InterpreterException
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.TranspilerModule.TranspiledInterpreter import TranspiledInterpreter
+from Tutel.core.TranspilerModule.Transpiler import Transpiler, BINARY
+from tests.InterpreterTests import test_Interpreter
+from tests.InterpreterTests.test_ClosureInterpreter import PARITY_CASES
+
+
+class RecordingErrorHandler(ErrorHandler):
+    def __init__(self):
+        super().__init__(module="test_transpiler", level=logging.CRITICAL)
+        self.stack_trace = None
+
+    def handle_error(self, error, call_stack=None) -> None:
+        self.stack_trace = get_stack_trace(call_stack)
+        super().handle_error(error, call_stack)
+
+
+def parse(case, error_handler=None):
+    error_handler = error_handler or RecordingErrorHandler()
+    return Parser(error_handler).parse(Lexer(StringIO(case), error_handler))
+
+
+def run(interpreter_class, case):
+    error_handler = RecordingErrorHandler()
+    program = parse(case, error_handler)
+    output = io.StringIO()
+    error = None
+    with redirect_stdout(output):
+        try:
+            interpreter_class(error_handler).execute(program)
+        except InterpreterException as e:
+            error = (type(e), str(e))
+    return output.getvalue(), error, error_handler.stack_trace
+
+
+class TestTranspiledInterpreter(test_Interpreter.TestInterpreter):
+    interpreter_class = TranspiledInterpreter
+
+
+class TestTranspiledInterpreterParity(unittest.TestCase):
+    @parameterized.expand(PARITY_CASES + [
+        ("nested_frames", "main(){\na = 1;\nfoo(a);\n}\nfoo(x){\ny = x;\nz = [1,\n2][5];\n}"),
+        ("error_in_loop_body", "main(){\nfor(i in [1, 2]){\nfoo(i);\n}\n}\nfoo(x){\nif(x > 1){\nx.bar;\n}\n}"),
+        ("dynamic_call", "main(){foo(boo);}foo(f){print(f(2));}boo(x){return x + 1, 2;}"),
+        ("dynamic_call_args_count", "main(){foo(boo);}foo(f){f(1, 2);}boo(x){}"),
+    ])
+    def test_same_result(self, _, case):
+        # WHEN
+        expected = run(Interpreter, case)
+        result = run(TranspiledInterpreter, case)
+
+        # THEN
+        if expected[1] is not None and expected[1][0].__name__ == "RecursionException":
+            self.assertEqual(expected[1], result[1], "Different exception raised.")
+            return
+        self.assertEqual(expected, result, "Execution differs from visitor interpreter.")
+
+    def test_program_transpiled_once(self):
+        # GIVEN
+        program = parse("main(){a = 1;}")
+        interpreter = TranspiledInterpreter(RecordingErrorHandler())
+
+        # WHEN
+        interpreter.execute(program)
+        transpiled = interpreter.transpiled_program
+        interpreter.execute(program)
+
+        # THEN
+        self.assertIs(transpiled, interpreter.transpiled_program, "Program transpiled again.")
+
+
+class TestTranspiler(unittest.TestCase):
+    def test_one_python_function_per_function(self):
+        # WHEN
+        transpiled = Transpiler().transpile(parse("main(){foo(1);}foo(a){}boo(){}"))
+
+        # THEN
+        functions = [node.name for node in ast.parse(transpiled.source).body if isinstance(node, ast.FunctionDef)]
+        self.assertEqual(["f_main", "f_foo", "f_boo"], functions)
+
+    def test_line_map(self):
+        # WHEN
+        transpiled = Transpiler().transpile(parse("main(){\na = 1;\n\nb = a\n+\n2;\nc = b * 3;\n}"))
+
+        # THEN
+        source_lines = transpiled.source.splitlines()
+        binary_lines = {source_lines[line - 1].strip(): info.lineno
+                        for line, info in transpiled.line_map.items() if info.kind == BINARY}
+        self.assertEqual({"_t1 = v_a + 2": 4, "_t2 = v_b * 3": 7}, binary_lines)
+
+    def test_module_source(self):
+        # WHEN
+        transpiled = Transpiler().transpile(parse("main(){\na = 1;\n}"))
+        module = transpiled.module_source()
+
+        # THEN
+        line_map = ast.literal_eval(module[module.index("LINE_MAP = ") + len("LINE_MAP = "):])
+        self.assertEqual({line: info.lineno for line, info in transpiled.line_map.items()}, line_map)
+        self.assertTrue(module.startswith(transpiled.source))
+        compile(module, "<test>", "exec")
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestTranspiledInterpreter, 'test'))
+    suite_.addTest(unittest.makeSuite(TestTranspiledInterpreterParity, 'test'))
+    suite_.addTest(unittest.makeSuite(TestTranspiler, 'test'))
+    return suite_
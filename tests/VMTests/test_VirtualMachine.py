@@ -0,0 +1,192 @@
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from parameterized import parameterized
+
+from Tutel.common.ErrorType import RecursionException
+from Tutel.core.InterpreterModule.Interpreter import Interpreter
+from Tutel.core.LexerModule.Lexer import Lexer
+from Tutel.core.ParserModule.Parser import Parser
+from Tutel.core.Runner.TutelOptions import TutelOptions
+from Tutel.core.Runner.TutelRunner import TutelRunner
+from Tutel.core.VM.Compiler import Compiler
+from Tutel.core.VM.Disassembler import disassemble
+from Tutel.core.VM.OpCodes import OpCode
+from Tutel.core.VM.VirtualMachine import VirtualMachine
+from tests.InterpreterTests import test_Interpreter
+from tests.InterpreterTests.test_ClosureInterpreter import PARITY_CASES, trace, get_error_handler
+
+
+DEPTH_CASE = "main(){print(depth(%d));}depth(n){if(n == 0){return 0;} r = depth(n - 1); return r + 1;}"
+
+
+def parse_case(case):
+    error_handler = get_error_handler()
+    return Parser(error_handler).parse(Lexer(StringIO(case), error_handler))
+
+
+def compile_case(case):
+    error_handler = get_error_handler()
+    return Compiler().compile(Parser(error_handler).parse(Lexer(StringIO(case), error_handler)))
+
+
+class TestVirtualMachine(test_Interpreter.TestInterpreter):
+    interpreter_class = VirtualMachine
+
+
+class TestVirtualMachineParity(unittest.TestCase):
+    @parameterized.expand(PARITY_CASES)
+    def test_same_trace(self, _, case):
+        # WHEN
+        expected = trace(Interpreter, case)
+        result = trace(VirtualMachine, case)
+
+        # THEN
+        if expected[2] is not None and expected[2][0].__name__ == "RecursionException":
+            self.assertEqual(expected[2], result[2], "Different exception raised.")
+            return
+        self.assertEqual(expected, result, "Execution differs from visitor interpreter.")
+
+    def test_program_compiled_once(self):
+        # GIVEN
+        error_handler = get_error_handler()
+        program = Parser(error_handler).parse(Lexer(StringIO("main(){a = 1;}"), error_handler))
+        interpreter = VirtualMachine(error_handler)
+
+        # WHEN
+        interpreter.execute(program)
+        compiled = interpreter.compiled_program
+        interpreter.execute(program)
+
+        # THEN
+        self.assertIs(compiled, interpreter.compiled_program, "Program compiled again.")
+
+
+class TestVirtualMachineCallStack(unittest.TestCase):
+    def test_recursion_deeper_than_python_limit(self):
+        # GIVEN
+        depth = sys.getrecursionlimit() * 2
+        output = io.StringIO()
+
+        # WHEN
+        with redirect_stdout(output):
+            VirtualMachine(get_error_handler()).execute(parse_case(DEPTH_CASE % depth))
+
+        # THEN
+        self.assertEqual(f"{depth}\n", output.getvalue())
+
+    def test_max_call_depth(self):
+        # GIVEN
+        interpreter = VirtualMachine(get_error_handler(), max_call_depth=50)
+
+        # WHEN
+        with self.assertRaises(RecursionException):
+            interpreter.execute(parse_case(DEPTH_CASE % 50))
+
+        # THEN
+        self.assertEqual(50, len(interpreter.call_stack))
+
+    def test_max_call_depth_option(self):
+        # WHEN
+        runner = TutelRunner("main(){}", TutelOptions(engine="vm", max_call_depth=10))
+
+        # THEN
+        self.assertEqual(10, runner.interpreter.max_call_depth)
+
+    def test_pause_and_resume(self):
+        # GIVEN
+        program = parse_case("main(){\nfoo(1);\nprint(2);\n}\nfoo(a){\nprint(a);\n}")
+        interpreter = VirtualMachine(get_error_handler())
+        pauses = {6}
+
+        def pause_once():
+            if interpreter.lineno in pauses:
+                pauses.remove(interpreter.lineno)
+                interpreter.pause()
+
+        interpreter.debug_callback = pause_once
+        output = io.StringIO()
+
+        # WHEN
+        with redirect_stdout(output):
+            interpreter.execute(program)
+            paused_output = output.getvalue()
+            paused_stack = [(frame.name, frame.lineno) for frame in interpreter.call_stack]
+            interpreter.resume()
+
+        # THEN
+        self.assertEqual("", paused_output, "Program not paused.")
+        self.assertEqual([("main", 2), ("foo", 6)], paused_stack)
+        self.assertFalse(interpreter.paused)
+        self.assertEqual("1\n2\n", output.getvalue())
+
+
+class TestCompiler(unittest.TestCase):
+    def test_slot_table(self):
+        # WHEN
+        code = compile_case("main(){foo(1, 2);}foo(a, b){c = a + b; a += c;}").functions["foo"]
+
+        # THEN
+        self.assertEqual(["a", "b", "c"], code.varnames)
+        self.assertEqual(code.varnames.index("c"), code.args[list(code.ops).index(OpCode.STORE_LOCAL)])
+
+    def test_constants_deduplicated(self):
+        # WHEN
+        code = compile_case("main(){a = 1; b = 1; c = true; d = 'x'; e = 'x';}").functions["main"]
+
+        # THEN
+        self.assertEqual([1, True, "x"], code.constants)
+
+    def test_line_table(self):
+        # WHEN
+        code = compile_case("main(){\na = 1;\n\nb = a;\n}").functions["main"]
+
+        # THEN
+        traced_lines = [line for op, line in zip(code.ops, code.lines) if op == OpCode.TRACE]
+        self.assertEqual([1, 1, 2, 4], traced_lines)
+        self.assertEqual(len(code.ops), len(code.lines))
+        self.assertEqual(len(code.ops), len(code.args))
+
+    def test_jumps_patched(self):
+        # WHEN
+        code = compile_case("main(){while(true){if(false){}}}").functions["main"]
+
+        # THEN
+        for op, arg in zip(code.ops, code.args):
+            if op in (OpCode.JUMP, OpCode.POP_JUMP_IF_FALSE, OpCode.JUMP_IF_NOT_DO_ELSE):
+                self.assertTrue(0 < arg < len(code), f"Jump {OpCode(op).name} not patched.")
+
+
+class TestDisassembler(unittest.TestCase):
+    def test_disassemble(self):
+        # WHEN
+        result = disassemble(compile_case("main(){\nprint(1 + 2);\n}"))
+
+        # THEN
+        lines = result.splitlines()
+        self.assertEqual("Disassembly of main(), line 1:", lines[0])
+        self.assertEqual("END", lines[-1].split()[-1])
+        self.assertIn("(print)", result)
+        self.assertIn("(+)", result)
+        self.assertTrue(any(line.lstrip().startswith("2 ") for line in lines[1:]), "Line table not shown.")
+
+    def test_every_function_disassembled(self):
+        # WHEN
+        result = disassemble(compile_case("main(){foo(1);}foo(a){}"))
+
+        # THEN
+        self.assertIn("Disassembly of main(), line 1:", result)
+        self.assertIn("Disassembly of foo(a), line 1:", result)
+
+
+def suite():
+    suite_ = unittest.TestSuite()
+    suite_.addTest(unittest.makeSuite(TestVirtualMachine, 'test'))
+    suite_.addTest(unittest.makeSuite(TestVirtualMachineParity, 'test'))
+    suite_.addTest(unittest.makeSuite(TestVirtualMachineCallStack, 'test'))
+    suite_.addTest(unittest.makeSuite(TestCompiler, 'test'))
+    suite_.addTest(unittest.makeSuite(TestDisassembler, 'test'))
+    return suite_
@@ -5,16 +5,42 @@ import unittest
 from time import sleep
 
 from DebuggerTests import test_Debugger
-from tests.InterpreterTests import test_Interpreter
-from tests.LexerTests import test_Lexer
-from tests.ParserTests import test_Parser
+from tests.InterpreterTests import test_Interpreter, test_ClosureInterpreter, test_ReleaseInterpreter, \
+    test_StackFrame, test_Linker, test_Memoizer, test_AttributeCache, test_Builtin, \
+    test_Turtle
+from tests.GuiTests import test_CommandSink, test_GuiRaster, test_GuiSvg, test_GuiCoalescer
+from tests.LexerTests import test_Lexer, test_FastLexer
+from tests.ParserTests import test_Parser, test_Resolver, test_Optimizer, test_DeadCodeEliminator, test_PurityAnalyzer
+from tests.RunnerTests import test_ProgramCache
+from tests.TranspilerTests import test_Transpiler
+from tests.VMTests import test_VirtualMachine
 
 
 def suite():
     suite_ = unittest.TestSuite()
     suite_.addTest(test_Parser.suite())
+    suite_.addTest(test_Resolver.suite())
+    suite_.addTest(test_Optimizer.suite())
+    suite_.addTest(test_DeadCodeEliminator.suite())
+    suite_.addTest(test_PurityAnalyzer.suite())
     suite_.addTest(test_Lexer.suite())
+    suite_.addTest(test_FastLexer.suite())
     suite_.addTest(test_Interpreter.suite())
+    suite_.addTest(test_StackFrame.suite())
+    suite_.addTest(test_Linker.suite())
+    suite_.addTest(test_Memoizer.suite())
+    suite_.addTest(test_AttributeCache.suite())
+    suite_.addTest(test_Builtin.suite())
+    suite_.addTest(test_Turtle.suite())
+    suite_.addTest(test_ClosureInterpreter.suite())
+    suite_.addTest(test_ReleaseInterpreter.suite())
+    suite_.addTest(test_ProgramCache.suite())
+    suite_.addTest(test_VirtualMachine.suite())
+    suite_.addTest(test_Transpiler.suite())
+    suite_.addTest(test_CommandSink.suite())
+    suite_.addTest(test_GuiRaster.suite())
+    suite_.addTest(test_GuiSvg.suite())
+    suite_.addTest(test_GuiCoalescer.suite())
     suite_.addTest(test_Debugger.suite())
     return suite_
 